@@ -34,8 +34,9 @@ from .core.db.fields import (
     UUIDField,
 )
 from .core.db.models import Model, ReflectModel
+from .core.db.models.loaders import DataLoader, IdentityMap, load_related, strict_loading
 from .core.db.models.managers import Manager
-from .core.db.querysets import QuerySet, and_, not_, or_
+from .core.db.querysets import Avg, Count, F, Max, Min, Page, QuerySet, Sum, and_, not_, or_
 from .core.db.querysets.prefetch import Prefetch
 from .core.extras import SaffierExtra
 from .core.signals import Signal
@@ -46,19 +47,24 @@ __all__ = [
     "and_",
     "not_",
     "or_",
+    "Avg",
     "BigIntegerField",
     "BooleanField",
     "CASCADE",
     "CharField",
+    "Count",
     "ChoiceField",
     "Database",
+    "DataLoader",
     "DateField",
     "DateTimeField",
     "DecimalField",
     "ObjectNotFound",
     "EmailField",
+    "F",
     "FloatField",
     "ForeignKey",
+    "IdentityMap",
     "Index",
     "IPAddressField",
     "IntegerField",
@@ -66,11 +72,14 @@ __all__ = [
     "ManyToMany",
     "ManyToManyField",
     "Manager",
+    "Max",
+    "Min",
     "Migrate",
     "Model",
     "MultipleObjectsReturned",
     "OneToOne",
     "OneToOneField",
+    "Page",
     "PasswordField",
     "Prefetch",
     "QuerySet",
@@ -81,6 +90,7 @@ __all__ = [
     "SaffierSettings",
     "SET_NULL",
     "Signal",
+    "Sum",
     "TextField",
     "TimeField",
     "UniqueConstraint",
@@ -88,5 +98,7 @@ __all__ = [
     "UUIDField",
     "settings",
     "fields",
+    "load_related",
     "run_sync",
+    "strict_loading",
 ]
@@ -42,3 +42,28 @@ class SaffierSettings(Settings):
     }
 
     many_to_many_relation: str = "relation_{key}"
+
+    # Maximum number of bind parameters of a single statement per dialect.
+    max_bind_params: ClassVar[Dict[str, int]] = {
+        "postgres": 32767,
+        "postgresql": 32767,
+        "mysql": 65535,
+        "sqlite": 999,
+    }
+    default_max_bind_params: int = 999
+
+    # Minimum number of values of a column validated in bulk with NumPy, when installed.
+    numpy_validation_threshold: int = 1024
+
+    # Caches
+    table_cache_size: int = 512
+    select_cache_size: int = 512
+    hydrator_cache_size: int = 512
+    statement_cache_size: int = 512
+    validator_cache_size: int = 512
+    result_cache_size: int = 512
+    # Default seconds the results of `QuerySet.cache()` are kept.
+    result_cache_ttl: float = 60
+
+    # Raise instead of loading the fields of a model not loaded yet when accessed.
+    strict_loading: bool = False
@@ -10,7 +10,9 @@ from sqlalchemy.orm import declarative_base as sa_declarative_base
 from saffier.conf import settings
 from saffier.core.connection.database import Database
 from saffier.core.connection.schemas import Schema
+from saffier.core.db.caches import CacheInfo, LRUCache, ResultCache, TableCache
 from saffier.exceptions import ImproperlyConfigured
+from saffier.protocols.result_cache import ResultCacheProtocol
 
 
 class Registry:
@@ -27,6 +29,15 @@ class Registry:
         self.extra: Mapping[str, Type["Database"]] = kwargs.pop("extra", {})
 
         self.schema = Schema(registry=self)
+        self.table_cache = TableCache(maxsize=settings.table_cache_size)
+        self.select_cache = LRUCache(maxsize=settings.select_cache_size)
+        self.hydrator_cache = LRUCache(maxsize=settings.hydrator_cache_size)
+        self.statement_cache = LRUCache(maxsize=settings.statement_cache_size)
+        self.validator_cache = LRUCache(maxsize=settings.validator_cache_size)
+        result_cache = kwargs.pop("result_cache", None)
+        if result_cache is None:
+            result_cache = ResultCache(maxsize=settings.result_cache_size)
+        self.result_cache: ResultCacheProtocol = result_cache
 
         self._metadata = (
             sqlalchemy.MetaData(schema=self.db_schema)
@@ -43,6 +54,26 @@ class Registry:
     @metadata.setter
     def metadata(self, value: sqlalchemy.MetaData) -> None:
         self._metadata = value
+        self.table_cache.clear()
+        self.select_cache.clear()
+        self.hydrator_cache.clear()
+        self.statement_cache.clear()
+        self.validator_cache.clear()
+
+    def cache_info(self) -> Dict[str, CacheInfo]:
+        """
+        Returns the statistics of the internal caches of the registry.
+        """
+        info = {
+            "tables": self.table_cache.info(),
+            "selects": self.select_cache.info(),
+            "hydrators": self.hydrator_cache.info(),
+            "statements": self.statement_cache.info(),
+            "validators": self.validator_cache.info(),
+        }
+        if isinstance(self.result_cache, ResultCache):
+            info["results"] = self.result_cache.info()
+        return info
 
     def _get_database_url(self) -> str:
         url = self.database.url
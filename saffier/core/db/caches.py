@@ -0,0 +1,239 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, Hashable, NamedTuple, Optional, Set, Tuple, Type
+
+import sqlalchemy
+from sqlalchemy.sql import util as sql_util
+
+if TYPE_CHECKING:  # pragma: no cover
+    from saffier import Model
+
+TableKey = Tuple[str, Optional[str]]
+
+
+class CacheInfo(NamedTuple):
+    """
+    The statistics of a cache, similar to the `functools.lru_cache` one.
+    """
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache:
+    """
+    Bounded, thread safe, least recently used cache with hit and miss counters.
+
+    Used by the registry to keep the internal caches of Saffier bounded.
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Returns the value for the given key and marks it as the most recently used.
+        """
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Stores the value and evicts the least recently used entries if the cache is full.
+        """
+        if self.maxsize <= 0:
+            return
+
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            return self._data.pop(key, default)
+
+    def clear(self) -> None:
+        """
+        Removes all the entries and resets the statistics.
+        """
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: {self.info()}>"
+
+
+class TableCache(LRUCache):
+    """
+    Cache of the SQLAlchemy tables generated per model and schema.
+
+    Building a table generates every column, constraint and index of the model
+    and extends the existing table in the registry metadata. This only needs
+    to happen once per (model, schema) unless the model definition changes.
+    """
+
+    def get_table(self, model: Type["Model"], schema: Optional[str] = None) -> sqlalchemy.Table:
+        """
+        Returns the table of the model for the given schema, building it on a miss.
+
+        A cached table is only valid if the model still has the same tablename and fields
+        as when it was built.
+        """
+        key = (model, schema)
+        fields = model.fields
+
+        with self._lock:
+            entry: Optional[Tuple[Any, ...]] = self._data.get(key)
+            if (
+                entry is not None
+                and entry[0] is fields
+                and entry[1] == len(fields)
+                and entry[2] == model.meta.tablename
+            ):
+                self._data.move_to_end(key)
+                self.hits += 1
+                return entry[3]
+            self.misses += 1
+
+        table = model.build(schema)
+        self.set(key, (fields, len(fields), model.meta.tablename, table))
+        return table
+
+    def invalidate(self, model: Type["Model"]) -> None:
+        """
+        Removes all the cached tables of a given model, for every schema.
+        """
+        with self._lock:
+            for key in [key for key in self._data if key[0] is model]:
+                del self._data[key]
+
+
+def get_table_key(table: sqlalchemy.Table) -> TableKey:
+    """
+    The name and schema identifying a table in the result cache.
+    """
+    return (table.name, table.schema)
+
+
+def get_statement_tables(expression: Any) -> Set[TableKey]:
+    """
+    Returns the tables read by a statement, including the joins and the subqueries.
+    """
+    return {
+        get_table_key(table)
+        for table in sql_util.find_tables(expression, check_columns=True, include_aliases=True)
+        if isinstance(table, sqlalchemy.Table)
+    }
+
+
+class ResultCache:
+    """
+    In process, least recently used, backend of the query result cache.
+
+    The entries expire after their time to live and are invalidated by the writes to any
+    of the tables read by their statement.
+    """
+
+    def __init__(self, maxsize: int = 512) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[str, Tuple[float, Set[TableKey], Any]]" = OrderedDict()
+        self._tables: Dict[TableKey, Set[str]] = {}
+        self._lock = threading.RLock()
+
+    async def get(self, key: str) -> Tuple[bool, Any]:
+        """
+        Returns if the key was found and its value, not found when expired.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    self._discard(key)
+                self.misses += 1
+                return False, None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return True, entry[2]
+
+    async def set(self, key: str, value: Any, ttl: float, tables: Set[TableKey]) -> None:
+        """
+        Stores the value for `ttl` seconds, indexed by the tables read.
+        """
+        if self.maxsize <= 0:
+            return
+
+        with self._lock:
+            self._discard(key)
+            self._data[key] = (time.monotonic() + ttl, tables, value)
+            for table in tables:
+                self._tables.setdefault(table, set()).add(key)
+            while len(self._data) > self.maxsize:
+                self._discard(next(iter(self._data)))
+
+    async def invalidate(self, tables: Set[TableKey]) -> None:
+        """
+        Removes the entries reading any of the tables.
+        """
+        with self._lock:
+            for table in tables:
+                for key in list(self._tables.get(table, ())):
+                    self._discard(key)
+
+    async def clear(self) -> None:
+        """
+        Removes all the entries and resets the statistics.
+        """
+        with self._lock:
+            self._data.clear()
+            self._tables.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def _discard(self, key: str) -> None:
+        entry = self._data.pop(key, None)
+        if entry is None:
+            return
+        for table in entry[1]:
+            keys = self._tables.get(table)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tables[table]
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: {self.info()}>"
@@ -1,11 +1,15 @@
 from contextvars import ContextVar
-from typing import TYPE_CHECKING, Type, Union
+from typing import TYPE_CHECKING, Optional, Type, Union
 
 if TYPE_CHECKING:
     from saffier import Database, Model, QuerySet
+    from saffier.core.db.models.loaders import DataLoader, IdentityMap
 
 TENANT: ContextVar[str] = ContextVar("tenant", default=None)
 SHEMA: ContextVar[str] = ContextVar("SHEMA", default=None)
+STRICT_LOADING: ContextVar[Optional[bool]] = ContextVar("STRICT_LOADING", default=None)
+DATALOADER: ContextVar[Optional["DataLoader"]] = ContextVar("DATALOADER", default=None)
+IDENTITY_MAP: ContextVar[Optional["IdentityMap"]] = ContextVar("IDENTITY_MAP", default=None)
 
 
 def get_tenant() -> Union[str, None]:
@@ -31,6 +35,27 @@ def set_schema(value: Union[str, None]) -> None:
     SHEMA.set(value)
 
 
+def get_strict_loading() -> Optional[bool]:
+    """
+    Gets the strict loading of the context, `None` when not set.
+    """
+    return STRICT_LOADING.get()
+
+
+def get_dataloader() -> Optional["DataLoader"]:
+    """
+    Gets the data loader active in the context, `None` when not set.
+    """
+    return DATALOADER.get()
+
+
+def get_identity_map() -> Optional["IdentityMap"]:
+    """
+    Gets the identity map active in the context, `None` when not set.
+    """
+    return IDENTITY_MAP.get()
+
+
 def set_queryset_schema(
     queryset: "QuerySet",
     model_class: Type["Model"],
@@ -265,7 +265,9 @@ class ForeignKey(Field):
 
     class ForeignKeyValidator(SaffierField):
         def check(self, value: typing.Any) -> typing.Any:
-            return value.pk
+            if hasattr(value, "__db_model__"):
+                return value.pk
+            return value
 
     def __init__(
         self,
@@ -0,0 +1,144 @@
+"""
+Checks of the validators over a whole column of values at once, used to validate many
+records in bulk.
+
+Each check returns the indexes of the values it cannot accept as they are. Those values
+go through the `check()` of the validator, which converts them or raises the same errors
+as the validation of a single record.
+"""
+
+from math import isfinite
+from typing import Any, Callable, List, Optional, Sequence
+
+from saffier.conf import settings
+from saffier.core.db.fields._internal import FORMATS, Boolean, Number, SaffierField, String
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+ColumnCheck = Callable[[Sequence[Any]], List[int]]
+
+
+def get_column_check(validator: SaffierField) -> Optional[ColumnCheck]:
+    """
+    Returns the column check of the validator or `None` when every value must go
+    through its `check()`.
+    """
+    validator_check = type(validator).check
+    if validator_check is String.check:
+        return get_string_check(validator)  # type: ignore
+    if validator_check is Number.check:
+        return get_number_check(validator)  # type: ignore
+    if validator_check is Boolean.check:
+        return get_boolean_check()
+    return None
+
+
+def get_string_check(validator: String) -> Optional[ColumnCheck]:
+    """
+    Strings without a format are accepted as they are when they have no null
+    characters and match the blank, length and pattern rules.
+    """
+    if validator.format in FORMATS or validator.trim_whitespace:
+        return None
+
+    blank = validator.blank
+    min_length = validator.min_length
+    max_length = validator.max_length
+    search = validator.pattern_regex.search if validator.pattern_regex is not None else None
+
+    def check(values: Sequence[Any]) -> List[int]:
+        invalid = []
+        for index, value in enumerate(values):
+            if (
+                type(value) is not str
+                or "\0" in value
+                or (not value and not blank)
+                or (min_length is not None and len(value) < min_length)
+                or (max_length is not None and len(value) > max_length)
+                or (search is not None and search(value) is None)
+            ):
+                invalid.append(index)
+        return invalid
+
+    return check
+
+
+def get_number_check(validator: Number) -> Optional[ColumnCheck]:
+    """
+    Integers and floats already of the type of the field are accepted as they are when
+    they are finite and within the limits.
+
+    With NumPy installed, the columns with at least `numpy_validation_threshold` values
+    are checked with vectorized operations.
+    """
+    field_type = validator.field_type
+    if (
+        field_type not in (int, float)
+        or validator.precision is not None
+        or validator.multiple_of is not None
+    ):
+        return None
+
+    minimum = validator.minimum
+    maximum = validator.maximum
+    exclusive_minimum = validator.exclusive_minimum
+    exclusive_maximum = validator.exclusive_maximum
+    limits = (minimum, maximum, exclusive_minimum, exclusive_maximum)
+
+    def is_valid(value: Any) -> bool:
+        return (
+            type(value) is field_type
+            and (field_type is int or isfinite(value))
+            and (minimum is None or value >= minimum)
+            and (maximum is None or value <= maximum)
+            and (exclusive_minimum is None or value > exclusive_minimum)
+            and (exclusive_maximum is None or value < exclusive_maximum)
+        )
+
+    def check_array(values: Sequence[Any]) -> Optional[List[int]]:
+        if set(map(type, values)) != {field_type}:
+            return None
+        try:
+            array = numpy.array(values, dtype=numpy.int64 if field_type is int else numpy.float64)
+            invalid = numpy.zeros(len(array), dtype=bool)
+            if field_type is float:
+                invalid |= ~numpy.isfinite(array)
+            if minimum is not None:
+                invalid |= array < minimum
+            if maximum is not None:
+                invalid |= array > maximum
+            if exclusive_minimum is not None:
+                invalid |= array <= exclusive_minimum
+            if exclusive_maximum is not None:
+                invalid |= array >= exclusive_maximum
+        except OverflowError:
+            # Integers out of the range of the array go through the Python checks.
+            return None
+        return numpy.flatnonzero(invalid).tolist()  # type: ignore
+
+    use_numpy = numpy is not None and all(
+        limit is None or type(limit) in (int, float) for limit in limits
+    )
+
+    def check(values: Sequence[Any]) -> List[int]:
+        if use_numpy and len(values) >= settings.numpy_validation_threshold:
+            invalid = check_array(values)
+            if invalid is not None:
+                return invalid
+        return [index for index, value in enumerate(values) if not is_valid(value)]
+
+    return check
+
+
+def get_boolean_check() -> ColumnCheck:
+    """
+    Booleans are accepted as they are, the other values are coerced by the validator.
+    """
+
+    def check(values: Sequence[Any]) -> List[int]:
+        return [index for index, value in enumerate(values) if type(value) is not bool]
+
+    return check
@@ -1,6 +1,18 @@
 import copy
 import functools
-from typing import TYPE_CHECKING, Any, ClassVar, Dict, Optional, Sequence, Set, Type, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Dict,
+    Iterable,
+    Optional,
+    Sequence,
+    Set,
+    Type,
+    Union,
+    cast,
+)
 
 import sqlalchemy
 from sqlalchemy.engine import Engine
@@ -12,6 +24,7 @@ from saffier.core.db.datastructures import Index, UniqueConstraint
 from saffier.core.db.models.managers import Manager
 from saffier.core.db.models.metaclasses import BaseModelMeta, BaseModelReflectMeta, MetaInfo
 from saffier.core.db.models.model_proxy import ProxyModel
+from saffier.core.db.models.validators import ModelValidator
 from saffier.core.utils.models import DateParser, generify_model_fields
 from saffier.exceptions import ImproperlyConfigured
 
@@ -21,6 +34,36 @@ if TYPE_CHECKING:
 
 saffier_setattr = object.__setattr__
 
+# The values that can be changed in place, kept as copies in the snapshot.
+MUTABLE_TYPES = (dict, list, set)
+
+
+def has_changed(old: Any, new: Any) -> bool:
+    """
+    Compares the value of a field with the one in the snapshot, the related models
+    by primary key.
+    """
+    if old is new:
+        return False
+    if hasattr(old, "__db_model__") and hasattr(new, "__db_model__"):
+        return bool(old.__class__ is not new.__class__ or old.pk != new.pk)
+    try:
+        return bool(old != new)
+    except Exception:  # noqa
+        return True
+
+
+def copy_snapshot(values: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Returns the snapshot of the values, with copies of the mutable ones so the changes
+    made in place are detected.
+    """
+    snapshot = dict(values)
+    for key, value in snapshot.items():
+        if isinstance(value, MUTABLE_TYPES):
+            snapshot[key] = copy.deepcopy(value)
+    return snapshot
+
 
 class SaffierBaseModel(DateParser, metaclass=BaseModelMeta):
     """
@@ -35,6 +78,15 @@ class SaffierBaseModel(DateParser, metaclass=BaseModelMeta):
     __raw_query__: ClassVar[Optional[str]] = None
     __proxy_model__: ClassVar[Union[Type["Model"], None]] = None
 
+    # Kept outside the `__dict__`, which only holds the values of the fields.
+    __slots__ = ("_saffier_snapshot", "_saffier_dirty")
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> Any:
+        instance = super().__new__(cls)
+        saffier_setattr(instance, "_saffier_snapshot", None)
+        saffier_setattr(instance, "_saffier_dirty", None)
+        return instance
+
     def __init__(self, **kwargs: Any) -> None:
         self.setup_model_fields_from_kwargs(kwargs)
 
@@ -179,6 +231,26 @@ class SaffierBaseModel(DateParser, metaclass=BaseModelMeta):
         """
         return sqlalchemy.Index(index.name, *index.fields)  # type: ignore
 
+    @classmethod
+    def get_validator(
+        cls, names: Optional[Iterable[str]] = None, auto_now: bool = False
+    ) -> ModelValidator:
+        """
+        Returns the compiled validator of the given fields of the model, cached in the
+        registry and created again if the model definition changed.
+
+        Without `names`, the validator of the creation of a record.
+        """
+        validator_cache = cls.meta.registry.validator_cache  # type: ignore
+        fields = frozenset(names) if names is not None else None
+        key = (cls, fields, auto_now)
+
+        validator: Optional[ModelValidator] = validator_cache.get(key)
+        if validator is None or not validator.is_valid():
+            validator = ModelValidator(cls, names=fields, auto_now=auto_now)  # type: ignore
+            validator_cache.set(key, validator)
+        return validator
+
     def update_from_dict(self, dict_values: Dict[str, Any]) -> Self:
         """Updates the current model object with the new fields"""
         for key, value in dict_values.items():
@@ -193,6 +265,59 @@ class SaffierBaseModel(DateParser, metaclass=BaseModelMeta):
         related_names = self.meta.related_names
         return {k: v for k, v in self.__dict__.items() if k not in related_names}
 
+    def take_snapshot(self, names: Optional[Sequence[str]] = None) -> None:
+        """
+        Stores the current values of the fields as the ones in the database, used to know
+        which fields changed since.
+
+        When `names` are given, only those fields are marked as saved.
+        """
+        if names is None:
+            fields = self.fields
+            saffier_setattr(
+                self,
+                "_saffier_snapshot",
+                copy_snapshot(
+                    {key: value for key, value in self.__dict__.items() if key in fields}
+                ),
+            )
+            saffier_setattr(self, "_saffier_dirty", set())
+            return
+
+        if self._saffier_snapshot is None:
+            return
+
+        for name in names:
+            if name in self.__dict__:
+                value = self.__dict__[name]
+                if isinstance(value, MUTABLE_TYPES):
+                    value = copy.deepcopy(value)
+                self._saffier_snapshot[name] = value
+            self._saffier_dirty.discard(name)
+
+    def get_dirty_fields(self) -> Optional[Set[str]]:
+        """
+        Returns the names of the fields changed since the instance was loaded or saved,
+        or `None` if the instance is not tracked, like the ones not saved yet.
+
+        The mutable values, like the ones of a `JSONField`, are compared with the snapshot
+        to detect the changes made in place.
+        """
+        if self._saffier_dirty is None:
+            return None
+
+        dirty = set(self._saffier_dirty)
+        values = self.__dict__
+        for key, value in self._saffier_snapshot.items():
+            if (
+                isinstance(value, MUTABLE_TYPES)
+                and key not in dirty
+                and key in values
+                and has_changed(value, values[key])
+            ):
+                dirty.add(key)
+        return dirty
+
     def __setattr__(self, key: Any, value: Any) -> Any:
         if key in self.fields:
             # Setting a relationship to a raw pk value should set a
@@ -203,6 +328,13 @@ class SaffierBaseModel(DateParser, metaclass=BaseModelMeta):
                 value = getattr(self, settings.many_to_many_relation.format(key=key))
             else:
                 value = self.fields[key].expand_relationship(value)
+
+            snapshot = self._saffier_snapshot
+            if snapshot is not None:
+                if key in snapshot and not has_changed(snapshot[key], value):
+                    self._saffier_dirty.discard(key)
+                else:
+                    self._saffier_dirty.add(key)
         super().__setattr__(key, value)
 
     def __get_instance_values(self, instance: Any) -> Set[Any]:
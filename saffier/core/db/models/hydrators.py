@@ -0,0 +1,207 @@
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple, Type
+
+import sqlalchemy
+from sqlalchemy.engine.result import Row
+
+import saffier
+from saffier.conf import settings
+from saffier.core.db.fields.base import Field
+from saffier.core.db.models.base import copy_snapshot
+
+if TYPE_CHECKING:  # pragma: no cover
+    from saffier import Model
+
+saffier_setattr = object.__setattr__
+
+
+def can_assign_directly(model_class: Type["Model"]) -> bool:
+    """
+    Checks if the instances of a model can be populated without going through
+    the `__init__` and `__setattr__` of the model.
+
+    This is only possible if none of them was customised by the model.
+    """
+    from saffier.core.db.models.base import SaffierBaseModel
+
+    return (
+        model_class.__init__ is SaffierBaseModel.__init__
+        and model_class.setup_model_fields_from_kwargs
+        is SaffierBaseModel.setup_model_fields_from_kwargs
+        and model_class.__setattr__ is SaffierBaseModel.__setattr__
+    )
+
+
+def has_custom_expand(field: Field) -> bool:
+    return type(field).expand_relationship is not Field.expand_relationship
+
+
+def make_stub_factory(field: Any) -> Callable[[Any], Any]:
+    """
+    Returns the callable generating the lazy instance of the foreign key with
+    just the primary key loaded.
+    """
+    target = field.target
+    pkname = target.pkname
+
+    if not can_assign_directly(target) or has_custom_expand(target.fields[pkname]):
+        return field.expand_relationship
+
+    def stub(value: Any) -> Any:
+        instance = target.__new__(target)
+        instance.__dict__[pkname] = value
+        return instance
+
+    return stub
+
+
+class ModelHydrator:
+    """
+    Converts the rows of a query into model instances for a given shape of
+    the query, the model, the `select_related` and the `exclude_secrets`.
+
+    Everything that only depends on the shape (which columns map to which
+    fields, the foreign keys to generate, the nested select related models)
+    is resolved once when the hydrator is created, leaving for each row only
+    the reading of the values and the assignment of the attributes.
+    """
+
+    def __init__(
+        self,
+        model_class: Type["Model"],
+        select_related: Sequence[str] = (),
+        exclude_secrets: bool = False,
+    ) -> None:
+        self.model_class = model_class
+        self.fields = model_class.fields
+        self.fields_count = len(self.fields)
+        self.table: sqlalchemy.Table = model_class.table
+        self.instance_class: Type["Model"] = (
+            model_class.proxy_model if exclude_secrets else model_class
+        )
+        self.assign_directly = can_assign_directly(self.instance_class)
+
+        secret_fields = (
+            {name for name, field in self.fields.items() if field.secret}
+            if exclude_secrets
+            else set()
+        )
+
+        # Group the select related by the first part, each one generating a
+        # nested hydrator with the remaining parts.
+        nested: Dict[str, List[str]] = {}
+        for related in select_related:
+            first_part, _, remainder = related.partition("__")
+            nested.setdefault(first_part, [])
+            if remainder:
+                nested[first_part].append(remainder)
+
+        ignored_related_names = {
+            part for related in select_related for part in related.split("__")
+        }
+
+        self.related: Tuple[Tuple[str, "ModelHydrator"], ...] = tuple(
+            (
+                name,
+                ModelHydrator(
+                    self.get_related_model(name),
+                    select_related=remainders,
+                    exclude_secrets=exclude_secrets,
+                ),
+            )
+            for name, remainders in nested.items()
+        )
+
+        foreign_keys = []
+        columns = []
+        many_to_many = []
+        schema_models = []
+
+        for column in self.table.columns:
+            name = column.name
+            field = self.fields.get(name)
+
+            # Making sure when a table is reflected, maps the right fields of the ReflectModel
+            if field is None or name in nested:
+                continue
+
+            if name in model_class.meta.foreign_key_fields and name not in ignored_related_names:
+                schema_models.append(field.target)
+
+            if name in secret_fields:
+                continue
+
+            if isinstance(field, saffier.ManyToManyField):
+                many_to_many.append(
+                    (name, column, settings.many_to_many_relation.format(key=name))
+                )
+            elif isinstance(field, saffier.ForeignKey):
+                foreign_keys.append((name, column, make_stub_factory(field)))
+            else:
+                expand = (
+                    field.expand_relationship
+                    if self.assign_directly and has_custom_expand(field)
+                    else None
+                )
+                columns.append((name, column, expand))
+
+        self.foreign_keys: Tuple[Tuple[str, sqlalchemy.Column, Callable], ...] = tuple(
+            foreign_keys
+        )
+        self.columns: Tuple[Tuple[str, sqlalchemy.Column, Optional[Callable]], ...] = tuple(
+            columns
+        )
+        self.many_to_many: Tuple[Tuple[str, sqlalchemy.Column, str], ...] = tuple(many_to_many)
+        self.schema_models: Tuple[Type["Model"], ...] = tuple(schema_models)
+
+    def get_related_model(self, name: str) -> Type["Model"]:
+        try:
+            return self.model_class.fields[name].target  # type: ignore
+        except KeyError:
+            return getattr(self.model_class, name).related_from  # type: ignore
+
+    def is_valid(self) -> bool:
+        """
+        Checks if the model definition changed since the hydrator was created.
+        """
+        model_class = self.model_class
+        if (
+            self.fields is not model_class.fields
+            or self.fields_count != len(model_class.fields)
+            or self.table is not model_class.table
+        ):
+            return False
+        return all(hydrator.is_valid() for _, hydrator in self.related)
+
+    def __call__(self, row: Row, using_schema: Optional[str] = None) -> "Model":
+        if using_schema is not None:
+            for model in self.schema_models:
+                model.table = model.table_schema(using_schema)
+
+        values: Dict[str, Any] = {}
+        for name, hydrator in self.related:
+            values[name] = hydrator(row, using_schema)
+
+        for name, column, stub in self.foreign_keys:
+            values[name] = stub(row[column])
+
+        for name, column, expand in self.columns:
+            value = row[column]
+            values[name] = value if expand is None else expand(value)
+
+        if self.assign_directly:
+            instance = self.instance_class.__new__(self.instance_class)
+            instance_values = instance.__dict__
+            instance_values.update(values)
+            for name, _, relation in self.many_to_many:
+                instance_values[name] = getattr(instance, relation)
+            saffier_setattr(instance, "_saffier_snapshot", copy_snapshot(instance_values))
+            saffier_setattr(instance, "_saffier_dirty", set())
+        else:
+            for name, column, _ in self.many_to_many:
+                values[name] = row[column]
+            instance = self.instance_class(**values)
+            instance.take_snapshot()
+
+        if using_schema is not None:
+            instance.table = self.model_class.table_schema(using_schema)
+        return instance
@@ -0,0 +1,461 @@
+import asyncio
+from contextlib import contextmanager
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+)
+
+import sqlalchemy
+from databasez import Database
+
+import saffier
+from saffier.conf import settings
+from saffier.core.db.context_vars import (
+    DATALOADER,
+    IDENTITY_MAP,
+    STRICT_LOADING,
+    get_dataloader,
+    get_identity_map,
+    get_strict_loading,
+)
+from saffier.core.utils.db import chunked, get_max_bind_params
+from saffier.exceptions import QuerySetError
+
+if TYPE_CHECKING:  # pragma: no cover
+    from saffier import Model
+
+LoaderKey = Tuple[Database, sqlalchemy.Table, str]
+IdentityKey = Tuple[Type["Model"], Optional[str], Any]
+
+
+def is_strict_loading() -> bool:
+    """
+    Whether accessing a field not loaded raises instead of querying the database, set by
+    the `strict_loading()` of the context or else the `strict_loading` setting.
+    """
+    strict = get_strict_loading()
+    if strict is None:
+        return settings.strict_loading
+    return strict
+
+
+@contextmanager
+def strict_loading(enabled: bool = True) -> Iterator[None]:
+    """
+    Raises `RelationshipNotLoaded` when a field not loaded is accessed inside the context,
+    instead of loading it with a blocking query.
+
+    Usage:
+
+    .. code-block:: python3
+
+        with saffier.strict_loading():
+            posts = await Post.query.all()
+            await saffier.load_related(posts, "author")
+    """
+    token = STRICT_LOADING.set(enabled)
+    try:
+        yield
+    finally:
+        STRICT_LOADING.reset(token)
+
+
+def is_loaded(instance: "Model") -> bool:
+    """
+    Whether all the fields of the instance are loaded, unlike the ones generated for the
+    foreign keys, which only have the primary key.
+    """
+    values = instance.__dict__
+    return all(name in values for name in instance.fields)
+
+
+async def load_related(instances: Sequence["Model"], *related: str) -> None:
+    """
+    Loads the foreign keys of the instances with one `IN` query per relation, instead of
+    one query per instance.
+
+    The foreign keys of the related models are loaded via `__`, for example
+    `author__organisation`. The related instances already loaded are not queried again.
+
+    Usage:
+
+    .. code-block:: python3
+
+        posts = await Post.query.all()
+        await saffier.load_related(posts, "author", "author__organisation")
+    """
+    instances = [instance for instance in instances if instance is not None]
+    if not instances:
+        return
+
+    nested: Dict[str, List[str]] = {}
+    for item in related:
+        name, _, remainder = item.partition("__")
+        nested.setdefault(name, [])
+        if remainder:
+            nested[name].append(remainder)
+
+    for name, remainders in nested.items():
+        related_instances = await _load_foreign_key(instances, name)
+        if remainders:
+            await load_related(related_instances, *remainders)
+
+
+async def _load_foreign_key(instances: Sequence["Model"], name: str) -> List["Model"]:
+    """
+    Loads the foreign key `name` of the instances and returns the related instances.
+    """
+    model_class = instances[0].__class__
+    field = instances[0].fields.get(name)
+    if not isinstance(field, (saffier.ForeignKey, saffier.OneToOneField)):
+        raise QuerySetError(detail=f"{name} is not a foreign key of {model_class.__name__}.")
+
+    related_instances = []
+    pending: Dict[Any, List["Model"]] = {}
+    for instance in instances:
+        value = instance.__dict__.get(name)
+        if value is None or value.pk is None:
+            continue
+        related_instances.append(value)
+        if not is_loaded(value):
+            pending.setdefault(value.pk, []).append(value)
+
+    if not pending:
+        return related_instances
+
+    target = field.target
+    queryset = target.query.all()
+    for chunk in chunked(list(pending), get_max_bind_params(queryset.database)):
+        for record in await queryset.filter(**{f"{target.pkname}__in": chunk}):
+            for value in pending.get(record.pk, []):
+                _fill(value, record)
+    return related_instances
+
+
+def _fill(instance: "Model", record: "Model") -> None:
+    """
+    Copies the values of the record loaded into the instance of the foreign key.
+    """
+    instance.__dict__.update(record.__dict__)
+    instance.take_snapshot()
+
+
+class DataLoader:
+    """
+    Coalesces the records loaded by primary key in the same iteration of the event loop
+    into one `WHERE pk IN (...)` query per table and memoizes them until the end of the
+    context.
+
+    The `load()` of the models and the access to the fields not loaded go through the data
+    loader active in the context.
+
+    Usage:
+
+    .. code-block:: python3
+
+        async with saffier.DataLoader():
+            posts = await Post.query.all()
+            await asyncio.gather(*(post.author.load() for post in posts))
+    """
+
+    def __init__(self) -> None:
+        self._results: Dict[LoaderKey, Dict[Any, "asyncio.Future[Any]"]] = {}
+        self._pending: Dict[LoaderKey, Dict[Any, "asyncio.Future[Any]"]] = {}
+        self._tasks: Set["asyncio.Task[None]"] = set()
+        self._scheduled = False
+        self._token: Any = None
+
+    async def __aenter__(self) -> "DataLoader":
+        self._token = DATALOADER.set(self)
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        DATALOADER.reset(self._token)
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._results.clear()
+
+    @staticmethod
+    def _get_key(instance: "Model") -> LoaderKey:
+        return (instance.database, instance.table, instance.pkname)
+
+    async def load(self, instance: "Model") -> Any:
+        """
+        Returns the row of the instance, from the memoized results or else from the next
+        batch of the table.
+        """
+        key = self._get_key(instance)
+        results = self._results.setdefault(key, {})
+        future = results.get(instance.pk)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            results[instance.pk] = future
+            self._pending.setdefault(key, {})[instance.pk] = future
+            if not self._scheduled:
+                self._scheduled = True
+                loop.call_soon(self._dispatch)
+        return await asyncio.shield(future)
+
+    def get_loaded(self, instance: "Model") -> Optional[Any]:
+        """
+        Returns the row of the instance when already loaded, without querying the database.
+        """
+        future = self._results.get(self._get_key(instance), {}).get(instance.pk)
+        if future is None or not future.done() or future.cancelled():
+            return None
+        if future.exception() is not None:
+            return None
+        return future.result()
+
+    def forget(self, instance: "Model") -> None:
+        """
+        Drops the memoized row of the instance, loaded again by the next lookup.
+        """
+        self._results.get(self._get_key(instance), {}).pop(instance.pk, None)
+
+    def clear(self, table: Optional[sqlalchemy.Table] = None) -> None:
+        """
+        Drops the memoized rows of the table or else of all the tables.
+        """
+        for key in list(self._results):
+            if table is None or key[1] is table:
+                del self._results[key]
+
+    def _dispatch(self) -> None:
+        self._scheduled = False
+        pending, self._pending = self._pending, {}
+        for key, futures in pending.items():
+            task = asyncio.ensure_future(self._load_batch(key, futures))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _load_batch(self, key: LoaderKey, futures: Dict[Any, "asyncio.Future[Any]"]) -> None:
+        database, table, pkname = key
+        pk_column = table.columns[pkname]
+        rows: Dict[Any, Any] = {}
+        try:
+            for chunk in chunked(list(futures), get_max_bind_params(database)):
+                expression = table.select().where(pk_column.in_(chunk))
+                for row in await database.fetch_all(expression):
+                    rows[row[pk_column]] = row
+        except Exception as exc:
+            results = self._results.get(key, {})
+            for pk, future in futures.items():
+                if results.get(pk) is future:
+                    del results[pk]
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for pk, future in futures.items():
+            if not future.done():
+                future.set_result(rows.get(pk))
+
+
+class IdentityMapInfo(NamedTuple):
+    """
+    The statistics of an identity map.
+    """
+
+    hits: int
+    misses: int
+    queries_avoided: int
+    currsize: int
+
+
+class IdentityMap:
+    """
+    Keeps one instance per record loaded in the context, keyed by the model, the schema and
+    the primary key.
+
+    The results of the queries resolve to the instance already in the map, the `get()` by
+    primary key and the `load()` of the records in the map do not query the database.
+
+    Usage:
+
+    .. code-block:: python3
+
+        async with saffier.IdentityMap() as identity_map:
+            user = await User.query.get(pk=1)
+            assert await User.query.get(pk=1) is user
+            print(identity_map.info())
+    """
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.queries_avoided = 0
+        self._instances: Dict[IdentityKey, "Model"] = {}
+        self._token: Any = None
+
+    async def __aenter__(self) -> "IdentityMap":
+        self._token = IDENTITY_MAP.set(self)
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        IDENTITY_MAP.reset(self._token)
+        self._instances.clear()
+
+    @staticmethod
+    def get_key(model_class: Type["Model"], schema: Optional[str], pk: Any) -> IdentityKey:
+        """
+        The key of a record, the proxy models sharing the one of their model.
+        """
+        if model_class.is_proxy_model:
+            registry = model_class.meta.registry
+            model_class = (
+                registry.models.get(model_class.__name__)  # type: ignore
+                or registry.reflected.get(model_class.__name__)  # type: ignore
+                or model_class
+            )
+        return (model_class, schema, pk)
+
+    def get(self, model_class: Type["Model"], schema: Optional[str], pk: Any) -> Optional["Model"]:
+        """
+        Returns the instance of the record in the map, if any.
+        """
+        instance = self._instances.get(self.get_key(model_class, schema, pk))
+        if instance is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return instance
+
+    def add(self, instance: "Model") -> "Model":
+        """
+        Returns the instance of the map for the record of the given one, registering it when
+        the map has none. Only the instances with all the fields loaded are registered.
+
+        The instance of the map gets the relations loaded by the given one, like the ones of
+        a `select_related`, keeping the values it already has.
+        """
+        if instance.pk is None or not is_loaded(instance):
+            return instance
+
+        key = self.get_key(instance.__class__, instance.table.schema, instance.pk)
+        existing = self._instances.get(key)
+        if existing is not None:
+            self.hits += 1
+            self._merge(existing, instance)
+            return existing
+        self._instances[key] = instance
+        return instance
+
+    def _merge(self, existing: "Model", instance: "Model") -> None:
+        """
+        Copies into the instance of the map the values it does not have and the related
+        models loaded in place of the ones only with the primary key.
+        """
+        values = existing.__dict__
+        for name, value in instance.__dict__.items():
+            if name not in values:
+                values[name] = value
+                continue
+
+            current = values[name]
+            if (
+                hasattr(value, "__db_model__")
+                and hasattr(current, "__db_model__")
+                and current.pk == value.pk
+                and not is_loaded(current)
+                and is_loaded(value)
+            ):
+                values[name] = self.add(value)
+
+    def discard(self, instance: "Model") -> None:
+        """
+        Removes the record of the instance from the map, for every schema.
+        """
+        model_class = self.get_key(instance.__class__, None, None)[0]
+        for key in [
+            key for key in self._instances if key[0] is model_class and key[2] == instance.pk
+        ]:
+            del self._instances[key]
+
+    def clear(self, table: Optional[sqlalchemy.Table] = None) -> None:
+        """
+        Removes the records of the table or else all the records from the map.
+        """
+        for key, instance in list(self._instances.items()):
+            if (
+                table is None
+                or instance.table.name == table.name
+                and instance.table.schema == table.schema
+            ):
+                del self._instances[key]
+
+    def info(self) -> IdentityMapInfo:
+        return IdentityMapInfo(self.hits, self.misses, self.queries_avoided, len(self._instances))
+
+    def __len__(self) -> int:
+        return len(self._instances)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: {self.info()}>"
+
+
+def get_identity(
+    instance: "Model", partial: bool = False, exclude_secrets: bool = False
+) -> "Model":
+    """
+    Returns the instance of the identity map of the context for the record of the instance
+    built from a query, registering it when the map has none.
+
+    The partial instances, from `only()` or `defer()`, are not registered and the ones
+    without the secrets are kept apart.
+    """
+    identity_map = get_identity_map()
+    if identity_map is None or exclude_secrets or instance.pk is None:
+        return instance
+    if partial:
+        existing = identity_map.get(instance.__class__, instance.table.schema, instance.pk)
+        return existing if existing is not None else instance
+    return identity_map.add(instance)
+
+
+def load_from_identity_map(instance: "Model") -> bool:
+    """
+    Fills the instance with the values of its record in the identity map of the context,
+    without querying. Returns whether it was loaded.
+    """
+    identity_map = get_identity_map()
+    if identity_map is None or instance.pk is None:
+        return False
+
+    existing = identity_map.get(instance.__class__, instance.table.schema, instance.pk)
+    if existing is None or existing is instance or not is_loaded(existing):
+        return False
+    identity_map.queries_avoided += 1
+    _fill(instance, existing)
+    return True
+
+
+def invalidate(
+    instance: Optional["Model"] = None, table: Optional[sqlalchemy.Table] = None
+) -> None:
+    """
+    Drops the rows memoized and the instances of the identity map in the context after a
+    write, of the instance or else of the whole table.
+    """
+    loader = get_dataloader()
+    identity_map = get_identity_map()
+    if instance is not None:
+        if loader is not None:
+            loader.forget(instance)
+        if identity_map is not None:
+            identity_map.discard(instance)
+    else:
+        if loader is not None:
+            loader.clear(table)
+        if identity_map is not None:
+            identity_map.clear(table)
@@ -187,6 +187,9 @@ def _register_model_signals(model_class: Type["Model"]) -> None:
     signals.post_save = Signal()
     signals.post_update = Signal()
     signals.post_delete = Signal()
+    signals.pre_bulk_create = Signal()
+    signals.post_bulk_create = Signal()
+    signals.post_bulk_update = Signal()
     model_class.meta.signals = signals
 
 
@@ -448,15 +451,15 @@ class BaseModelMeta(type):
     def table(self, value: sqlalchemy.Table) -> None:
         self._table = value
 
-    def table_schema(cls, schema: str) -> Any:
+    def table_schema(cls, schema: Union[str, None]) -> Any:
         """
-        Making sure the tables on inheritance state, creates the new
-        one properly.
+        Returns the table of the model for a given schema.
 
-        The use of context vars instead of using the lru_cache comes from
-        a warning from `ruff` where lru can lead to memory leaks.
+        The tables are cached per model and schema in the bounded table cache
+        of the registry instead of using the lru_cache, which `ruff` warns that
+        can lead to memory leaks.
         """
-        return cls.build(schema=schema)
+        return cls.meta.registry.table_cache.get_table(cls, schema)
 
     @property
     def signals(cls) -> "Broadcaster":
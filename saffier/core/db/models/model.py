@@ -1,11 +1,19 @@
 import typing
 from typing import Any, Type, Union
 
+import sqlalchemy
+
+from saffier.core.db.caches import get_table_key
+from saffier.core.db.context_vars import get_dataloader, get_identity_map
 from saffier.core.db.models.base import SaffierBaseReflectModel
+from saffier.core.db.models.loaders import invalidate, is_strict_loading, load_from_identity_map
 from saffier.core.db.models.mixins.generics import DeclarativeMixin
 from saffier.core.db.models.row import ModelRow
-from saffier.core.utils.schemas import Schema
+from saffier.core.db.querysets.base import QuerySet
+from saffier.core.db.querysets.expressions import resolve_expression, split_expressions
+from saffier.core.utils.db import supports_insert_returning, supports_update_returning
 from saffier.core.utils.sync import run_sync
+from saffier.exceptions import QuerySetError, RelationshipNotLoaded
 
 saffier_setattr = object.__setattr__
 
@@ -69,20 +77,45 @@ class Model(ModelRow, DeclarativeMixin):
     async def update(self, **kwargs: typing.Any) -> typing.Any:
         """
         Update operation of the database fields.
+
+        The expressions, like `F("views") + 1`, are not validated and the values computed
+        by the database are loaded back into the instance.
         """
         await self.signals.pre_update.send(sender=self.__class__, instance=self)
 
-        fields = {key: field.validator for key, field in self.fields.items() if key in kwargs}
-        validator = Schema(fields=fields)
-        kwargs = self._update_auto_now_fields(validator.check(kwargs), self.fields)
+        kwargs, expressions = split_expressions(kwargs)
+        kwargs = self.get_validator(kwargs, auto_now=True).check(kwargs)
+        values = {
+            **kwargs,
+            **{key: resolve_expression(value, self.table) for key, value in expressions.items()},
+        }
         pk_column = getattr(self.table.c, self.pkname)
-        expression = self.table.update().values(**kwargs).where(pk_column == self.pk)
-        await self.database.execute(expression)
+        expression = self.table.update().values(**values).where(pk_column == self.pk)
+
+        # Server generated values not loaded yet come back with the update itself.
+        expression_columns = [self.table.columns[key] for key in expressions]
+        refresh_columns = [*self._get_refresh_columns(values), *expression_columns]
+        if refresh_columns and supports_update_returning(self.database):
+            row = await self.database.fetch_one(expression.returning(*refresh_columns))
+            if row is not None:
+                for column in refresh_columns:
+                    setattr(self, column.key, row[column])
+        else:
+            await self.database.execute(expression)
+            if expression_columns:
+                row = await self.database.fetch_one(
+                    sqlalchemy.select(*expression_columns).where(pk_column == self.pk)
+                )
+                for column in expression_columns:
+                    setattr(self, column.key, row[column])
+        invalidate(self)
+        await self._invalidate_results()
         await self.signals.post_update.send(sender=self.__class__, instance=self)
 
         # Update the model instance.
         for key, value in kwargs.items():
             setattr(self, key, value)
+        self.take_snapshot(list(values))
 
         return self
 
@@ -94,26 +127,112 @@ class Model(ModelRow, DeclarativeMixin):
         expression = self.table.delete().where(pk_column == self.pk)
 
         await self.database.execute(expression)
+        invalidate(self)
+        await self._invalidate_results()
         await self.signals.post_delete.send(sender=self.__class__, instance=self)
 
     async def load(self) -> None:
-        # Build the select expression.
-        pk_column = getattr(self.table.c, self.pkname)
-        expression = self.table.select().where(pk_column == self.pk)
+        """
+        Loads the fields of the instance from the database, batched with the other lookups
+        of the data loader when one is active in the context.
+
+        With an identity map in the context, the records already in the map are not queried
+        and the instance loaded is added to it.
+        """
+        if load_from_identity_map(self):
+            return
+
+        loader = get_dataloader()
+        if loader is not None:
+            row = await loader.load(self)
+        else:
+            # Build the select expression.
+            pk_column = getattr(self.table.c, self.pkname)
+            expression = self.table.select().where(pk_column == self.pk)
+
+            # Perform the fetch.
+            row = await self.database.fetch_one(expression)
 
-        # Perform the fetch.
-        row = await self.database.fetch_one(expression)
+        self._apply_row(row)
+        identity_map = get_identity_map()
+        if identity_map is not None:
+            identity_map.add(self)
 
-        # Update the instance.
+    async def _invalidate_results(self) -> None:
+        """
+        Removes the cached results reading the table of the instance, after a write.
+        """
+        result_cache = self.meta.registry.result_cache  # type: ignore
+        await result_cache.invalidate({get_table_key(self.table)})
+
+    def _load_from_context(self) -> bool:
+        """
+        Loads the instance from the records already loaded in the context, by the data loader
+        or the identity map. Returns whether it was loaded.
+        """
+        loader = get_dataloader()
+        row = loader.get_loaded(self) if loader is not None else None
+        if row is not None:
+            self._apply_row(row)
+            return True
+        return load_from_identity_map(self)
+
+    def _apply_row(self, row: Any) -> None:
+        """
+        Updates the instance with the values of the row loaded.
+        """
         for key, value in dict(row._mapping).items():
             setattr(self, key, value)
+        self.take_snapshot()
+
+    def _get_refresh_columns(self, values: typing.Any) -> typing.List[typing.Any]:
+        """
+        The columns with a `server_default` neither loaded in the instance nor being saved.
+        """
+        return [
+            self.table.columns[name]
+            for name, field in self.fields.items()
+            if field.server_default is not None
+            and name not in self.__dict__
+            and name not in values
+            and name in self.table.columns
+        ]
+
+    def _get_insert_expression(self) -> typing.Any:
+        """
+        Returns the insert of the table returning all the columns, built once per table
+        and kept in the registry `statement_cache`.
+        """
+        statement_cache = self.meta.registry.statement_cache  # type: ignore
+        key = ("insert", self.table)
+
+        expression = statement_cache.get(key)
+        if expression is None:
+            expression = self.table.insert().returning(*self.table.columns)
+            statement_cache.set(key, expression)
+        return expression
 
     async def _save(self, **kwargs: typing.Any) -> "Model":
         """
         Performs the save instruction.
+
+        On dialects supporting `RETURNING` the primary key and the server generated values
+        come back with the insert itself.
         """
+        if supports_insert_returning(self.database):
+            expression = self._get_insert_expression().values(**kwargs)
+            row = await self.database.fetch_one(expression)
+            await self._invalidate_results()
+            for column in self.table.columns:
+                if column.key == self.pkname:
+                    saffier_setattr(self, self.pkname, row[column])
+                elif column.key not in kwargs and column.key in self.fields:
+                    setattr(self, column.key, row[column])
+            return self
+
         expression = self.table.insert().values(**kwargs)
         awaitable = await self.database.execute(expression)
+        await self._invalidate_results()
         if not awaitable:
             awaitable = kwargs.get(self.pkname)
         saffier_setattr(self, self.pkname, awaitable)
@@ -123,12 +242,16 @@ class Model(ModelRow, DeclarativeMixin):
         self,
         force_save: bool = False,
         values: typing.Any = None,
+        update_fields: typing.Optional[typing.Sequence[str]] = None,
         **kwargs: typing.Any,
     ) -> Union[Type["Model"], Any]:
         """
         Performs a save of a given model instance.
         When creating a user it will make sure it can update existing or
         create a new one.
+
+        When updating, only the fields changed since the instance was loaded (or the
+        `update_fields`) are sent and nothing is executed if none changed.
         """
         await self.signals.pre_save.send(sender=self.__class__, instance=self)
 
@@ -139,40 +262,103 @@ class Model(ModelRow, DeclarativeMixin):
 
         self.update_from_dict(dict(extracted_fields.items()))
 
-        fields = {
-            key: field.validator for key, field in self.fields.items() if key in extracted_fields
-        }
+        is_create = getattr(self, "pk", None) is None or force_save
+        if not is_create:
+            changed_fields = self._get_fields_to_update(update_fields)
+            if changed_fields is not None:
+                extracted_fields = {
+                    key: value for key, value in extracted_fields.items() if key in changed_fields
+                }
+
+        extracted_fields, expressions = split_expressions(extracted_fields)
+        if expressions and is_create:
+            raise QuerySetError(
+                detail=f"Expressions cannot be used to create a record: {', '.join(expressions)}."
+            )
+
         if values:
             kwargs = self._update_auto_now_fields(values, self.fields)
         else:
-            validator = Schema(fields=fields)
-            kwargs = self._update_auto_now_fields(validator.check(extracted_fields), self.fields)
+            validator = self.get_validator(extracted_fields, auto_now=True)
+            kwargs = validator.check(extracted_fields)
+        kwargs.update(expressions)
 
         # Performs the update or the create based on a possible existing primary key
-        if getattr(self, "pk", None) is None or force_save:
+        if is_create:
             await self._save(**kwargs)
-        else:
+        elif extracted_fields or expressions:
             await self.signals.pre_update.send(sender=self.__class__, instance=self, kwargs=kwargs)
             await self.update(**kwargs)
             await self.signals.post_update.send(sender=self.__class__, instance=self)
 
-        # Refresh the results
-        if any(
-            field.server_default is not None
-            for name, field in self.fields.items()
-            if name not in extracted_fields
-        ):
+        # Refresh the results, only needed when the dialect could not return them.
+        if self._get_refresh_columns(extracted_fields):
             await self.load()
+        else:
+            self.take_snapshot()
 
         await self.signals.post_save.send(sender=self.__class__, instance=self)
         return self
 
+    def _get_fields_to_update(
+        self, update_fields: typing.Optional[typing.Sequence[str]] = None
+    ) -> typing.Optional[typing.Set[str]]:
+        """
+        The fields sent by the update of the `save()`, the `update_fields` or the changed
+        ones. `None` when unknown, sending all of them.
+        """
+        if update_fields is None:
+            return self.get_dirty_fields()
+
+        unknown_fields = [name for name in update_fields if name not in self.fields]
+        if unknown_fields:
+            names = ", ".join(unknown_fields)
+            raise ValueError(f"The fields {names} do not exist in {self.__class__.__name__}.")
+        return set(update_fields)
+
+    async def upsert(
+        self,
+        conflict_fields: typing.Optional[typing.List[str]] = None,
+        update_fields: typing.Optional[typing.List[str]] = None,
+    ) -> "Model":
+        """
+        Inserts the instance or updates the existing record conflicting on the
+        `conflict_fields`, the primary key by default, in one statement.
+        """
+        columns = self.table.columns
+        values = {key: value for key, value in self.__dict__.items() if key in columns}
+        if getattr(self, "pk", None) is None:
+            values.pop(self.pkname, None)
+
+        queryset = QuerySet(self.__class__, table=self.table)
+        instance = await queryset.upsert(
+            conflict_fields or [self.pkname], update_fields=update_fields, **values
+        )
+
+        for key, value in instance.__dict__.items():
+            if key in columns:
+                setattr(self, key, value)
+        return self
+
     def __getattr__(self, name: str) -> Any:
         """
         Run an one off query to populate any foreign key making sure
         it runs only once per foreign key avoiding multiple database calls.
+
+        The records already loaded in the context, by the data loader or the identity map, are
+        used without querying and, with the strict loading, raises `RelationshipNotLoaded`
+        instead of querying.
         """
         if name not in self.__dict__ and name in self.fields and name != self.pkname:
+            if self._load_from_context():
+                return self.__dict__[name]
+            if is_strict_loading():
+                raise RelationshipNotLoaded(
+                    detail=(
+                        f"{self.__class__.__name__}.{name} is not loaded. "
+                        "Use load_related(), select_related() or load() before accessing it."
+                    )
+                )
             run_sync(self.load())
             return self.__dict__[name]
         return super().__getattr__(name)
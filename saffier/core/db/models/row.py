@@ -1,13 +1,13 @@
-import asyncio
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Type, Union, cast
+from typing import TYPE_CHECKING, Any, Dict, Optional, Sequence, Type, Union, cast
 
 from sqlalchemy.engine.result import Row
 
 from saffier.core.db.models.base import SaffierBaseModel
-from saffier.exceptions import QuerySetError
+from saffier.core.db.models.hydrators import ModelHydrator
+from saffier.core.db.models.loaders import get_identity
 
 if TYPE_CHECKING:  # pragma: no cover
-    from saffier import Model, Prefetch, QuerySet
+    from saffier import Model
 
 
 class ModelRow(SaffierBaseModel):
@@ -16,7 +16,6 @@ class ModelRow(SaffierBaseModel):
         cls,
         row: Row,
         select_related: Optional[Sequence[Any]] = None,
-        prefetch_related: Optional[Sequence["Prefetch"]] = None,
         is_only_fields: bool = False,
         only_fields: Sequence[str] = None,
         is_defer_fields: bool = False,
@@ -35,11 +34,20 @@ class ModelRow(SaffierBaseModel):
         If there is no select_related, then goes through the related field where it **should**
         only return the instance of the the ForeignKey with the ID, making it lazy loaded.
 
+        Queries without `only()` or `defer()` go through the compiled hydrator of the shape.
+
+        With an identity map in the context, returns the instance already in the map for the
+        record.
+
         :return: Model class.
         """
         item: Dict[str, Any] = {}
         select_related = select_related or []
-        prefetch_related = prefetch_related or []
+
+        if not is_only_fields and not is_defer_fields:
+            hydrator = cls.get_hydrator(select_related, exclude_secrets)
+            instance = get_identity(hydrator(row, using_schema), exclude_secrets=exclude_secrets)
+            return cast("Type[Model]", instance)
 
         secret_fields = (
             [name for name, field in cls.fields.items() if field.secret] if exclude_secrets else []
@@ -98,67 +106,58 @@ class ModelRow(SaffierBaseModel):
             if related not in secret_fields:
                 item[related] = model_related.proxy_model(**child_item)
 
-        # Check for the only_fields
-        if is_only_fields or is_defer_fields:
-            mapping_fields = (
-                [str(field) for field in only_fields] if is_only_fields else list(row.keys())  # type: ignore
-            )
-
-            for column, value in row._mapping.items():
-                if column in secret_fields:
-                    continue
-                # Making sure when a table is reflected, maps the right fields of the ReflectModel
-                if column not in mapping_fields:
-                    continue
-
-                if column not in item:
-                    item[column] = value
-
-            # We need to generify the model fields to make sure we can populate the
-            # model without mandatory fields
-            model = cast("Type[Model]", cls.proxy_model(**item))
+        # Only the only_fields and defer_fields reach this point
+        mapping_fields = (
+            [str(field) for field in only_fields] if is_only_fields else list(row.keys())  # type: ignore
+        )
 
-            # Apply the schema to the model
-            model = cls.__apply_schema(model, using_schema)
+        for column, value in row._mapping.items():
+            if column in secret_fields:
+                continue
+            # Making sure when a table is reflected, maps the right fields of the ReflectModel
+            if column not in mapping_fields:
+                continue
 
-            model = cls.__handle_prefetch_related(
-                row=row, model=model, prefetch_related=prefetch_related
-            )
-            return model
-        else:
-            # Pull out the regular column values.
-            for column in cls.table.columns:
-                if column.name in secret_fields:
-                    continue
-                # Making sure when a table is reflected, maps the right fields of the ReflectModel
-                if column.name not in cls.fields.keys():
-                    continue
-                elif column.name not in item:
-                    item[column.name] = row[column]
+            if column not in item:
+                item[column] = value
 
-        model = (
-            cast("Type[Model]", cls(**item))
-            if not exclude_secrets
-            else cast("Type[Model]", cls.proxy_model(**item))
-        )
+        # We need to generify the model fields to make sure we can populate the
+        # model without mandatory fields
+        model = cast("Type[Model]", cls.proxy_model(**item))
+        model.take_snapshot()
 
         # Apply the schema to the model
         model = cls.__apply_schema(model, using_schema)
-
-        # Handle prefetch related fields.
-        model = cls.__handle_prefetch_related(
-            row=row, model=model, prefetch_related=prefetch_related
+        return cast(
+            "Type[Model]",
+            get_identity(model, partial=True, exclude_secrets=exclude_secrets),  # type: ignore
         )
 
-        if using_schema is not None:
-            model.table = model.build(using_schema)  # type: ignore
-        return model
+    @classmethod
+    def get_hydrator(
+        cls, select_related: Sequence[str] = (), exclude_secrets: bool = False
+    ) -> ModelHydrator:
+        """
+        Returns the compiled hydrator of the model for the given shape, cached in the
+        registry and created again if the model definition changed.
+        """
+        hydrator_cache = cls.meta.registry.hydrator_cache  # type: ignore
+        key = (cls, tuple(select_related), exclude_secrets)
+
+        hydrator: Optional[ModelHydrator] = hydrator_cache.get(key)
+        if hydrator is None or not hydrator.is_valid():
+            hydrator = ModelHydrator(
+                cls, select_related=select_related, exclude_secrets=exclude_secrets  # type: ignore
+            )
+            hydrator_cache.set(key, hydrator)
+        return hydrator
 
     @classmethod
     def __apply_schema(cls, model: Type["Model"], schema: Optional[str] = None) -> Type["Model"]:
         # Apply the schema to the model
         if schema is not None:
-            model.table = model.build(schema)  # type: ignore
+            model_class = model if isinstance(model, type) else model.__class__
+            model.table = model_class.table_schema(schema)  # type: ignore
         return model
 
     @classmethod
@@ -173,138 +172,3 @@ class ModelRow(SaffierBaseModel):
             if related_name in fields:
                 return True
         return False
-
-    @classmethod
-    def __handle_prefetch_related(
-        cls,
-        row: Row,
-        model: Type["Model"],
-        prefetch_related: Sequence["Prefetch"],
-        parent_cls: Optional[Type["Model"]] = None,
-        original_prefetch: Optional["Prefetch"] = None,
-        is_nested: bool = False,
-    ) -> Type["Model"]:
-        """
-        Handles any prefetch related scenario from the model.
-        Loads in advance all the models needed for a specific record
-
-        Recursively checks for the related field and validates if there is any conflicting
-        attribute. If there is, a `QuerySetError` is raised.
-        """
-        if not parent_cls:
-            parent_cls = model
-
-        for related in prefetch_related:
-            if not original_prefetch:
-                original_prefetch = related
-
-            if original_prefetch and not is_nested:
-                original_prefetch = related
-
-            # Check for conflicting names
-            # If to_attr has the same name of any
-            if hasattr(parent_cls, original_prefetch.to_attr):
-                raise QuerySetError(
-                    f"Conflicting attribute to_attr='{original_prefetch.related_name}' with '{original_prefetch.to_attr}' in {parent_cls.__class__.__name__}"
-                )
-
-            if "__" in related.related_name:
-                first_part, remainder = related.related_name.split("__", 1)
-                model_cls = cls.meta.related_fields[first_part].related_to
-
-                # Build the new nested Prefetch object
-                remainder_prefetch = related.__class__(
-                    related_name=remainder, to_attr=related.to_attr, queryset=related.queryset
-                )
-
-                # Recursively continue the process of handling the
-                # new prefetch
-                model_cls.__handle_prefetch_related(
-                    row,
-                    model,
-                    prefetch_related=[remainder_prefetch],
-                    original_prefetch=original_prefetch,
-                    parent_cls=model,
-                    is_nested=True,
-                )
-
-            # Check for individual not nested querysets
-            elif related.queryset is not None and not is_nested:
-                filter_by_pk = row[cls.pkname]
-                extra = {f"{related.related_name}__id": filter_by_pk}
-                related.queryset.extra = extra
-
-                # Execute the queryset
-                records = asyncio.get_event_loop().run_until_complete(
-                    cls.__run_query(queryset=related.queryset)
-                )
-                setattr(model, related.to_attr, records)
-            else:
-                model_cls = getattr(cls, related.related_name).related_from
-                records = cls.__process_nested_prefetch_related(
-                    row,
-                    prefetch_related=related,
-                    original_prefetch=original_prefetch,
-                    parent_cls=model,
-                    queryset=original_prefetch.queryset,
-                )
-
-                setattr(model, related.to_attr, records)
-        return model
-
-    @classmethod
-    def __process_nested_prefetch_related(
-        cls,
-        row: Row,
-        prefetch_related: "Prefetch",
-        parent_cls: Type["Model"],
-        original_prefetch: "Prefetch",
-        queryset: "QuerySet",
-    ) -> List[Type["Model"]]:
-        """
-        Processes the nested prefetch related names.
-        """
-        query_split = original_prefetch.related_name.split("__")
-        query_split.reverse()
-        query_split.pop(query_split.index(prefetch_related.related_name))
-
-        # Get the model to query related
-        model_class = getattr(cls, prefetch_related.related_name).related_from
-
-        # Get the foreign key name from the model_class
-        foreign_key_name = model_class.meta.related_names_mapping[prefetch_related.related_name]
-
-        # Insert as the entry point of the query
-        query_split.insert(0, foreign_key_name)
-
-        # Build new filter
-        query = "__".join(query_split)
-
-        # Extact foreign key value
-        filter_by_pk = row[parent_cls.pkname]
-
-        extra = {f"{query}__id": filter_by_pk}
-
-        records = asyncio.get_event_loop().run_until_complete(
-            cls.__run_query(model_class, extra, queryset)
-        )
-        return records
-
-    @classmethod
-    async def __run_query(
-        cls,
-        model: Optional[Type["Model"]] = None,
-        extra: Optional[Dict[str, Any]] = None,
-        queryset: Optional["QuerySet"] = None,
-    ) -> Union[List[Type["Model"]], Any]:
-        """
-        Runs a specific query against a given model with filters.
-        """
-
-        if not queryset:
-            return await model.query.filter(**extra)  # type: ignore
-
-        if extra:
-            queryset.extra = extra
-
-        return await queryset
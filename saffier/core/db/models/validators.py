@@ -0,0 +1,192 @@
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, List, Optional, Sequence, Tuple, Type
+
+from saffier.core.db.fields import DateField, DateTimeField, ForeignKey
+from saffier.core.db.fields._internal import SaffierField
+from saffier.core.db.fields.columns import ColumnCheck, get_column_check
+from saffier.core.utils.base import Message
+from saffier.core.utils.schemas import Schema
+from saffier.exceptions import ValidationError
+
+if TYPE_CHECKING:  # pragma: no cover
+    from saffier import Model
+
+schema = Schema(fields={})
+INVALID_KEY = schema.get_error_message("invalid_key")
+REQUIRED = schema.get_error_message("required")
+
+
+class ModelValidator:
+    """
+    Validates the values written into a model for a given set of fields.
+
+    Everything that only depends on the fields (the required ones, the validators to
+    run, the defaults of the missing values and the `auto_now` fields) is resolved once
+    when the validator is created, leaving for each call only the checks of the values.
+
+    The errors are the same raised by the `Schema` of the fields.
+
+    :param names: The fields being written. `None` validates the creation of a record,
+        with all the fields and the defaults of the read only ones.
+    :param auto_now: Sets the values of the `auto_now` fields of the model.
+    """
+
+    def __init__(
+        self,
+        model_class: Type["Model"],
+        names: Optional[FrozenSet[str]] = None,
+        auto_now: bool = False,
+    ) -> None:
+        self.model_class = model_class
+        self.fields = model_class.fields
+        self.fields_count = len(self.fields)
+
+        validators: Dict[str, SaffierField] = {
+            key: field.validator
+            for key, field in self.fields.items()
+            if names is None or key in names
+        }
+        self.required: Tuple[str, ...] = tuple(
+            key
+            for key, validator in validators.items()
+            if not (validator.read_only or validator.has_default())
+        )
+        self.checks: Tuple[Tuple[str, SaffierField, bool], ...] = tuple(
+            (key, validator, validator.has_default())
+            for key, validator in validators.items()
+            if not validator.read_only
+        )
+
+        self.column_checks: Dict[str, Optional[ColumnCheck]] = {
+            key: get_column_check(validator) for key, validator, _ in self.checks
+        }
+        self.foreign_keys: FrozenSet[str] = frozenset(
+            key for key, field in self.fields.items() if isinstance(field, ForeignKey)
+        )
+
+        generated: List[Tuple[str, SaffierField]] = []
+        if names is None:
+            generated.extend(
+                (key, validator)
+                for key, validator in validators.items()
+                if validator.read_only and validator.has_default()
+            )
+        if auto_now:
+            generated.extend(
+                (key, field.validator)
+                for key, field in self.fields.items()
+                if isinstance(field, (DateField, DateTimeField)) and field.auto_now
+            )
+        self.generated: Tuple[Tuple[str, SaffierField], ...] = tuple(generated)
+
+    def is_valid(self) -> bool:
+        """
+        Checks if the model definition changed since the validator was created.
+        """
+        fields = self.model_class.fields
+        return self.fields is fields and self.fields_count == len(fields)
+
+    def check(self, values: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Validates the values, returning the ones to write.
+        """
+        validated: Dict[str, Any] = {}
+        error_messages: List[Message] = []
+
+        for key in values:
+            if not isinstance(key, str):
+                error_messages.append(Message(text=INVALID_KEY, code="required", index=[key]))
+
+        for key in self.required:
+            if key not in values:
+                error_messages.append(Message(text=REQUIRED, code="required", index=[key]))
+
+        for key, validator, has_default in self.checks:
+            if key not in values:
+                if has_default:
+                    validated[key] = validator.get_default_value()
+                continue
+
+            try:
+                validated[key] = validator.check(values[key])
+            except ValidationError as error:
+                error_messages += error.messages(prefix=key)
+
+        if error_messages:
+            raise ValidationError(messages=error_messages)
+        return self.add_generated(validated)
+
+    def check_many(self, rows: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Validates the values of many records column by column, returning the ones to write.
+
+        Each column is checked at once and only the values not accepted as they are go
+        through the validator of the field. The errors of all the records are raised
+        together, the same of `check()` with the position of the record as first index.
+        """
+        validated: List[Dict[str, Any]] = [{} for _ in rows]
+        error_messages: List[Message] = []
+
+        for position, values in enumerate(rows):
+            for key in values:
+                if not isinstance(key, str):
+                    error_messages.append(
+                        Message(text=INVALID_KEY, code="required", index=[position, key])
+                    )
+
+            for key in self.required:
+                if key not in values:
+                    error_messages.append(
+                        Message(text=REQUIRED, code="required", index=[position, key])
+                    )
+
+        for key, validator, has_default in self.checks:
+            positions: List[int] = []
+            column: List[Any] = []
+            for position, values in enumerate(rows):
+                if key in values:
+                    positions.append(position)
+                    column.append(values[key])
+                elif has_default:
+                    validated[position][key] = validator.get_default_value()
+
+            column_check = self.column_checks[key]
+            if column_check is None:
+                indexes: Sequence[int] = range(len(column))
+            else:
+                for position, value in zip(positions, column):
+                    validated[position][key] = value
+                indexes = column_check(column)
+
+            for index in indexes:
+                position = positions[index]
+                try:
+                    validated[position][key] = validator.check(column[index])
+                except ValidationError as error:
+                    for message in error.messages(prefix=key):
+                        message.index.insert(0, position)
+                        error_messages.append(message)
+
+        if error_messages:
+            error_messages.sort(key=lambda message: message.index[0])
+            raise ValidationError(messages=error_messages)
+        return [self.add_generated(values) for values in validated]
+
+    def trust(self, values: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Returns the values to write without checking them, only adding the defaults of
+        the missing values and the primary keys of the related instances.
+        """
+        validated: Dict[str, Any] = {}
+        foreign_keys = self.foreign_keys
+        for key, validator, has_default in self.checks:
+            if key in values:
+                value = values[key]
+                validated[key] = validator.check(value) if key in foreign_keys else value
+            elif has_default:
+                validated[key] = validator.get_default_value()
+        return self.add_generated(validated)
+
+    def add_generated(self, values: Dict[str, Any]) -> Dict[str, Any]:
+        for key, validator in self.generated:
+            values[key] = validator.get_default_value()
+        return values
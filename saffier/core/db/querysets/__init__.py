@@ -1,6 +1,22 @@
+from .aggregates import Avg, Count, Max, Min, Sum
 from .base import QuerySet
 from .clauses import and_, not_, or_
+from .expressions import F
+from .pagination import Page
 from .prefetch import Prefetch
 
 __all__ = ["QuerySet", "Prefetch"]
-__all__ = ["QuerySet", "Prefetch", "and_", "not_", "or_"]
+__all__ = [
+    "Avg",
+    "Count",
+    "F",
+    "Max",
+    "Min",
+    "QuerySet",
+    "Page",
+    "Prefetch",
+    "Sum",
+    "and_",
+    "not_",
+    "or_",
+]
@@ -0,0 +1,73 @@
+from typing import Any, ClassVar, Optional
+
+import sqlalchemy
+
+from saffier.exceptions import QuerySetError
+
+
+class Aggregate:
+    """
+    Base of the aggregate functions computed by the database, used by the `aggregate()`
+    and the `annotate()` of the queryset.
+
+    The field can be of a related model via `__`, for example `author__age`.
+    """
+
+    function: ClassVar[str]
+
+    def __init__(self, field: str, distinct: bool = False) -> None:
+        self.field = field
+        self.distinct = distinct
+
+    @property
+    def default_alias(self) -> str:
+        """
+        The name of the result when none is given, for example `amount__sum`.
+        """
+        if self.field == "*":
+            return self.function
+        return f"{self.field}__{self.function}"
+
+    def resolve(self, column: Optional[sqlalchemy.Column]) -> Any:
+        """
+        Returns the SQL function applied to the column of the field, `None` for `*`.
+        """
+        function = getattr(sqlalchemy.func, self.function)
+        if column is None:
+            if self.function != "count" or self.distinct:
+                raise QuerySetError(detail=f"{self!r} requires a field to aggregate.")
+            return function()
+
+        if self.distinct:
+            return function(sqlalchemy.distinct(column))
+        return function(column)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.field})"
+
+
+class Count(Aggregate):
+    """
+    Counts the records or, given a field, the records where the field is not null.
+    """
+
+    function = "count"
+
+    def __init__(self, field: str = "*", distinct: bool = False) -> None:
+        super().__init__(field, distinct=distinct)
+
+
+class Sum(Aggregate):
+    function = "sum"
+
+
+class Avg(Aggregate):
+    function = "avg"
+
+
+class Min(Aggregate):
+    function = "min"
+
+
+class Max(Aggregate):
+    function = "max"
@@ -1,4 +1,5 @@
 import copy
+import hashlib
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -16,18 +17,35 @@ from typing import (
 )
 
 import sqlalchemy
+from sqlalchemy.sql import util as sql_util
 
 import saffier
 from saffier.conf import settings
 from saffier.core.db import fields as saffier_fields
-from saffier.core.db.context_vars import get_schema
+from saffier.core.db.caches import get_statement_tables, get_table_key
+from saffier.core.db.context_vars import get_identity_map, get_schema
 from saffier.core.db.fields import CharField, TextField
+from saffier.core.db.models.loaders import invalidate
+from saffier.core.db.querysets.aggregates import Aggregate
+from saffier.core.db.querysets.expressions import Expression, resolve_expression, split_expressions
 from saffier.core.db.querysets.mixins import QuerySetPropsMixin, SaffierModel, TenancyMixin
+from saffier.core.db.querysets.pagination import PaginationMixin
 from saffier.core.db.querysets.prefetch import PrefetchMixin
 from saffier.core.db.querysets.protocols import AwaitableQuery
+from saffier.core.utils.db import (
+    BindCast,
+    chunked,
+    get_dialect,
+    get_max_bind_params,
+    supports_insert_returning,
+)
 from saffier.core.utils.models import DateParser
-from saffier.core.utils.schemas import Schema
-from saffier.exceptions import MultipleObjectsReturned, ObjectNotFound, QuerySetError
+from saffier.exceptions import (
+    MultipleObjectsReturned,
+    ObjectNotFound,
+    QuerySetError,
+    ValidationError,
+)
 from saffier.protocols.queryset import QuerySetProtocol
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -36,7 +54,12 @@ if TYPE_CHECKING:  # pragma: no cover
 
 
 class BaseQuerySet(
-    TenancyMixin, QuerySetPropsMixin, PrefetchMixin, DateParser, AwaitableQuery[SaffierModel]
+    TenancyMixin,
+    QuerySetPropsMixin,
+    PrefetchMixin,
+    PaginationMixin,
+    DateParser,
+    AwaitableQuery[SaffierModel],
 ):
     ESCAPE_CHARACTERS = ["%", "_"]
 
@@ -59,6 +82,8 @@ class BaseQuerySet(
         using_schema: Any = None,
         table: Any = None,
         exclude_secrets: Any = False,
+        annotations: Any = None,
+        cache: Any = None,
     ) -> None:
         super().__init__(model_class=model_class)
         self.model_class = cast("Type[Model]", model_class)
@@ -66,6 +91,7 @@ class BaseQuerySet(
         self.or_clauses = [] if or_clauses is None else or_clauses
         self.limit_count = limit_count
         self._select_related = [] if select_related is None else select_related
+        self._outer_related: Set[str] = set()
         self._prefetch_related = [] if prefetch_related is None else prefetch_related
         self._offset = limit_offset
         self._order_by = [] if order_by is None else order_by
@@ -74,10 +100,11 @@ class BaseQuerySet(
         self._only = [] if only_fields is None else only_fields
         self._defer = [] if defer_fields is None else defer_fields
         self._expression = None
-        self._cache = None
+        self._cache = cache
         self._m2m_related = m2m_related  # type: ignore
         self.using_schema = using_schema
         self._exclude_secrets = exclude_secrets or False
+        self._annotations: Dict[str, Aggregate] = {} if annotations is None else annotations
         self.extra: Dict[str, Any] = {}
 
         if self.is_m2m and not self._m2m_related:
@@ -100,6 +127,27 @@ class BaseQuerySet(
         expression = expression.group_by(*group_by)
         return expression
 
+    def _build_annotations_expression(
+        self, columns: List[Any], tables: List[sqlalchemy.Table], expression: Any
+    ) -> Any:
+        """
+        Adds the aggregates of the annotations to the select of the `tables`, the ones of
+        the model and its select related, leaving out the tables only joined by the
+        aggregates. Without an explicit `group_by`, the rows are grouped by the primary keys
+        of the selected tables.
+        """
+        selected = [
+            column
+            for column in expression.selected_columns
+            if getattr(column, "table", None) in tables
+        ]
+        expression = expression.with_only_columns(*selected, *columns)
+        if self._group_by:
+            return expression
+
+        group_by = [column for table in tables for column in table.primary_key.columns]
+        return expression.group_by(*group_by)
+
     def _build_filter_clauses_expression(self, filter_clauses: Any, expression: Any) -> Any:
         """Builds the filter clauses expression"""
         if len(filter_clauses) == 1:
@@ -163,6 +211,9 @@ class BaseQuerySet(
         When a table contains more than one foreign key pointing to the same
         destination table, a lookup for the related field is made to understand
         from which foreign key the table is looked up from.
+
+        The relationships only joined to project the values or to aggregate use outer joins,
+        keeping the rows without related records.
         """
         queryset: "QuerySet" = self._clone()
 
@@ -175,6 +226,7 @@ class BaseQuerySet(
             # For m2m relationships
             model_class = queryset.model_class
             select_from = queryset.table
+            isouter = item in queryset._outer_related
 
             for part in item.split("__"):
                 try:
@@ -188,7 +240,9 @@ class BaseQuerySet(
 
                 # If there is multiple FKs to the same table
                 if not has_many_fk_same_table:
-                    select_from = sqlalchemy.sql.join(select_from, table)  # type: ignore
+                    select_from = sqlalchemy.sql.join(  # type: ignore
+                        select_from, table, isouter=isouter
+                    )
                 else:
                     lookup_field = None
 
@@ -204,6 +258,7 @@ class BaseQuerySet(
                         select_from,
                         table,
                         select_from.c.id == getattr(table.c, lookup_field),
+                        isouter=isouter,
                     )
 
                 tables.append(table)
@@ -237,31 +292,110 @@ class BaseQuerySet(
         columns = list(set(columns))
         return columns
 
-    def _build_select(self) -> Any:
+    def _get_select_related_tables(self) -> List[sqlalchemy.Table]:
         """
-        Builds the query select based on the given parameters and filters.
+        Returns the tables of the related models joined by the select related.
         """
-        queryset: "QuerySet" = self._clone()
+        related_tables = []
+        for item in self._select_related:
+            model_class = self.model_class
+            for part in item.split("__"):
+                try:
+                    model_class = model_class.fields[part].target
+                except KeyError:
+                    model_class = getattr(model_class, part).related_from
+                related_tables.append(model_class.table)
+        return related_tables
+
+    def _select_shape(self) -> Any:
+        """
+        Returns the structural shape of the queryset select, excluding the filters, the
+        limit and the offset, which are applied on top of it with the values as bind params.
+
+        The tables of the related models are part of the shape as those can be switched
+        to a different schema.
+        """
+        return (
+            self.model_class,
+            self.table,
+            tuple(self._select_related),
+            tuple(sorted(self._outer_related)),
+            tuple(self._get_select_related_tables()),
+            tuple(str(field) for field in self._only),
+            tuple(self._defer),
+            self._exclude_secrets,
+            tuple(self._order_by),
+            tuple(self._group_by),
+            tuple(self.distinct_on),
+        )
 
-        queryset._validate_only_and_defer()
-        tables, select_from = queryset._build_tables_select_from_relationship()
+    def _build_select_base(self) -> Any:
+        """
+        Builds the select with the joins, columns, ordering, grouping and distinct of the
+        queryset.
+        """
+        tables, select_from = self._build_tables_select_from_relationship()
         expression = sqlalchemy.sql.select(*tables)
         expression = expression.select_from(select_from)
 
-        if queryset._only:
-            expression = expression.with_only_columns(*queryset._only)
+        if self._only:
+            expression = expression.with_only_columns(*self._only)
 
-        if queryset._defer:
-            columns = [
-                column for column in select_from.columns if column.name not in queryset._defer
-            ]
+        if self._defer:
+            columns = [column for column in select_from.columns if column.name not in self._defer]
             expression = expression.with_only_columns(*columns)
 
-        if queryset._exclude_secrets:
-            model_columns = queryset._secret_recursive_names(model_class=queryset.model_class)
+        if self._exclude_secrets:
+            model_columns = self._secret_recursive_names(model_class=self.model_class)
             columns = [column for column in select_from.columns if column.name in model_columns]
             expression = expression.with_only_columns(*columns)
 
+        if self._order_by:
+            expression = self._build_order_by_expression(self._order_by, expression=expression)
+
+        if self._group_by:
+            expression = self._build_group_by_expression(self._group_by, expression=expression)
+
+        if self.distinct_on:
+            expression = self._build_select_distinct(self.distinct_on, expression=expression)
+        return expression
+
+    def _build_select(self) -> Any:
+        """
+        Builds the query select based on the given parameters and filters.
+
+        The structure of the select is cached in the registry per queryset shape and the
+        filters, limit and offset are applied on top of it.
+        """
+        queryset: "QuerySet" = self._clone()
+        queryset._validate_only_and_defer()
+
+        # The related fields of the annotations and the grouping add their joins.
+        queryset._select_related = list(queryset._select_related)
+        selected_tables = [queryset.table, *queryset._get_select_related_tables()]
+        annotation_columns = queryset._get_annotation_columns()
+        for name in queryset._group_by:
+            if "__" in name:
+                queryset._get_values_column(name.lstrip("-"))
+
+        select_cache = queryset.model_class.meta.registry.select_cache
+        shape = queryset._select_shape()
+        try:
+            expression = select_cache.get(shape)
+        except TypeError:
+            # Unhashable shapes cannot be cached.
+            shape = expression = None
+
+        if expression is None:
+            expression = queryset._build_select_base()
+            if shape is not None:
+                select_cache.set(shape, expression)
+
+        if annotation_columns:
+            expression = queryset._build_annotations_expression(
+                annotation_columns, selected_tables, expression=expression
+            )
+
         if queryset.filter_clauses:
             expression = queryset._build_filter_clauses_expression(
                 queryset.filter_clauses, expression=expression
@@ -272,27 +406,12 @@ class BaseQuerySet(
                 queryset.or_clauses, expression=expression
             )
 
-        if queryset._order_by:
-            expression = queryset._build_order_by_expression(
-                queryset._order_by, expression=expression
-            )
-
         if queryset.limit_count:
             expression = expression.limit(queryset.limit_count)
 
         if queryset._offset:
             expression = expression.offset(queryset._offset)
 
-        if queryset._group_by:
-            expression = queryset._build_group_by_expression(
-                queryset._group_by, expression=expression
-            )
-
-        if queryset.distinct_on:
-            expression = queryset._build_select_distinct(
-                queryset.distinct_on, expression=expression
-            )
-
         queryset._expression = expression  # type: ignore
         return expression
 
@@ -404,35 +523,115 @@ class BaseQuerySet(
                 limit_count=self.limit_count,
                 limit_offset=self._offset,
                 order_by=self._order_by,
+                group_by=self._group_by,
+                distinct_on=self.distinct_on,
                 only_fields=self._only,
                 defer_fields=self._defer,
                 m2m_related=self.m2m_related,
                 exclude_secrets=self._exclude_secrets,
                 table=self.table,
                 using_schema=self.using_schema,
+                annotations=self._annotations,
+                cache=self._cache,
             ),
         )
 
     def _validate_kwargs(self, **kwargs: Any) -> Any:
-        fields = self.model_class.fields
-        validator = Schema(fields={key: value.validator for key, value in fields.items()})
-        kwargs = validator.check(kwargs)
-        for key, value in fields.items():
-            if value.validator.read_only and value.validator.has_default():
-                kwargs[key] = value.validator.get_default_value()
-        return kwargs
+        return self.model_class.get_validator().check(kwargs)
 
     def _prepare_order_by(self, order_by: str) -> Any:
         reverse = order_by.startswith("-")
         order_by = order_by.lstrip("-")
-        order_col = self.table.columns[order_by]
+        if order_by in self._annotations:
+            order_col = sqlalchemy.column(order_by)
+        else:
+            order_col = self.table.columns[order_by]
         return order_col.desc() if reverse else order_col
 
     def _prepare_group_by(self, group_by: str) -> Any:
         group_by = group_by.lstrip("-")
+        if "__" in group_by:
+            return self._get_values_column(group_by)
         group_col = self.table.columns[group_by]
         return group_col
 
+    def _get_values_column(self, name: str, isouter: bool = False) -> sqlalchemy.Column:
+        """
+        Returns the column of a field, following the relationships declared with `__` and
+        adding the joins needed to the select related of the queryset.
+
+        With `isouter`, the relationships not already selected are joined with outer joins,
+        so the rows without a related record return `None`.
+        """
+        *related_parts, field_name = name.split("__")
+        model_class = self.model_class
+        table = self.table
+
+        if related_parts:
+            related = "__".join(related_parts)
+            if related not in self._select_related:
+                self._select_related.append(related)
+                if isouter:
+                    self._outer_related.add(related)
+
+            for part in related_parts:
+                try:
+                    model_class = model_class.fields[part].target
+                except KeyError:
+                    related_field = getattr(model_class, part, None)
+                    if related_field is None or not hasattr(related_field, "related_from"):
+                        raise QuerySetError(
+                            detail=f"{name} does not exist in the results."
+                        ) from None
+                    model_class = related_field.related_from
+            table = model_class.table
+
+        field = model_class.fields.get(field_name)
+        if (
+            field is None
+            or isinstance(field, saffier_fields.ManyToManyField)
+            or field_name not in table.columns
+        ):
+            raise QuerySetError(detail=f"{name} does not exist in the results.")
+        return table.columns[field_name]
+
+    def _get_annotation_columns(self) -> List[Any]:
+        """
+        Returns the labelled aggregates of the annotations, adding the joins of the
+        related fields to the select related.
+        """
+        return [
+            self._resolve_aggregate(aggregate).label(name)
+            for name, aggregate in self._annotations.items()
+        ]
+
+    def _resolve_aggregate(self, aggregate: Aggregate) -> Any:
+        """
+        Resolves the aggregate, joining its related fields with outer joins so the records
+        without related ones are still aggregated, like a `Count` of `0`.
+        """
+        column = (
+            None
+            if aggregate.field == "*"
+            else self._get_values_column(aggregate.field, isouter=True)
+        )
+        return aggregate.resolve(column)
+
+    def _get_aggregates(
+        self, args: Sequence[Aggregate], kwargs: Dict[str, Aggregate]
+    ) -> Dict[str, Aggregate]:
+        """
+        Returns the aggregates by name, the positional ones named after the field and
+        function, like `amount__sum`.
+        """
+        aggregates = {aggregate.default_alias: aggregate for aggregate in args}
+        aggregates.update(kwargs)
+
+        for name, aggregate in aggregates.items():
+            if not isinstance(aggregate, Aggregate):
+                raise QuerySetError(detail=f"{name} is not an aggregate.")
+        return aggregates
+
     def _prepare_fields_for_distinct(self, distinct_on: str) -> Any:
         _distinct_on: sqlalchemy.Column = self.table.columns[distinct_on]
         return _distinct_on
@@ -451,12 +650,13 @@ class BaseQuerySet(
             schema = get_schema()
             if self.using_schema is None and schema is not None:
                 self.using_schema = schema
-            queryset.model_class.table = self.model_class.build(self.using_schema)
+            queryset.model_class.table = self.model_class.table_schema(self.using_schema)
 
         queryset.filter_clauses = copy.copy(self.filter_clauses)
         queryset.or_clauses = copy.copy(self.or_clauses)
         queryset.limit_count = self.limit_count
         queryset._select_related = copy.copy(self._select_related)
+        queryset._outer_related = copy.copy(self._outer_related)
         queryset._prefetch_related = copy.copy(self._prefetch_related)
         queryset._offset = self._offset
         queryset._order_by = copy.copy(self._order_by)
@@ -471,6 +671,7 @@ class BaseQuerySet(
         queryset.table = self.table
         queryset.extra = self.extra
         queryset._exclude_secrets = self._exclude_secrets
+        queryset._annotations = copy.copy(self._annotations)
         queryset.using_schema = self.using_schema
 
         return queryset
@@ -593,6 +794,58 @@ class QuerySet(BaseQuerySet, QuerySetProtocol):
         queryset = queryset.filter(clause=clause, **kwargs)
         return queryset
 
+    def cache(self, ttl: Optional[float] = None) -> "QuerySet":
+        """
+        Caches the results of the queryset for `ttl` seconds, by default the
+        `result_cache_ttl` setting, in the `result_cache` of the registry.
+
+        The entries are keyed by the compiled statement, its parameters and the schema, and
+        are invalidated by the writes of Saffier to any of the tables read.
+        """
+        if ttl is None:
+            ttl = settings.result_cache_ttl
+        if ttl <= 0:
+            raise QuerySetError(detail="The ttl must be greater than zero.")
+
+        queryset: "QuerySet" = self._clone()
+        queryset._cache = ttl
+        return queryset
+
+    async def _fetch(self, method: str, expression: Any) -> Any:
+        """
+        Runs the `fetch_all`, `fetch_one` or `fetch_val` of the database, reading from and
+        storing into the result cache when enabled with `cache()`.
+        """
+        fetch = getattr(self.database, method)
+        if self._cache is None:
+            return await fetch(expression)
+
+        result_cache = self.model_class.meta.registry.result_cache
+        key = self._get_cache_key(method, expression)
+        found, value = await result_cache.get(key)
+        if found:
+            return value
+
+        value = await fetch(expression)
+        await result_cache.set(key, value, self._cache, get_statement_tables(expression))
+        return value
+
+    def _get_cache_key(self, method: str, expression: Any) -> str:
+        """
+        The key of the result cache, from the compiled statement, its parameters, the schema
+        and the database.
+        """
+        compiled = expression.compile(dialect=get_dialect(self.database))
+        key = f"{method}:{self.database.url}:{self.table.schema}:{compiled}:{compiled.params!r}"
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    async def _invalidate_results(self) -> None:
+        """
+        Removes the cached results reading the table of the queryset, after a write.
+        """
+        result_cache = self.model_class.meta.registry.result_cache
+        await result_cache.invalidate({get_table_key(self.table)})
+
     def lookup(self, term: Any) -> "QuerySet":
         """
         Broader way of searching for a given term
@@ -650,6 +903,29 @@ class QuerySet(BaseQuerySet, QuerySetProtocol):
         queryset._group_by = group_by
         return queryset
 
+    def annotate(self, *args: Aggregate, **kwargs: Aggregate) -> "QuerySet":
+        """
+        Adds the aggregates computed by the database to each result.
+
+        The models are grouped by primary key and have the aggregates as attributes. Combined
+        with the `group_by` and the `values()`, one aggregated row is returned per group.
+
+        Usage:
+
+        .. code-block:: python3
+
+            await Author.query.annotate(total=Sum("books__pages")).order_by("-total")
+            await Book.query.group_by("author").annotate(n=Count()).values(["author", "n"])
+        """
+        queryset: "QuerySet" = self._clone()
+        aggregates = queryset._get_aggregates(args, kwargs)
+
+        for name in aggregates:
+            if name in queryset.model_class.fields:
+                raise QuerySetError(detail=f"The annotation {name} conflicts with a field.")
+        queryset._annotations.update(aggregates)
+        return queryset
+
     def distinct(self, *distinct_on: str) -> "QuerySet":
         """
         Returns a queryset with distinct results.
@@ -697,6 +973,24 @@ class QuerySet(BaseQuerySet, QuerySetProtocol):
         queryset._select_related = related
         return queryset
 
+    def _get_values_fields(self, model_class: Type["Model"]) -> List[str]:
+        """
+        Returns the names of the fields returned by default by the values of a model,
+        in the order of the columns of the table.
+        """
+        if self._only and model_class is self.model_class:
+            return [str(field) for field in self._only]
+
+        names = []
+        for column in model_class.table.columns:
+            field = model_class.fields.get(column.name)
+            if field is None or isinstance(field, saffier_fields.ManyToManyField):
+                continue
+            if column.name in self._defer or (self._exclude_secrets and field.secret):
+                continue
+            names.append(column.name)
+        return names
+
     async def values(
         self,
         fields: Union[Sequence[str], str, None] = None,
@@ -707,35 +1001,82 @@ class QuerySet(BaseQuerySet, QuerySetProtocol):
     ) -> List[Any]:
         """
         Returns the results in a python dictionary format.
+
+        Only the columns of the fields are selected and the results are built directly from
+        the rows, without generating the models. The fields of the related models can be
+        used via `__`, for example `author__name`.
         """
         fields = fields or []
-        queryset: "QuerySet" = self._clone()
-        rows: List[Type["Model"]] = await queryset.all()
-
         if not isinstance(fields, list):
             raise QuerySetError(detail="Fields must be an iterable.")
 
-        if not fields:
-            rows = [row.model_dump(exclude=exclude, exclude_none=exclude_none) for row in rows]  # type: ignore
-        else:
-            rows = [
-                row.model_dump(exclude=exclude, exclude_none=exclude_none, include=fields)  # type: ignore
-                for row in rows
-            ]
+        queryset: "QuerySet" = self._clone()
+        if queryset.extra:
+            queryset = queryset.filter(**queryset.extra)
+
+        # For many to many, the values are the ones of the related model.
+        prefix = ""
+        model_class = queryset.model_class
+        if queryset.is_m2m:
+            queryset.distinct_on = [queryset.m2m_related]
+            prefix = f"{queryset.m2m_related}__"
+            model_class = model_class.fields[queryset.m2m_related].target
+
+        annotations = queryset._annotations
+        names = fields or [*queryset._get_values_fields(model_class), *annotations]
+        if exclude:
+            names = [name for name in names if name not in exclude]
 
         as_tuple = kwargs.pop("__as_tuple__", False)
+        if flatten and len(names) != 1:
+            raise QuerySetError(detail="Exactly one field is required to flatten the results.")
+
+        queryset._select_related = list(queryset._select_related)
+        columns = [
+            (
+                queryset._resolve_aggregate(annotations[name]).label(name)
+                if name in annotations
+                else queryset._get_values_column(f"{prefix}{name}", isouter=True)
+            )
+            for name in names
+        ]
 
-        if not as_tuple:
-            return rows
+        # With aggregates, one row per group of the `group_by` or the other values.
+        group_by = [
+            queryset._get_values_column(name.lstrip("-"), isouter=True)
+            for name in queryset._group_by
+        ]
+        if not group_by and any(name in annotations for name in names):
+            group_by = [column for name, column in zip(names, columns) if name not in annotations]
 
-        if not flatten:
-            rows = [tuple(row.values()) for row in rows]  # type: ignore
-        else:
-            try:
-                rows = [row[fields[0]] for row in rows]  # type: ignore
-            except KeyError:
-                raise QuerySetError(detail=f"{fields[0]} does not exist in the results.") from None
-        return rows
+        expression = queryset._build_select().with_only_columns(*columns)
+        if annotations:
+            expression = expression.group_by(None).group_by(*group_by)
+        queryset._set_query_expression(expression)
+        rows = await queryset._fetch("fetch_all", expression)
+
+        # The aggregates are read from the rows by their label.
+        keys = [name if name in annotations else column for name, column in zip(names, columns)]
+
+        if flatten:
+            key = keys[0]
+            return [row[key] for row in rows]
+
+        if as_tuple:
+            if not exclude_none:
+                return [tuple(row[key] for key in keys) for row in rows]
+            return [
+                tuple(value for value in (row[key] for key in keys) if value is not None)
+                for row in rows
+            ]
+
+        results = [{name: row[key] for name, key in zip(names, keys)} for row in rows]
+        if exclude_none:
+            results = [
+                {key: value for key, value in result.items() if value is not None}
+                for result in results
+            ]
+        return results
 
     async def values_list(
         self,
@@ -748,17 +1089,14 @@ class QuerySet(BaseQuerySet, QuerySetProtocol):
         Returns the results in a python dictionary format.
         """
         fields = fields or []
+        if isinstance(fields, str):
+            fields = [fields]
+
         if flat and len(fields) > 1:
             raise QuerySetError(
                 detail=f"Maximum of 1 in fields when `flat` is enables, got {len(fields)} instead."
             ) from None
 
-        if flat and isinstance(fields, str):
-            fields = [fields]
-
-        if isinstance(fields, str):
-            fields = [fields]
-
         return await self.values(
             fields=fields,
             exclude=exclude,
@@ -767,28 +1105,176 @@ class QuerySet(BaseQuerySet, QuerySetProtocol):
             __as_tuple__=True,
         )
 
+    def _is_row_per_record(self) -> bool:
+        """
+        Whether each row of the select is one record, without distinct, grouping, limit
+        or offset, allowing the count and existence checks to skip the full select.
+        """
+        return not (
+            self.distinct_on
+            or self._group_by
+            or self._annotations
+            or self.limit_count
+            or self._offset
+        )
+
+    def _get_cardinality_select_related(self) -> List[str]:
+        """
+        Returns the select related which can change the number of rows, the ones used by
+        the filters, the reverse relations and the nullable foreign keys. The joins of the
+        other foreign keys match exactly one row each.
+        """
+        filtered_tables = {
+            table.name
+            for clause in [*self.filter_clauses, *self.or_clauses]
+            for table in sql_util.find_tables(clause, check_columns=True)
+        }
+
+        related = []
+        for item in self._select_related:
+            model_class = self.model_class
+            for part in item.split("__"):
+                field = model_class.fields.get(part)
+                if (
+                    not isinstance(field, (saffier.ForeignKey, saffier.OneToOneField))
+                    or field.null
+                ):
+                    related.append(item)
+                    break
+                model_class = field.target
+                if model_class.table.name in filtered_tables:
+                    related.append(item)
+                    break
+        return related
+
+    def _build_cardinality_select(self, *columns: Any) -> Any:
+        """
+        Builds a select of the `columns` with the filters of the queryset and only the
+        joins changing the number of rows, without ordering.
+        """
+        queryset: "QuerySet" = self._clone()
+        queryset._select_related = queryset._get_cardinality_select_related()
+        _, select_from = queryset._build_tables_select_from_relationship()
+
+        expression = sqlalchemy.select(*columns).select_from(select_from)
+        if queryset.filter_clauses:
+            expression = queryset._build_filter_clauses_expression(
+                queryset.filter_clauses, expression=expression
+            )
+        if queryset.or_clauses:
+            expression = queryset._build_or_clauses_expression(
+                queryset.or_clauses, expression=expression
+            )
+        return expression
+
     async def exists(self, **kwargs: Any) -> bool:
         """
         Returns a boolean indicating if a record exists or not.
+
+        Compiles to `SELECT 1 ... LIMIT 1`, without the columns and the ordering.
         """
         queryset: "QuerySet" = self._clone()
-        expression = queryset._build_select()
-        expression = sqlalchemy.exists(expression).select()
+        if queryset._is_row_per_record():
+            expression = queryset._build_cardinality_select(sqlalchemy.literal_column("1"))
+        else:
+            expression = queryset._build_select().with_only_columns(sqlalchemy.literal_column("1"))
+        expression = expression.order_by(None).limit(1)
         queryset._set_query_expression(expression)
-        _exists = await queryset.database.fetch_val(expression)
-        return cast("bool", _exists)
+        _exists = await queryset._fetch("fetch_val", expression)
+        return _exists is not None
 
-    async def count(self, **kwargs: Any) -> int:
+    async def count(self, estimate: bool = False, **kwargs: Any) -> int:
         """
         Returns an indicating the total records.
+
+        Without distinct, grouping, limit or offset, compiles to `SELECT count(*) FROM table
+        WHERE ...` with only the joins changing the number of rows. Otherwise the select
+        is counted as a subquery, without the ordering.
+
+        With `estimate`, the number of records of the table is read from the statistics of
+        the PostgreSQL planner (`pg_class.reltuples`), which is instant but approximate.
+        Querysets with filters, the other dialects and the tables never analyzed fall back
+        to the exact count.
         """
         queryset: "QuerySet" = self._clone()
-        expression = queryset._build_select().alias("subquery_for_count")
-        expression = sqlalchemy.func.count().select().select_from(expression)
+
+        if estimate:
+            _estimate = await queryset._estimate_count()
+            if _estimate is not None:
+                return _estimate
+
+        if queryset._is_row_per_record():
+            expression = queryset._build_cardinality_select(sqlalchemy.func.count())
+        else:
+            expression = queryset._build_select().order_by(None).alias("subquery_for_count")
+            expression = sqlalchemy.func.count().select().select_from(expression)
         queryset._set_query_expression(expression)
-        _count = await queryset.database.fetch_val(expression)
+        _count = await queryset._fetch("fetch_val", expression)
         return cast("int", _count)
 
+    async def _estimate_count(self) -> Optional[int]:
+        """
+        Returns the number of records of the table estimated by the PostgreSQL planner or
+        `None` when not available.
+        """
+        dialect = get_dialect(self.database)
+        if (
+            dialect.name != "postgresql"
+            or self.filter_clauses
+            or self.or_clauses
+            or not self._is_row_per_record()
+        ):
+            return None
+
+        expression = sqlalchemy.text(
+            "SELECT reltuples FROM pg_class WHERE oid = CAST(:name AS regclass)"
+        ).bindparams(name=dialect.identifier_preparer.format_table(self.table))
+        self._set_query_expression(expression)
+        _estimate = await self.database.fetch_val(expression)
+        if _estimate is None or _estimate < 0:
+            return None
+        return int(_estimate)
+
+    async def aggregate(self, *args: Aggregate, **kwargs: Aggregate) -> Dict[str, Any]:
+        """
+        Returns the aggregates computed by the database over the records of the queryset,
+        in one single query.
+
+        Usage:
+
+        .. code-block:: python3
+
+            await Order.query.filter(paid=True).aggregate(total=Sum("amount"), n=Count())
+        """
+        queryset: "QuerySet" = self._clone()
+        if queryset.extra:
+            queryset = queryset.filter(**queryset.extra)
+
+        if queryset.limit_count or queryset._offset or queryset.distinct_on:
+            raise QuerySetError(
+                detail="Cannot aggregate a queryset with limit, offset or distinct."
+            )
+        if queryset._group_by:
+            raise QuerySetError(
+                detail="Cannot aggregate a grouped queryset, use annotate() with values() instead."
+            )
+
+        aggregates = queryset._get_aggregates(args, kwargs)
+        if not aggregates:
+            raise QuerySetError(detail="At least one aggregate is required.")
+
+        queryset._annotations = {}
+        queryset._select_related = list(queryset._select_related)
+        columns = [
+            queryset._resolve_aggregate(aggregate).label(name)
+            for name, aggregate in aggregates.items()
+        ]
+
+        expression = queryset._build_select().with_only_columns(*columns).order_by(None)
+        queryset._set_query_expression(expression)
+        row = await queryset._fetch("fetch_one", expression)
+        return {name: row[name] for name in aggregates}
+
     async def get_or_none(self, **kwargs: Any) -> Union[SaffierModel, None]:
         """
         Fetch one object matching the parameters or returns None.
@@ -796,18 +1282,20 @@ class QuerySet(BaseQuerySet, QuerySetProtocol):
         queryset: "QuerySet" = self.filter(**kwargs)
         expression = queryset._build_select().limit(2)
         queryset._set_query_expression(expression)
-        rows = await queryset.database.fetch_all(expression)
+        rows = await queryset._fetch("fetch_all", expression)
 
         if not rows:
             return None
         if len(rows) > 1:
             raise MultipleObjectsReturned()
-        return queryset.model_class.from_query_result(
+        result = queryset.model_class.from_query_result(
             rows[0],
             select_related=queryset._select_related,
             using_schema=queryset.using_schema,
             exclude_secrets=queryset._exclude_secrets,
         )
+        queryset._set_annotations([result], rows)
+        return result
 
     async def _all(self, **kwargs: Any) -> List[SaffierModel]:
         """
@@ -821,10 +1309,13 @@ class QuerySet(BaseQuerySet, QuerySetProtocol):
         if kwargs:
             return await queryset.filter(**kwargs).all()
 
+        if queryset.is_m2m and queryset._can_join_m2m_related():
+            return await queryset._all_m2m_related()
+
         expression = queryset._build_select()
         queryset._set_query_expression(expression)
 
-        rows = await queryset.database.fetch_all(expression)
+        rows = await queryset._fetch("fetch_all", expression)
 
         is_only_fields = True if queryset._only else False
         is_defer_fields = True if queryset._defer else False
@@ -836,7 +1327,6 @@ class QuerySet(BaseQuerySet, QuerySetProtocol):
             queryset.model_class.from_query_result(
                 row,
                 select_related=queryset._select_related,
-                prefetch_related=queryset._prefetch_related,
                 is_only_fields=is_only_fields,
                 only_fields=queryset._only,
                 is_defer_fields=is_defer_fields,
@@ -845,12 +1335,127 @@ class QuerySet(BaseQuerySet, QuerySetProtocol):
             )
             for row in rows
         ]
+        queryset._set_annotations(results, rows)
+        await queryset._prefetch_related_objects(results)
 
         if not queryset.is_m2m:
             return results
 
         return [getattr(result, queryset.m2m_related) for result in results]
 
+    def _can_join_m2m_related(self) -> bool:
+        """
+        Whether the related records of a many to many can be selected directly, unless the
+        queryset changes the shape of the through model results.
+        """
+        return not (self._only or self._defer or self._annotations or self._prefetch_related)
+
+    async def _all_m2m_related(self) -> List[SaffierModel]:
+        """
+        Returns the related records of a many to many with one
+        `SELECT related.* FROM through JOIN related`, hydrated directly instead of going
+        through the models of the through table.
+        """
+        queryset: "QuerySet" = self._clone()
+        related = queryset.m2m_related
+        target = queryset.model_class.fields[related].target
+        if related not in queryset._select_related:
+            queryset._select_related = [*queryset._select_related, related]
+
+        expression = queryset._build_select().with_only_columns(*target.table.columns)
+        queryset._set_query_expression(expression)
+        rows = await queryset._fetch("fetch_all", expression)
+
+        return [
+            target.from_query_result(
+                row,
+                using_schema=queryset.using_schema,
+                exclude_secrets=queryset._exclude_secrets,
+            )
+            for row in rows
+        ]
+
+    async def iterate(
+        self, chunk_size: int = 100, as_dict: bool = False, as_tuple: bool = False
+    ) -> AsyncIterator[Any]:
+        """
+        Streams the queryset records with a server side cursor instead of loading all
+        of them in memory.
+
+        The rows are read from the cursor and converted in chunks of `chunk_size`, which
+        bounds the memory used regardless of the size of the table. The rows can also be
+        returned as dictionaries (`as_dict`) or tuples (`as_tuple`) without generating models.
+
+        The connection is used by the cursor until the iteration finishes, which is why
+        `prefetch_related` is not supported.
+        """
+        if as_dict and as_tuple:
+            raise QuerySetError(detail="Only one of `as_dict` or `as_tuple` can be used.")
+        if chunk_size < 1:
+            raise QuerySetError(detail="The chunk_size must be greater than zero.")
+
+        queryset: "QuerySet" = self._clone()
+        if queryset.extra:
+            queryset = queryset.filter(**queryset.extra)
+
+        if queryset._prefetch_related:
+            raise QuerySetError(detail="prefetch_related is not supported by iterate().")
+
+        if queryset.is_m2m:
+            queryset.distinct_on = [queryset.m2m_related]
+
+        expression = queryset._build_select()
+        queryset._set_query_expression(expression)
+
+        chunk: List[Any] = []
+        async for row in queryset.database.iterate(expression):
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                for value in queryset._convert_rows(chunk, as_dict=as_dict, as_tuple=as_tuple):
+                    yield value
+                chunk = []
+
+        for value in queryset._convert_rows(chunk, as_dict=as_dict, as_tuple=as_tuple):
+            yield value
+
+    def _convert_rows(
+        self, rows: Sequence[Any], as_dict: bool = False, as_tuple: bool = False
+    ) -> List[Any]:
+        """
+        Converts the rows of the iterate into models, dictionaries or tuples.
+        """
+        if as_dict:
+            return [{key: row[key] for key in row.keys()} for row in rows]
+        if as_tuple:
+            return [tuple(row[index] for index in range(len(row))) for row in rows]
+
+        results = [
+            self.model_class.from_query_result(
+                row,
+                select_related=self._select_related,
+                is_only_fields=bool(self._only),
+                only_fields=self._only,
+                is_defer_fields=bool(self._defer),
+                using_schema=self.using_schema,
+                exclude_secrets=self._exclude_secrets,
+            )
+            for row in rows
+        ]
+        self._set_annotations(results, rows)
+        if not self.is_m2m:
+            return results
+        return [getattr(result, self.m2m_related) for result in results]
+
+    def _set_annotations(self, results: Sequence[Any], rows: Sequence[Any]) -> None:
+        """
+        Sets the values of the annotations in the models.
+        """
+        if not self._annotations:
+            return
+        for result, row in zip(results, rows):
+            for name in self._annotations:
+                object.__setattr__(result, name, row[name])
+
     def all(self, **kwargs: Any) -> "QuerySet":
         """
         Returns the queryset records based on specific filters
@@ -862,14 +1467,20 @@ class QuerySet(BaseQuerySet, QuerySetProtocol):
     async def get(self, **kwargs: Any) -> SaffierModel:
         """
         Returns a single record based on the given kwargs.
+
+        With an identity map in the context, the lookups by primary key of the records already
+        in the map return them without querying.
         """
         queryset: "QuerySet" = self._clone()
 
         if kwargs:
+            instance = queryset._get_from_identity_map(kwargs)
+            if instance is not None:
+                return instance
             return await queryset.filter(**kwargs).get()
 
         expression = queryset._build_select().limit(2)
-        rows = await queryset.database.fetch_all(expression)
+        rows = await queryset._fetch("fetch_all", expression)
         queryset._set_query_expression(expression)
 
         is_only_fields = True if queryset._only else False
@@ -879,26 +1490,71 @@ class QuerySet(BaseQuerySet, QuerySetProtocol):
             raise ObjectNotFound()
         if len(rows) > 1:
             raise MultipleObjectsReturned()
-        return queryset.model_class.from_query_result(
+        result = queryset.model_class.from_query_result(
             rows[0],
             select_related=queryset._select_related,
             is_only_fields=is_only_fields,
             only_fields=queryset._only,
             is_defer_fields=is_defer_fields,
-            prefetch_related=queryset._prefetch_related,
             using_schema=queryset.using_schema,
             exclude_secrets=queryset._exclude_secrets,
         )
+        queryset._set_annotations([result], rows)
+        await queryset._prefetch_related_objects([result])
+        return result
+
+    def _get_from_identity_map(self, kwargs: Dict[str, Any]) -> Optional[SaffierModel]:
+        """
+        Returns the record of a lookup only by primary key from the identity map of the
+        context, if any, as long as the queryset does not change the shape of the results.
+        """
+        identity_map = get_identity_map()
+        if identity_map is None or len(kwargs) != 1:
+            return None
+
+        name, pk = next(iter(kwargs.items()))
+        if name not in ("pk", self.pkname) or pk is None:
+            return None
+        if (
+            self.filter_clauses
+            or self.or_clauses
+            or self._offset
+            or self._select_related
+            or self._prefetch_related
+            or self._only
+            or self._defer
+            or self._exclude_secrets
+            or self._annotations
+        ):
+            return None
+
+        instance = identity_map.get(self.model_class, self.table.schema, pk)
+        if instance is not None:
+            identity_map.queries_avoided += 1
+        return cast(Optional[SaffierModel], instance)
+
+    def _get_first_order_by(self, reverse: bool = False) -> List[str]:
+        """
+        The ordering of the `first()` and `last()`, the one of the queryset or else the
+        primary key, reversed for the `last()`.
+        """
+        order_by = list(self._order_by) or [self.pkname]
+        if reverse:
+            order_by = [name[1:] if name.startswith("-") else f"-{name}" for name in order_by]
+        return order_by
 
     async def first(self, **kwargs: Any) -> Union[SaffierModel, None]:
         """
         Returns the first record of a given queryset.
+
+        The records are ordered by the ordering of the queryset or the primary key and
+        only one is fetched.
         """
         queryset: "QuerySet" = self._clone()
         if kwargs:
-            return await queryset.filter(**kwargs).order_by("id").get()
+            queryset = queryset.filter(**kwargs)
 
-        rows = await queryset.limit(1).order_by("id").all()
+        rows = await queryset.order_by(*queryset._get_first_order_by()).limit(1)
         if rows:
             return rows[0]
         return None
@@ -906,12 +1562,15 @@ class QuerySet(BaseQuerySet, QuerySetProtocol):
     async def last(self, **kwargs: Any) -> Union[SaffierModel, None]:
         """
         Returns the last record of a given queryset.
+
+        The ordering of the queryset, or the primary key, is reversed and only one record
+        is fetched.
         """
         queryset: "QuerySet" = self._clone()
         if kwargs:
-            return await queryset.filter(**kwargs).order_by("-id").get()
+            queryset = queryset.filter(**kwargs)
 
-        rows = await queryset.order_by("-id").all()
+        rows = await queryset.order_by(*queryset._get_first_order_by(reverse=True)).limit(1)
         if rows:
             return rows[0]
         return None
@@ -927,62 +1586,476 @@ class QuerySet(BaseQuerySet, QuerySetProtocol):
         instance = await instance.save(force_save=True, values=kwargs)
         return instance
 
-    async def bulk_create(self, objs: List[Dict]) -> None:
+    async def bulk_create(
+        self,
+        objs: List[Dict],
+        batch_size: Optional[int] = None,
+        returning: bool = False,
+        use_executemany: bool = False,
+        validate: bool = True,
+    ) -> Optional[List[SaffierModel]]:
         """
-        Bulk creates records in a table
+        Bulk creates records in a table.
+
+        The records are inserted in chunks sized by the limit of bind parameters of the
+        dialect and the number of columns (or `batch_size`), all of them inside one
+        transaction. Each chunk is a multi row `INSERT ... VALUES` or, with `use_executemany`,
+        one prepared insert executed for each record.
+
+        With `returning`, the created models are returned with the primary keys populated.
+
+        The records are validated column by column, raising the errors of all of them
+        together. With `validate=False`, the values are trusted and written as given, only
+        adding the defaults of the missing fields.
+
+        The `pre_bulk_create` and `post_bulk_create` signals receive all the records at once.
         """
+        if returning and use_executemany:
+            raise QuerySetError(detail="returning cannot be used with use_executemany.")
+        if batch_size is not None and batch_size < 1:
+            raise QuerySetError(detail="The batch_size must be greater than zero.")
+
         queryset: "QuerySet" = self._clone()
-        new_objs = [queryset._validate_kwargs(**obj) for obj in objs]
+        validator = queryset.model_class.get_validator()
+        if validate:
+            new_objs = validator.check_many(objs)
+        else:
+            new_objs = [validator.trust(obj) for obj in objs]
+        if not new_objs:
+            return [] if returning else None
 
-        expression = queryset.table.insert().values(new_objs)
-        queryset._set_query_expression(expression)
-        await queryset.database.execute(expression)
+        signals = queryset.model_class.signals
+        await signals.pre_bulk_create.send(sender=queryset.model_class, values=new_objs)
 
-    async def bulk_update(self, objs: List[SaffierModel], fields: List[str]) -> None:
+        database = queryset.database
+        if use_executemany:
+            chunk_size = batch_size or len(new_objs)
+        else:
+            columns = max(len(obj) for obj in new_objs) or 1
+            chunk_size = get_max_bind_params(database) // columns
+            if batch_size is not None:
+                chunk_size = min(chunk_size, batch_size)
+
+        use_returning = returning and supports_insert_returning(database)
+        results: List[SaffierModel] = []
+
+        async with database.transaction():
+            for chunk in chunked(new_objs, chunk_size):
+                if use_executemany:
+                    expression = queryset.table.insert()
+                    queryset._set_query_expression(expression)
+                    await database.execute_many(expression, chunk)
+                elif use_returning:
+                    expression = (
+                        queryset.table.insert().values(chunk).returning(*queryset.table.columns)
+                    )
+                    queryset._set_query_expression(expression)
+                    rows = await database.fetch_all(expression)
+                    results.extend(
+                        queryset.model_class.from_query_result(
+                            row, using_schema=queryset.using_schema
+                        )
+                        for row in rows
+                    )
+                elif returning:
+                    # Dialects without RETURNING, the records are inserted one by one to
+                    # get the generated primary keys.
+                    for obj in chunk:
+                        results.append(await queryset._insert_one(obj))
+                else:
+                    expression = queryset.table.insert().values(chunk)
+                    queryset._set_query_expression(expression)
+                    await database.execute(expression)
+        invalidate(table=queryset.table)
+        await queryset._invalidate_results()
+
+        await signals.post_bulk_create.send(
+            sender=queryset.model_class,
+            values=new_objs,
+            instances=results if returning else None,
+        )
+        return results if returning else None
+
+    async def _insert_one(self, values: Dict[str, Any]) -> SaffierModel:
         """
-        Bulk updates records in a table.
+        Inserts one record and returns the model with the generated primary key.
+        """
+        expression = self.table.insert().values(values)
+        self._set_query_expression(expression)
+        pk = await self.database.execute(expression)
 
-        A similar solution was suggested here: https://github.com/encode/orm/pull/148
+        instance = self.model_class(**values)
+        instance.table = self.table
+        if getattr(instance, self.pkname, None) is None:
+            setattr(instance, self.pkname, pk)
+        return instance
+
+    async def bulk_upsert(
+        self,
+        objs: List[Dict],
+        conflict_fields: List[str],
+        update_fields: Optional[List[str]] = None,
+        batch_size: Optional[int] = None,
+        returning: bool = False,
+    ) -> Optional[List[SaffierModel]]:
+        """
+        Bulk inserts records in a table and updates the existing ones in one go.
+
+        The records conflicting with an existing one on the `conflict_fields` (a primary key
+        or unique constraint) update the `update_fields` of the existing record instead.
+        When no `update_fields` are given, the fields provided in the records (and the
+        `auto_now` fields) are updated. With an empty list the conflicting records are ignored.
 
-        It is thought to be a clean approach to a simple problem so it was added here and
-        refactored to be compatible with Saffier.
+        Compiles to `INSERT ... ON CONFLICT ... DO UPDATE` on PostgreSQL and SQLite and to
+        `INSERT ... ON DUPLICATE KEY UPDATE` on MySQL, in chunks like the `bulk_create`.
+        No signals are sent, as the records created and updated are not known.
         """
+        if not conflict_fields:
+            raise QuerySetError(detail="The conflict_fields cannot be empty.")
+        if batch_size is not None and batch_size < 1:
+            raise QuerySetError(detail="The batch_size must be greater than zero.")
+
         queryset: "QuerySet" = self._clone()
+        new_objs = [queryset._get_upsert_values(obj, conflict_fields) for obj in objs]
+        if not new_objs:
+            return [] if returning else None
 
-        new_fields = {}
-        for key, field in queryset.model_class.fields.items():
-            if key in fields:
-                new_fields[key] = field.validator
+        if update_fields is None:
+            update_fields = queryset._get_upsert_update_fields(
+                {key for obj in objs for key in obj}, conflict_fields
+            )
+        queryset._check_upsert_fields(conflict_fields, update_fields)
 
-        validator = Schema(fields=new_fields)
+        database = queryset.database
+        if returning and not supports_insert_returning(database):
+            raise QuerySetError(
+                detail=f"returning is not supported by the {get_dialect(database).name} dialect."
+            )
 
-        new_objs = []
-        for obj in objs:
-            new_obj = {}
-            for key, value in obj.__dict__.items():
-                if key in fields:
-                    new_obj[key] = queryset._resolve_value(value)
-            new_objs.append(new_obj)
-
-        new_objs = [
-            queryset._update_auto_now_fields(validator.check(obj), queryset.model_class.fields)
-            for obj in new_objs
+        columns = max(len(obj) for obj in new_objs) or 1
+        chunk_size = get_max_bind_params(database) // columns
+        if batch_size is not None:
+            chunk_size = min(chunk_size, batch_size)
+
+        results: List[SaffierModel] = []
+        async with database.transaction():
+            for chunk in chunked(new_objs, chunk_size):
+                expression = queryset._build_upsert(chunk, conflict_fields, update_fields)
+                if returning:
+                    expression = expression.returning(*queryset.table.columns)
+                    queryset._set_query_expression(expression)
+                    rows = await database.fetch_all(expression)
+                    results.extend(
+                        queryset.model_class.from_query_result(
+                            row, using_schema=queryset.using_schema
+                        )
+                        for row in rows
+                    )
+                else:
+                    queryset._set_query_expression(expression)
+                    await database.execute(expression)
+        invalidate(table=queryset.table)
+        await queryset._invalidate_results()
+
+        return results if returning else None
+
+    async def upsert(
+        self,
+        conflict_fields: List[str],
+        update_fields: Optional[List[str]] = None,
+        **kwargs: Any,
+    ) -> SaffierModel:
+        """
+        Inserts a record or updates the existing one conflicting on the `conflict_fields`
+        and returns it.
+        """
+        if not conflict_fields:
+            raise QuerySetError(detail="The conflict_fields cannot be empty.")
+
+        queryset: "QuerySet" = self._clone()
+        if update_fields is None:
+            update_fields = queryset._get_upsert_update_fields(set(kwargs), conflict_fields)
+        queryset._check_upsert_fields(conflict_fields, update_fields)
+
+        values = queryset._get_upsert_values(kwargs, conflict_fields)
+        instance, _ = await queryset._upsert_one(values, conflict_fields, update_fields)
+        return instance
+
+    def _get_upsert_values(self, kwargs: Dict[str, Any], conflict_fields: List[str]) -> Any:
+        """
+        Validates the values of the record keeping the conflict fields even if they are
+        read only, like the primary key.
+        """
+        values = self._validate_kwargs(**kwargs)
+        for key in conflict_fields:
+            if key not in values and key in kwargs:
+                value = kwargs[key]
+                values[key] = value.pk if hasattr(value, "__db_model__") else value
+        return values
+
+    def _get_upsert_update_fields(self, keys: Set[str], conflict_fields: List[str]) -> List[str]:
+        """
+        The fields updated by default, the ones provided (except the primary key) and the
+        `auto_now` fields.
+        """
+        fields = self.model_class.fields
+        auto_now_fields = self._update_auto_now_fields({}, fields)
+        return [
+            key
+            for key in fields
+            if (key in keys or key in auto_now_fields)
+            and key not in conflict_fields
+            and key != self.pkname
+            and key in self.table.columns
         ]
 
-        pk = getattr(queryset.table.c, queryset.pkname)
-        expression = queryset.table.update().where(pk == sqlalchemy.bindparam(queryset.pkname))
-        kwargs: Dict[str, Any] = {
-            field: sqlalchemy.bindparam(field) for obj in new_objs for field in obj.keys()
-        }
-        pks = [{queryset.pkname: getattr(obj, queryset.pkname)} for obj in objs]
+    def _check_upsert_fields(self, conflict_fields: List[str], update_fields: List[str]) -> None:
+        for name in (*conflict_fields, *update_fields):
+            if name not in self.table.columns:
+                raise QuerySetError(
+                    detail=f"'{name}' is not a column of {self.model_class.__name__}."
+                )
+
+    def _get_upsert_conflict_fields(self, kwargs: Dict[str, Any]) -> Optional[List[str]]:
+        """
+        Returns the lookup fields if they match exactly a primary key or unique constraint
+        of the table, making possible to use them as conflict target of an upsert.
+        """
+        if not kwargs:
+            return None
 
-        query_list = []
-        for pk, value in zip(pks, new_objs):  # noqa
-            query_list.append({**pk, **value})
+        keys = set(kwargs)
+        for constraint in self.table.constraints:
+            if isinstance(
+                constraint, (sqlalchemy.PrimaryKeyConstraint, sqlalchemy.UniqueConstraint)
+            ) and keys == set(constraint.columns.keys()):
+                return list(kwargs)
 
-        expression = expression.values(kwargs)
-        queryset._set_query_expression(expression)
-        await queryset.database.execute_many(str(expression), query_list)
+        for index in self.table.indexes:
+            if index.unique and keys == set(index.columns.keys()):
+                return list(kwargs)
+        return None
+
+    def _build_upsert(
+        self, values: Any, conflict_fields: List[str], update_fields: List[str]
+    ) -> Any:
+        """
+        Builds the insert statement updating the existing records for the dialect.
+        """
+        dialect = get_dialect(self.database).name
+
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        elif dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert
+        elif dialect == "mysql":
+            from sqlalchemy.dialects.mysql import insert
+        else:
+            raise QuerySetError(detail=f"Upserts are not supported by the {dialect} dialect.")
+
+        expression = insert(self.table).values(values)
+
+        if dialect == "mysql":
+            if update_fields:
+                set_values = {key: expression.inserted[key] for key in update_fields}
+            else:
+                # Updating a column to itself does nothing, like the DO NOTHING.
+                set_values = {conflict_fields[0]: self.table.columns[conflict_fields[0]]}
+            return expression.on_duplicate_key_update(set_values)
+
+        if not update_fields:
+            return expression.on_conflict_do_nothing(index_elements=conflict_fields)
+        return expression.on_conflict_do_update(
+            index_elements=conflict_fields,
+            set_={key: expression.excluded[key] for key in update_fields},
+        )
+
+    async def _upsert_one(
+        self, values: Dict[str, Any], conflict_fields: List[str], update_fields: List[str]
+    ) -> Tuple[SaffierModel, bool]:
+        """
+        Upserts one record with the validated values, returning the model and if it was
+        created.
+
+        On PostgreSQL, with `update_fields`, a single statement is used, the `xmax` of the
+        returned row telling if it was inserted. Otherwise the insert does nothing on
+        conflict and the existing record is updated (or read) afterwards, inside the same
+        transaction. On MySQL the record is looked up, locking it, before the upsert.
+        """
+        table = self.table
+        database = self.database
+        dialect = get_dialect(database).name
+
+        lookup = sqlalchemy.and_(
+            *(table.columns[key] == values.get(key) for key in conflict_fields)
+        )
+
+        async with database.transaction():
+            if dialect == "postgresql" and update_fields:
+                expression = self._build_upsert(values, conflict_fields, update_fields).returning(
+                    *table.columns,
+                    (sqlalchemy.literal_column("xmax") == 0).label("saffier_created"),
+                )
+                self._set_query_expression(expression)
+                row = await database.fetch_one(expression)
+                created = bool(row["saffier_created"])
+            elif dialect in ("postgresql", "sqlite"):
+                expression = self._build_upsert(values, conflict_fields, []).returning(
+                    *table.columns
+                )
+                self._set_query_expression(expression)
+                row = await database.fetch_one(expression)
+                created = row is not None
+
+                if not created and update_fields:
+                    update_values = {key: values[key] for key in update_fields if key in values}
+                    expression = (
+                        table.update()
+                        .values(update_values)
+                        .where(lookup)
+                        .returning(*table.columns)
+                    )
+                    row = await database.fetch_one(expression)
+                elif not created:
+                    row = await database.fetch_one(table.select().where(lookup))
+            else:
+                row = await database.fetch_one(table.select().where(lookup).with_for_update())
+                created = row is None
+
+                if created or update_fields:
+                    expression = self._build_upsert(values, conflict_fields, update_fields)
+                    self._set_query_expression(expression)
+                    await database.execute(expression)
+                    row = await database.fetch_one(table.select().where(lookup))
+
+        invalidate(table=table)
+        await self._invalidate_results()
+
+        instance = self.model_class.from_query_result(row, using_schema=self.using_schema)
+        return instance, created
+
+    async def bulk_update(
+        self, objs: List[SaffierModel], fields: List[str], batch_size: Optional[int] = None
+    ) -> None:
+        """
+        Bulk updates records in a table.
+
+        Each chunk of records is updated with one single statement. On PostgreSQL an
+        `UPDATE ... FROM (VALUES ...)` joining the new values by primary key and, for the
+        other dialects, an `UPDATE ... SET field = CASE pk WHEN ... END`.
+
+        The validator and the `auto_now` values are computed once for all the records.
+        Records with expressions, like `F("views") + 1`, are always updated with the `CASE`.
+
+        The `post_bulk_update` signal receives all the records at once.
+        """
+        if batch_size is not None and batch_size < 1:
+            raise QuerySetError(detail="The batch_size must be greater than zero.")
+
+        queryset: "QuerySet" = self._clone()
+        if not objs:
+            return
+
+        model_fields = queryset.model_class.fields
+        auto_now_values = queryset._update_auto_now_fields({}, model_fields)
+        update_fields = [
+            key for key in model_fields if key in fields and key not in auto_now_values
+        ]
+
+        pkname = queryset.pkname
+        rows = []
+        has_expressions = False
+        for obj in objs:
+            values, expressions = split_expressions(
+                {key: getattr(obj, key) for key in update_fields}
+            )
+            validator = queryset.model_class.get_validator(values)
+            rows.append((getattr(obj, pkname), {**validator.check(values), **expressions}))
+            has_expressions = has_expressions or bool(expressions)
+
+        database = queryset.database
+        use_values = get_dialect(database).name == "postgresql" and not has_expressions
+        params_per_row = len(update_fields) + 1 if use_values else 2 * len(update_fields) + 1
+        chunk_size = get_max_bind_params(database) // params_per_row
+        if batch_size is not None:
+            chunk_size = min(chunk_size, batch_size)
+
+        async with database.transaction():
+            for chunk in chunked(rows, chunk_size):
+                if use_values:
+                    expression = queryset._build_bulk_update_from_values(
+                        chunk, update_fields, auto_now_values
+                    )
+                else:
+                    expression = queryset._build_bulk_update_case(
+                        chunk, update_fields, auto_now_values
+                    )
+                queryset._set_query_expression(expression)
+                await database.execute(expression)
+        invalidate(table=queryset.table)
+        await queryset._invalidate_results()
+
+        signals = queryset.model_class.signals
+        await signals.post_bulk_update.send(
+            sender=queryset.model_class, instances=objs, fields=update_fields
+        )
+
+    def _build_bulk_update_from_values(
+        self,
+        rows: List[Tuple[Any, Dict[str, Any]]],
+        fields: List[str],
+        auto_now_values: Dict[str, Any],
+    ) -> Any:
+        """
+        Builds the `UPDATE table SET ... FROM (VALUES ...) AS v WHERE table.pk = v.pk`.
+
+        The parameters of the values are casted to the type of the columns since they
+        cannot be inferred by the database.
+        """
+        table = self.table
+        pk_column = table.columns[self.pkname]
+        columns = [pk_column, *(table.columns[key] for key in fields)]
+
+        values = sqlalchemy.values(
+            *(sqlalchemy.column(column.name, BindCast(column.type)) for column in columns),
+            name="saffier_values",
+        ).data([(pk, *(row[key] for key in fields)) for pk, row in rows])
+
+        set_values = {
+            key: sqlalchemy.cast(values.columns[key], table.columns[key].type) for key in fields
+        }
+        set_values.update(auto_now_values)
+        return table.update().values(set_values).where(pk_column == values.columns[self.pkname])
+
+    def _build_bulk_update_case(
+        self,
+        rows: List[Tuple[Any, Dict[str, Any]]],
+        fields: List[str],
+        auto_now_values: Dict[str, Any],
+    ) -> Any:
+        """
+        Builds the `UPDATE table SET field = CASE pk WHEN ... THEN ... END WHERE pk IN (...)`.
+        """
+        table = self.table
+        pk_column = table.columns[self.pkname]
+
+        set_values: Dict[str, Any] = {
+            key: sqlalchemy.case(
+                {
+                    pk: (
+                        row[key].resolve(table)
+                        if isinstance(row[key], Expression)
+                        else sqlalchemy.literal(row[key], type_=table.columns[key].type)
+                    )
+                    for pk, row in rows
+                },
+                value=pk_column,
+                else_=table.columns[key],
+            )
+            for key in fields
+        }
+        set_values.update(auto_now_values)
+        return table.update().values(set_values).where(pk_column.in_([pk for pk, _ in rows]))
 
     async def delete(self) -> None:
         queryset: "QuerySet" = self._clone()
@@ -994,36 +2067,37 @@ class QuerySet(BaseQuerySet, QuerySetProtocol):
 
         queryset._set_query_expression(expression)
         await queryset.database.execute(expression)
+        invalidate(table=queryset.table)
+        await queryset._invalidate_results()
 
         await self.model_class.signals.post_delete.send(sender=self.__class__, instance=self)
 
     async def update(self, **kwargs: Any) -> None:
         """
         Updates a record in a specific table with the given kwargs.
+
+        The expressions, like `F("views") + 1`, are computed by the database and not
+        validated.
         """
         queryset: "QuerySet" = self._clone()
-        fields = {
-            key: field.validator
-            for key, field in queryset.model_class.fields.items()
-            if key in kwargs
-        }
-
-        validator = Schema(fields=fields)
-        kwargs = queryset._update_auto_now_fields(
-            validator.check(kwargs), queryset.model_class.fields
-        )
+        kwargs, expressions = split_expressions(kwargs)
+        kwargs = queryset.model_class.get_validator(kwargs, auto_now=True).check(kwargs)
+        kwargs.update(expressions)
 
         await self.model_class.signals.pre_update.send(
             sender=self.__class__, instance=self, kwargs=kwargs
         )
 
-        expression = queryset.table.update().values(**kwargs)
+        values = {key: resolve_expression(value, queryset.table) for key, value in kwargs.items()}
+        expression = queryset.table.update().values(**values)
 
         for filter_clause in queryset.filter_clauses:
             expression = expression.where(filter_clause)
 
         queryset._set_query_expression(expression)
         await queryset.database.execute(expression)
+        invalidate(table=queryset.table)
+        await queryset._invalidate_results()
 
         await self.model_class.signals.post_update.send(sender=self.__class__, instance=self)
 
@@ -1032,8 +2106,20 @@ class QuerySet(BaseQuerySet, QuerySetProtocol):
     ) -> Tuple[SaffierModel, bool]:
         """
         Creates a record in a specific table or updates if already exists.
+
+        When the lookup matches exactly a primary key or unique constraint, the record is
+        inserted ignoring the conflicts and read when it already exists, avoiding the race
+        between the lookup and the insert.
         """
         queryset: "QuerySet" = self._clone()
+        upsert = queryset._get_atomic_upsert(
+            kwargs, {**kwargs, **defaults}, signals=("pre_save", "post_save")
+        )
+
+        if upsert is not None:
+            conflict_fields, values = upsert
+            return await queryset._upsert_one(values, conflict_fields, [])
+
         try:
             instance = await queryset.get(**kwargs)
             return instance, False
@@ -1047,8 +2133,22 @@ class QuerySet(BaseQuerySet, QuerySetProtocol):
     ) -> Tuple[SaffierModel, bool]:
         """
         Updates a record in a specific table or creates a new one.
+
+        When the lookup matches exactly a primary key or unique constraint, not changed by
+        the defaults, an upsert is used instead of the lookup followed by the update or insert.
         """
         queryset: "QuerySet" = self._clone()
+        upsert = queryset._get_atomic_upsert(
+            kwargs,
+            {**kwargs, **defaults},
+            signals=("pre_save", "post_save", "pre_update", "post_update"),
+        )
+
+        if upsert is not None and not set(upsert[0]).intersection(defaults):
+            conflict_fields, values = upsert
+            update_fields = queryset._get_upsert_update_fields(set(defaults), conflict_fields)
+            return await queryset._upsert_one(values, conflict_fields, update_fields)
+
         try:
             instance = await queryset.get(**kwargs)
             await instance.update(**defaults)
@@ -1058,6 +2158,35 @@ class QuerySet(BaseQuerySet, QuerySetProtocol):
             instance = await queryset.create(**kwargs)
             return instance, True
 
+    def _get_atomic_upsert(
+        self, kwargs: Dict[str, Any], values: Dict[str, Any], signals: Sequence[str]
+    ) -> Optional[Tuple[List[str], Dict[str, Any]]]:
+        """
+        Returns the conflict fields and the validated values to upsert the record of the
+        lookup `kwargs` in one go, or `None` to use the lookup followed by the write.
+
+        The lookup is used when it does not match exactly a primary key or unique
+        constraint, when the `signals` of the model have receivers, as the upsert does
+        not go through the model, and when the values are not valid to create the record,
+        which may still exist.
+        """
+        conflict_fields = self._get_upsert_conflict_fields(kwargs)
+        if conflict_fields is None or get_dialect(self.database).name not in (
+            "postgresql",
+            "sqlite",
+            "mysql",
+        ):
+            return None
+
+        model_signals = self.model_class.signals
+        if any(getattr(model_signals, name).receivers for name in signals):
+            return None
+
+        try:
+            return conflict_fields, self._get_upsert_values(values, conflict_fields)
+        except ValidationError:
+            return None
+
     async def contains(self, instance: SaffierModel) -> bool:
         """Returns true if the QuerySet contains the provided object.
         False if otherwise.
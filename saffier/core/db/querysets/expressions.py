@@ -0,0 +1,129 @@
+import operator
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Tuple
+
+import sqlalchemy
+
+from saffier.exceptions import QuerySetError
+
+
+class Expression(ABC):
+    """
+    Base of the expressions evaluated by the database instead of Python, allowing
+    updates like `views = views + 1` in one statement.
+
+    The expressions are not validated by the fields since their value is only known
+    by the database.
+    """
+
+    @abstractmethod
+    def resolve(self, table: sqlalchemy.Table) -> Any:
+        """
+        Returns the SQLAlchemy expression for the columns of the table.
+        """
+
+    def _combine(self, other: Any, operation: Callable, reverse: bool = False) -> "Expression":
+        if reverse:
+            return CombinedExpression(other, operation, self)
+        return CombinedExpression(self, operation, other)
+
+    def __add__(self, other: Any) -> "Expression":
+        return self._combine(other, operator.add)
+
+    def __radd__(self, other: Any) -> "Expression":
+        return self._combine(other, operator.add, reverse=True)
+
+    def __sub__(self, other: Any) -> "Expression":
+        return self._combine(other, operator.sub)
+
+    def __rsub__(self, other: Any) -> "Expression":
+        return self._combine(other, operator.sub, reverse=True)
+
+    def __mul__(self, other: Any) -> "Expression":
+        return self._combine(other, operator.mul)
+
+    def __rmul__(self, other: Any) -> "Expression":
+        return self._combine(other, operator.mul, reverse=True)
+
+    def __truediv__(self, other: Any) -> "Expression":
+        return self._combine(other, operator.truediv)
+
+    def __rtruediv__(self, other: Any) -> "Expression":
+        return self._combine(other, operator.truediv, reverse=True)
+
+    def __mod__(self, other: Any) -> "Expression":
+        return self._combine(other, operator.mod)
+
+    def __rmod__(self, other: Any) -> "Expression":
+        return self._combine(other, operator.mod, reverse=True)
+
+    def __neg__(self) -> "Expression":
+        return CombinedExpression(0, operator.sub, self)
+
+
+class F(Expression):
+    """
+    Reference to the value of a field in the database.
+
+    Usage:
+
+    .. code-block:: python3
+
+        await Post.query.filter(id=1).update(views=saffier.F("views") + 1)
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def resolve(self, table: sqlalchemy.Table) -> Any:
+        try:
+            return table.columns[self.name]
+        except KeyError:
+            raise QuerySetError(
+                detail=f"'{self.name}' is not a column of the table {table.name}."
+            ) from None
+
+    def __repr__(self) -> str:
+        return f"F({self.name})"
+
+
+class CombinedExpression(Expression):
+    """
+    The arithmetic operation between expressions and values.
+    """
+
+    def __init__(self, lhs: Any, operation: Callable, rhs: Any) -> None:
+        self.lhs = lhs
+        self.operation = operation
+        self.rhs = rhs
+
+    def resolve(self, table: sqlalchemy.Table) -> Any:
+        return self.operation(
+            resolve_expression(self.lhs, table), resolve_expression(self.rhs, table)
+        )
+
+    def __repr__(self) -> str:
+        return f"{self.operation.__name__}({self.lhs!r}, {self.rhs!r})"
+
+
+def resolve_expression(value: Any, table: sqlalchemy.Table) -> Any:
+    """
+    Returns the SQL of the expressions and the values as they are.
+    """
+    if isinstance(value, Expression):
+        return value.resolve(table)
+    return value
+
+
+def split_expressions(values: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Splits the values in the ones to be validated and the expressions.
+    """
+    plain = {}
+    expressions = {}
+    for key, value in values.items():
+        if isinstance(value, Expression):
+            expressions[key] = value
+        else:
+            plain[key] = value
+    return plain, expressions
@@ -0,0 +1,275 @@
+import base64
+import binascii
+import datetime
+import decimal
+import enum
+import json
+import uuid
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Iterator, List, Optional, Sequence, Tuple
+
+import sqlalchemy
+
+from saffier.exceptions import QuerySetError
+
+if TYPE_CHECKING:
+    from saffier import Model, QuerySet
+
+
+NEXT = "next"
+PREVIOUS = "previous"
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, enum.Enum):
+        return {"__type__": "enum", "value": value.value}
+    if isinstance(value, bytes):
+        return {"__type__": "bytes", "value": base64.b64encode(value).decode("ascii")}
+    if isinstance(value, datetime.datetime):
+        return {"__type__": "datetime", "value": value.isoformat()}
+    if isinstance(value, datetime.date):
+        return {"__type__": "date", "value": value.isoformat()}
+    if isinstance(value, datetime.time):
+        return {"__type__": "time", "value": value.isoformat()}
+    if isinstance(value, uuid.UUID):
+        return {"__type__": "uuid", "value": str(value)}
+    if isinstance(value, decimal.Decimal):
+        return {"__type__": "decimal", "value": str(value)}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+
+    decoders = {
+        "datetime": datetime.datetime.fromisoformat,
+        "date": datetime.date.fromisoformat,
+        "time": datetime.time.fromisoformat,
+        "uuid": uuid.UUID,
+        "decimal": decimal.Decimal,
+        # The enums are converted back by the type of their column.
+        "enum": lambda value: value,
+        "bytes": base64.b64decode,
+    }
+    return decoders[value["__type__"]](value["value"])
+
+
+def encode_cursor(order_by: Sequence[str], values: Sequence[Any], direction: str) -> str:
+    """
+    Generates the opaque cursor token with the values of the ordering columns.
+
+    Raises `QuerySetError` for the values that cannot be stored in the cursor.
+    """
+    data = {
+        "o": list(order_by),
+        "v": [_encode_value(value) for value in values],
+        "d": direction,
+    }
+    try:
+        token = json.dumps(data, separators=(",", ":")).encode("utf-8")
+    except (TypeError, ValueError) as e:
+        raise QuerySetError(
+            detail=f"Cannot paginate by {', '.join(order_by)}, the values are not supported."
+        ) from e
+    return base64.urlsafe_b64encode(token).decode("ascii")
+
+
+def decode_cursor(cursor: str, order_by: Sequence[str]) -> Tuple[List[Any], str]:
+    """
+    Extracts the values and the direction from the cursor token.
+    """
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        values = [_decode_value(value) for value in data["v"]]
+        direction = data["d"]
+        cursor_order_by = data["o"]
+    except (binascii.Error, ValueError, KeyError, TypeError, AttributeError) as e:
+        raise QuerySetError(detail="Invalid pagination cursor.") from e
+
+    if cursor_order_by != list(order_by) or len(values) != len(order_by):
+        raise QuerySetError(detail="The pagination cursor does not match the ordering.")
+    if direction not in (NEXT, PREVIOUS):
+        raise QuerySetError(detail="Invalid pagination cursor.")
+    return values, direction
+
+
+@dataclass
+class Page:
+    """
+    A page of results of the keyset pagination with the cursors to the pages before
+    and after it.
+    """
+
+    results: List["Model"] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+    previous_cursor: Optional[str] = None
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    @property
+    def has_previous(self) -> bool:
+        return self.previous_cursor is not None
+
+    def __iter__(self) -> Iterator["Model"]:
+        return iter(self.results)
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+
+class PaginationMixin:
+    """
+    Keyset (seek) pagination for the queryset.
+    """
+
+    def _get_pagination_order(self, order_by: Optional[Sequence[str]]) -> List[str]:
+        """
+        Returns the ordering of the pagination, always ending with the primary key as
+        tiebreaker in the same direction of the last ordering column.
+
+        Only the non nullable columns of the model are supported, as the `NULL` values
+        cannot be compared with the values of the cursor.
+        """
+        order = list(order_by) if order_by else list(self._order_by)  # type: ignore
+        pkname = self.model_class.pkname  # type: ignore
+
+        columns = self.table.columns  # type: ignore
+        for name in order:
+            column = columns.get(name.lstrip("-"))
+            if column is None:
+                raise QuerySetError(
+                    detail=f"Cannot paginate by {name}, only the model columns are supported."
+                )
+            if column.nullable and not column.primary_key:
+                raise QuerySetError(
+                    detail=f"Cannot paginate by {name}, the nullable columns are not supported."
+                )
+
+        if pkname not in [name.lstrip("-") for name in order]:
+            descending = bool(order) and order[-1].startswith("-")
+            order.append(f"-{pkname}" if descending else pkname)
+        return order
+
+    def _build_keyset_clause(
+        self, order_by: Sequence[str], values: Sequence[Any], direction: str
+    ) -> Any:
+        """
+        Builds the clause selecting the rows after (or before) the cursor values.
+
+        When all the columns have the same direction, a row value comparison is used,
+        `(col1, col2) > (:a, :b)`, otherwise the equivalent expanded form.
+        """
+        columns = []
+        greater = []
+        for name in order_by:
+            descending = name.startswith("-")
+            columns.append(self.table.columns[name.lstrip("-")])  # type: ignore
+            greater.append(descending == (direction == PREVIOUS))
+
+        # The values of the enums are stored in the cursor and converted back to the members.
+        values = [
+            (
+                column.type.enum_class(value)
+                if isinstance(column.type, sqlalchemy.Enum)
+                and column.type.enum_class is not None
+                and not isinstance(value, column.type.enum_class)
+                else value
+            )
+            for column, value in zip(columns, values)
+        ]
+
+        if len(set(greater)) == 1:
+            left = sqlalchemy.tuple_(*columns)
+            right = sqlalchemy.tuple_(
+                *[
+                    sqlalchemy.literal(value, type_=column.type)
+                    for column, value in zip(columns, values)
+                ]
+            )
+            return left > right if greater[0] else left < right
+
+        clauses = []
+        for index, column in enumerate(columns):
+            equals = [columns[i] == values[i] for i in range(index)]
+            comparison = column > values[index] if greater[index] else column < values[index]
+            clauses.append(sqlalchemy.and_(*equals, comparison))
+        return sqlalchemy.or_(*clauses)
+
+    def _get_cursor_values(self, instance: "Model", order_by: Sequence[str]) -> List[Any]:
+        values = []
+        for name in order_by:
+            value = getattr(instance, name.lstrip("-"))
+            if hasattr(value, "__db_model__"):
+                value = value.pk
+            values.append(value)
+        return values
+
+    async def paginate_after(
+        self,
+        cursor: Optional[str] = None,
+        order_by: Optional[Sequence[str]] = None,
+        page_size: int = 20,
+    ) -> Page:
+        """
+        Returns the page of results after the cursor using keyset pagination.
+
+        Instead of an `OFFSET`, the page is filtered by the values of the ordering columns
+        of the last row seen, which keeps every page as fast as the first one. The ordering
+        is the one of the queryset (or `order_by`) with the primary key as tiebreaker.
+
+        The returned `Page` contains the `next_cursor` and `previous_cursor` tokens used
+        to request the pages around it.
+        """
+        if page_size < 1:
+            raise QuerySetError(detail="The page_size must be greater than zero.")
+
+        queryset: "QuerySet" = self._clone()  # type: ignore
+        order = queryset._get_pagination_order(order_by)
+
+        values: List[Any] = []
+        direction = NEXT
+        if cursor is not None:
+            values, direction = decode_cursor(cursor, order)
+
+        query_order = order
+        if direction == PREVIOUS:
+            query_order = [name[1:] if name.startswith("-") else f"-{name}" for name in order]
+
+        queryset = queryset.order_by(*query_order)
+        if cursor is not None:
+            queryset = queryset.filter(queryset._build_keyset_clause(order, values, direction))
+
+        results = await queryset.limit(page_size + 1)
+        has_more = len(results) > page_size
+        results = results[:page_size]
+
+        if direction == PREVIOUS:
+            results.reverse()
+
+        page = Page(results=results)
+        if not results:
+            if cursor is not None:
+                opposite = PREVIOUS if direction == NEXT else NEXT
+                cursor_token = encode_cursor(order, values, opposite)
+                if direction == NEXT:
+                    page.previous_cursor = cursor_token
+                else:
+                    page.next_cursor = cursor_token
+            return page
+
+        first = self._get_cursor_values(results[0], order)
+        last = self._get_cursor_values(results[-1], order)
+
+        if direction == NEXT:
+            if has_more:
+                page.next_cursor = encode_cursor(order, last, NEXT)
+            if cursor is not None:
+                page.previous_cursor = encode_cursor(order, first, PREVIOUS)
+        else:
+            if has_more:
+                page.previous_cursor = encode_cursor(order, first, PREVIOUS)
+            page.next_cursor = encode_cursor(order, last, NEXT)
+        return page
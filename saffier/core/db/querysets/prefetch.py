@@ -1,9 +1,10 @@
-from typing import TYPE_CHECKING, List, Optional, cast
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, cast
 
+from saffier.core.utils.db import chunked, get_max_bind_params
 from saffier.exceptions import QuerySetError
 
 if TYPE_CHECKING:
-    from saffier import QuerySet
+    from saffier import Model, QuerySet
 
 
 class Prefetch:
@@ -49,3 +50,113 @@ class PrefetchMixin:
         prefetch = list(self._prefetch_related) + prefetch  # type: ignore
         queryset._prefetch_related = prefetch
         return queryset
+
+    def _get_prefetch_lookup(self, prefetch: Prefetch) -> Tuple["QuerySet", str, List[str]]:
+        """
+        Returns the queryset of the related records, the lookup filtering them by the primary
+        keys of the models being prefetched and the path from a related record to its model.
+
+        1. `related_name` with a queryset, when the related name is a lookup of the queryset model.
+        2. `related_name` of a reverse relation of the model, optionally with a queryset.
+        3. Nested `related_name`, each related name is followed from the model down to the last
+        related model.
+        """
+        model_class = self.model_class  # type: ignore
+        parts = prefetch.related_name.split("__")
+
+        if len(parts) == 1:
+            queryset = prefetch.queryset
+            if queryset is not None and hasattr(queryset.model_class, prefetch.related_name):
+                return queryset, f"{prefetch.related_name}__{model_class.pkname}", parts
+
+            related_model = getattr(model_class, prefetch.related_name).related_from
+            foreign_key_name = related_model.meta.related_names_mapping[prefetch.related_name]
+            if queryset is None:
+                queryset = related_model.query.all()
+            return queryset, foreign_key_name, [foreign_key_name]
+
+        related_model = model_class
+        for part in parts[:-1]:
+            related_model = related_model.meta.related_fields[part].related_to
+        related_model = getattr(related_model, parts[-1]).related_from
+
+        path = [related_model.meta.related_names_mapping[parts[-1]], *reversed(parts[:-1])]
+        queryset = (
+            prefetch.queryset if prefetch.queryset is not None else related_model.query.all()
+        )
+        return queryset, f"{'__'.join(path)}__{model_class.pkname}", path
+
+    def _get_prefetch_parent_pk(self, record: "Model", path: Sequence[str]) -> Any:
+        """
+        Follows the path from the related record to the prefetched model and returns its pk.
+        """
+        value: Any = record
+        for part in path:
+            value = getattr(value, part)
+        return value.pk
+
+    async def _prefetch_related_objects(self, results: Sequence["Model"]) -> None:
+        """
+        Loads the prefetch related records of all the results at once.
+
+        Runs one `IN` query per `Prefetch`, chunked by the bind parameters limit of the
+        dialect, and assigns the records to the `to_attr` of each model.
+
+        A queryset with a limit or an offset applies them to the records of each model,
+        running one query per model.
+        """
+        if not self._prefetch_related or not results:  # type: ignore
+            return
+
+        parents: Dict[Any, List["Model"]] = {}
+        for result in results:
+            parents.setdefault(result.pk, []).append(result)
+        pks = [pk for pk in parents if pk is not None]
+
+        instance = results[0]
+        for prefetch in self._prefetch_related:  # type: ignore
+            if prefetch.to_attr in instance.__dict__ or hasattr(
+                instance.__class__, prefetch.to_attr
+            ):
+                raise QuerySetError(
+                    f"Conflicting attribute to_attr='{prefetch.related_name}' with '{prefetch.to_attr}' in {instance.__class__.__name__}"
+                )
+
+            queryset, lookup, path = self._get_prefetch_lookup(prefetch)
+            if queryset.limit_count is not None or queryset._offset is not None:
+                records = await self._get_prefetch_records_per_parent(queryset, lookup, pks)
+            else:
+                records = await self._get_prefetch_records(queryset, lookup, path, pks)
+
+            for pk, models in parents.items():
+                for model in models:
+                    setattr(model, prefetch.to_attr, list(records.get(pk, [])))
+
+    async def _get_prefetch_records(
+        self, queryset: "QuerySet", lookup: str, path: Sequence[str], pks: List[Any]
+    ) -> Dict[Any, List["Model"]]:
+        """
+        Loads the related records of all the models with `IN` queries, chunked by the
+        bind parameters limit of the dialect.
+        """
+        chunk_size = (
+            get_max_bind_params(queryset.database)
+            - len(queryset.filter_clauses)
+            - len(queryset.or_clauses)
+        )
+
+        records: Dict[Any, List["Model"]] = {}
+        for chunk in chunked(pks, chunk_size):
+            for record in await queryset.filter(**{f"{lookup}__in": chunk}):
+                parent_pk = self._get_prefetch_parent_pk(record, path)
+                records.setdefault(parent_pk, []).append(record)
+        return records
+
+    async def _get_prefetch_records_per_parent(
+        self, queryset: "QuerySet", lookup: str, pks: List[Any]
+    ) -> Dict[Any, List["Model"]]:
+        """
+        Loads the related records of each model with its own query, keeping the limit and
+        offset of the queryset per model.
+        """
+        return {pk: list(await queryset.filter(**{lookup: pk})) for pk in pks}
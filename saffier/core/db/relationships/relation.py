@@ -1,6 +1,10 @@
 import functools
-from typing import TYPE_CHECKING, Any, Optional, Type, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Type, Union
 
+import sqlalchemy
+
+from saffier.core.db.models.loaders import invalidate
+from saffier.core.utils.db import chunked, get_max_bind_params
 from saffier.exceptions import RelationshipIncompatible, RelationshipNotFound
 from saffier.protocols.many_relationship import ManyRelationProtocol
 
@@ -100,6 +104,172 @@ class Relation(ManyRelationProtocol):
         child = await self.through.query.filter(**self._relation_params).get()  # type: ignore
         await child.delete()  # type: ignore
 
+    async def add_many(self, children: Sequence[Type["Model"]]) -> None:
+        """
+        Adds the children to the relationship, ignoring the ones already added.
+
+        Each chunk of children is added with one `INSERT ... SELECT ... WHERE NOT EXISTS`,
+        without validating nor saving the through model one by one, hence without its signals.
+        The through models with callable defaults are added with a `bulk_create` instead, to
+        get the default values of each record.
+        """
+        pks = self._get_children_pks(children)
+        if not pks:
+            return
+
+        # The fields of a custom through model filled by their defaults.
+        defaults = self._get_through_defaults()
+        if defaults is None:
+            await self._bulk_create(pks)
+            return
+
+        queryset = self._get_through_queryset()
+        table = queryset.table
+        owner_column = table.columns[self.owner_name]
+        to_column = table.columns[self.to_name]
+        target_table = self.to.meta.manager.get_queryset().table  # type: ignore
+        target_pk = target_table.columns[self.to.pkname]  # type: ignore
+        owner_pk = self.instance.pk  # type: ignore
+
+        columns = [
+            sqlalchemy.literal(owner_pk, type_=owner_column.type),
+            target_pk,
+            *(
+                sqlalchemy.literal(value, type_=table.columns[key].type)
+                for key, value in defaults.items()
+            ),
+        ]
+        exists = sqlalchemy.exists().where(owner_column == owner_pk, to_column == target_pk)
+
+        database = queryset.database
+        async with database.transaction():
+            for chunk in chunked(pks, get_max_bind_params(database) - len(columns)):
+                select = sqlalchemy.select(*columns).where(target_pk.in_(chunk), ~exists)
+                expression = table.insert().from_select(
+                    [self.owner_name, self.to_name, *defaults], select
+                )
+                await database.execute(expression)
+        await self._invalidate(queryset)
+
+    async def remove_many(self, children: Sequence[Type["Model"]]) -> None:
+        """
+        Removes the children from the relationship, ignoring the ones not added.
+
+        Each chunk of children is removed with one `DELETE ... WHERE owner = ... AND to IN (...)`.
+        """
+        pks = self._get_children_pks(children)
+        if pks:
+            await self._delete(pks)
+
+    async def set(self, children: Sequence[Type["Model"]]) -> None:
+        """
+        Makes the children the only ones of the relationship, adding the missing ones and
+        removing the others, leaving the ones already added untouched.
+        """
+        pks = set(self._get_children_pks(children))
+
+        queryset = self._get_through_queryset()
+        table = queryset.table
+        expression = sqlalchemy.select(table.columns[self.to_name]).where(
+            table.columns[self.owner_name] == self.instance.pk  # type: ignore
+        )
+
+        async with queryset.database.transaction():
+            current = {row[0] for row in await queryset.database.fetch_all(expression)}
+            removed = [pk for pk in current if pk not in pks]
+            if removed:
+                await self._delete(removed)
+            added = [child for child in children if child.pk not in current]
+            if added:
+                await self.add_many(added)
+
+    async def clear(self) -> None:
+        """
+        Removes all the children of the relationship with one `DELETE`.
+        """
+        await self._delete(None)
+
+    def _get_through_queryset(self) -> Any:
+        return self.through.meta.manager.get_queryset()  # type: ignore
+
+    def _get_children_pks(self, children: Sequence[Type["Model"]]) -> List[Any]:
+        """
+        Validates the type of the children and returns their primary keys, without repeating.
+        The children not saved yet raise `RelationshipIncompatible`.
+        """
+        pks: Dict[Any, None] = {}
+        for child in children:
+            if not isinstance(child, self.to):  # type: ignore
+                raise RelationshipIncompatible(f"The child is not from the type '{self.to.__name__}'.")  # type: ignore
+            if child.pk is None:
+                raise RelationshipIncompatible("The child must be saved before being related.")
+            pks[child.pk] = None
+        return list(pks)
+
+    def _get_through_defaults(self) -> Optional[Dict[str, Any]]:
+        """
+        The default values of the fields of the through model besides the primary key and the
+        two foreign keys, or `None` when a default is callable and gets a value per record.
+        """
+        through = self.through
+        excluded = (through.pkname, self.owner_name, self.to_name)  # type: ignore
+        defaults = {}
+        for key, field in through.fields.items():  # type: ignore
+            if key in excluded or not field.validator.has_default():
+                continue
+            if callable(field.validator.default):
+                return None
+            defaults[key] = field.validator.default
+        return defaults
+
+    async def _bulk_create(self, pks: List[Any]) -> None:
+        """
+        Adds the children not added yet with a `bulk_create` of the through model.
+        """
+        queryset = self._get_through_queryset()
+        table = queryset.table
+        owner_pk = self.instance.pk  # type: ignore
+        owner_column = table.columns[self.owner_name]
+        to_column = table.columns[self.to_name]
+
+        database = queryset.database
+        async with database.transaction():
+            current = set()
+            for chunk in chunked(pks, get_max_bind_params(database) - 1):
+                expression = sqlalchemy.select(to_column).where(
+                    owner_column == owner_pk, to_column.in_(chunk)
+                )
+                current.update(row[0] for row in await database.fetch_all(expression))
+
+            await queryset.bulk_create(
+                [{self.owner_name: owner_pk, self.to_name: pk} for pk in pks if pk not in current]
+            )
+        await self._invalidate(queryset)
+
+    async def _delete(self, pks: Optional[List[Any]]) -> None:
+        """
+        Deletes the rows of the through model of the owner, for the given children or all.
+        """
+        queryset = self._get_through_queryset()
+        table = queryset.table
+        owner_clause = table.columns[self.owner_name] == self.instance.pk  # type: ignore
+
+        database = queryset.database
+        if pks is None:
+            await database.execute(table.delete().where(owner_clause))
+        else:
+            to_column = table.columns[self.to_name]
+            async with database.transaction():
+                for chunk in chunked(pks, get_max_bind_params(database) - 1):
+                    await database.execute(
+                        table.delete().where(owner_clause, to_column.in_(chunk))
+                    )
+        await self._invalidate(queryset)
+
+    async def _invalidate(self, queryset: Any) -> None:
+        invalidate(table=queryset.table)
+        await queryset._invalidate_results()
+
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__}: {self}>"
 
@@ -1,12 +1,25 @@
-from .handlers import post_delete, post_save, post_update, pre_delete, pre_save, pre_update
+from .handlers import (
+    post_bulk_create,
+    post_bulk_update,
+    post_delete,
+    post_save,
+    post_update,
+    pre_bulk_create,
+    pre_delete,
+    pre_save,
+    pre_update,
+)
 from .signal import Broadcaster, Signal
 
 __all__ = [
     "Broadcaster",
     "Signal",
+    "post_bulk_create",
+    "post_bulk_update",
     "post_delete",
     "post_save",
     "post_update",
+    "pre_bulk_create",
     "pre_delete",
     "pre_save",
     "pre_update",
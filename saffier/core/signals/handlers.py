@@ -65,3 +65,24 @@ def post_delete(senders: Union[Type["Model"], List[Type["Model"]]]) -> Callable:
     Connects all the senders to post_delete.
     """
     return Send.consumer(signal="post_delete", senders=senders)
+
+
+def pre_bulk_create(senders: Union[Type["Model"], List[Type["Model"]]]) -> Callable:
+    """
+    Connects all the senders to pre_bulk_create.
+    """
+    return Send.consumer(signal="pre_bulk_create", senders=senders)
+
+
+def post_bulk_create(senders: Union[Type["Model"], List[Type["Model"]]]) -> Callable:
+    """
+    Connects all the senders to post_bulk_create.
+    """
+    return Send.consumer(signal="post_bulk_create", senders=senders)
+
+
+def post_bulk_update(senders: Union[Type["Model"], List[Type["Model"]]]) -> Callable:
+    """
+    Connects all the senders to post_bulk_update.
+    """
+    return Send.consumer(signal="post_bulk_update", senders=senders)
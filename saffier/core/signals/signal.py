@@ -52,8 +52,15 @@ class Signal:
 
     async def send(self, sender: Type["Model"], **kwargs: Any) -> None:
         """
-        Sends the notification to all the receivers.
+        Sends the notification to all the receivers, without scheduling anything when
+        there are none.
         """
+        if not self.receivers:
+            return
+        if len(self.receivers) == 1:
+            for func in self.receivers.values():
+                await func(sender=sender, **kwargs)
+            return
         receivers = [func(sender=sender, **kwargs) for func in self.receivers.values()]
         await asyncio.gather(*receivers)
 
@@ -0,0 +1,65 @@
+from typing import Any, Iterator, List, Sequence
+
+import sqlalchemy
+from sqlalchemy.engine import Dialect
+
+from saffier.conf import settings
+from saffier.core.connection.database import Database
+
+
+def get_max_bind_params(database: Database) -> int:
+    """
+    Returns the maximum number of bind parameters a single statement can have
+    for the dialect of the database.
+    """
+    dialect = database.url.dialect
+    return settings.max_bind_params.get(dialect, settings.default_max_bind_params)
+
+
+def chunked(values: Sequence[Any], size: int) -> Iterator[List[Any]]:
+    """
+    Splits the values in lists of at most `size` elements.
+    """
+    size = max(size, 1)
+    for index in range(0, len(values), size):
+        yield list(values[index : index + size])
+
+
+def get_dialect(database: Database) -> Dialect:
+    """
+    Returns the SQLAlchemy dialect used by the database to compile the statements.
+    """
+    return database._backend._dialect  # type: ignore
+
+
+def supports_insert_returning(database: Database) -> bool:
+    """
+    Checks if the dialect of the database supports `INSERT ... RETURNING`.
+    """
+    return bool(get_dialect(database).insert_returning)
+
+
+def supports_update_returning(database: Database) -> bool:
+    """
+    Checks if the dialect of the database supports `UPDATE ... RETURNING`.
+    """
+    return bool(get_dialect(database).update_returning)
+
+
+class BindCast(sqlalchemy.types.TypeDecorator):
+    """
+    Wraps a column type, rendering its bind parameters with an explicit `CAST`.
+
+    Used where the database cannot infer the type of the parameters, like the rows
+    of a `VALUES` used as a table.
+    """
+
+    impl = sqlalchemy.types.NullType
+    cache_ok = True
+
+    def __init__(self, type_: Any) -> None:
+        super().__init__()
+        self.impl = sqlalchemy.types.to_instance(type_)
+
+    def bind_expression(self, bindvalue: Any) -> Any:
+        return sqlalchemy.cast(bindvalue, self.impl)
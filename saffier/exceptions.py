@@ -48,6 +48,9 @@ class DuplicateRecordError(SaffierException): ...
 class RelationshipNotFound(SaffierException): ...
 
 
+class RelationshipNotLoaded(SaffierException): ...
+
+
 class QuerySetError(SaffierException): ...
 
 
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, runtime_checkable
+from typing import TYPE_CHECKING, Sequence, runtime_checkable
 
 try:
     from typing import Protocol
@@ -17,3 +17,11 @@ class ManyRelationProtocol(Protocol):
     async def add(self, child: "Model") -> None: ...
 
     async def remove(self, child: "Model") -> None: ...
+
+    async def add_many(self, children: Sequence["Model"]) -> None: ...
+
+    async def remove_many(self, children: Sequence["Model"]) -> None: ...
+
+    async def set(self, children: Sequence["Model"]) -> None: ...
+
+    async def clear(self) -> None: ...
@@ -1,6 +1,7 @@
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncIterator,
     Dict,
     List,
     Optional,
@@ -14,7 +15,7 @@ from typing import (
 )
 
 if TYPE_CHECKING:  # pragma: nocover
-    from saffier import Model, QuerySet, ReflectModel
+    from saffier import Model, Page, QuerySet, ReflectModel
 
 
 _SaffierModel = TypeVar("_SaffierModel", bound="Model")
@@ -47,12 +48,24 @@ class QuerySetProtocol(Protocol):
 
     async def exists(self) -> bool: ...
 
-    async def count(self) -> int: ...
+    async def count(self, estimate: bool) -> int: ...
+
+    def annotate(self, *args: Any, **kwargs: Any) -> "QuerySet": ...
+
+    async def aggregate(self, *args: Any, **kwargs: Any) -> Dict[str, Any]: ...
+
+    def cache(self, ttl: Optional[float]) -> "QuerySet": ...
 
     async def get_or_none(self, **kwargs: Any) -> Union[SaffierModel, None]: ...
 
     async def all(self, **kwargs: Any) -> Sequence[Optional[SaffierModel]]: ...
 
+    def iterate(self, chunk_size: int, as_dict: bool, as_tuple: bool) -> AsyncIterator[Any]: ...
+
+    async def paginate_after(
+        self, cursor: Optional[str], order_by: Optional[Sequence[str]], page_size: int
+    ) -> "Page": ...
+
     async def get(self, **kwargs: Any) -> SaffierModel: ...
 
     async def first(self, **kwargs: Any) -> Union[SaffierModel, None]: ...
@@ -61,9 +74,31 @@ class QuerySetProtocol(Protocol):
 
     async def create(self, **kwargs: Any) -> SaffierModel: ...
 
-    async def bulk_create(self, objs: Sequence[List[Dict[Any, Any]]]) -> None: ...
-
-    async def bulk_update(self, objs: Sequence[List[SaffierModel]], fields: List[str]) -> None: ...
+    async def bulk_create(
+        self,
+        objs: Sequence[List[Dict[Any, Any]]],
+        batch_size: Optional[int],
+        returning: bool,
+        use_executemany: bool,
+        validate: bool,
+    ) -> Optional[List[SaffierModel]]: ...
+
+    async def bulk_update(
+        self, objs: Sequence[List[SaffierModel]], fields: List[str], batch_size: Optional[int]
+    ) -> None: ...
+
+    async def bulk_upsert(
+        self,
+        objs: Sequence[List[Dict[Any, Any]]],
+        conflict_fields: List[str],
+        update_fields: Optional[List[str]],
+        batch_size: Optional[int],
+        returning: bool,
+    ) -> Optional[List[SaffierModel]]: ...
+
+    async def upsert(
+        self, conflict_fields: List[str], update_fields: Optional[List[str]], **kwargs: Any
+    ) -> SaffierModel: ...
 
     async def delete(self) -> None: ...
 
@@ -0,0 +1,22 @@
+from typing import Any, Optional, Protocol, Set, Tuple, runtime_checkable
+
+TableKey = Tuple[str, Optional[str]]
+
+
+@runtime_checkable
+class ResultCacheProtocol(Protocol):
+    """
+    Defines what needs to be implemented by a backend of the query result cache.
+
+    The keys are strings and the tables are the `(name, schema)` read by the statement of
+    the entry. The values are the results of the driver, which a backend of an external
+    store is responsible for serializing.
+    """
+
+    async def get(self, key: str) -> Tuple[bool, Any]: ...
+
+    async def set(self, key: str, value: Any, ttl: float, tables: Set[TableKey]) -> None: ...
+
+    async def invalidate(self, tables: Set[TableKey]) -> None: ...
+
+    async def clear(self) -> None: ...
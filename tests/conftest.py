@@ -1,10 +1,54 @@
+import inspect
 import os
 
 import pytest
 
+from saffier.core.utils.db import get_dialect
+
 os.environ.setdefault("SAFFIER_SETTINGS_MODULE", "tests.settings.TestSettings")
 
+RECORDED_METHODS = ("execute", "execute_many", "fetch_one", "fetch_all", "fetch_val", "iterate")
+
 
 @pytest.fixture(scope="module")
 def anyio_backend():
     return ("asyncio", {"debug": True})
+
+
+@pytest.fixture()
+def record_queries(monkeypatch):
+    """
+    Records the compiled SQL of every statement sent through the given database.
+
+    queries = record_queries(database)
+    """
+
+    def record(database):
+        queries = []
+
+        def compile_query(query):
+            if isinstance(query, str):
+                return query
+            return str(query.compile(dialect=get_dialect(database)))
+
+        def recorded(method):
+            if inspect.isasyncgenfunction(method):
+
+                async def recorded_iterate(query, *args, **kwargs):
+                    queries.append(compile_query(query))
+                    async for row in method(query, *args, **kwargs):
+                        yield row
+
+                return recorded_iterate
+
+            async def recorded_method(query, *args, **kwargs):
+                queries.append(compile_query(query))
+                return await method(query, *args, **kwargs)
+
+            return recorded_method
+
+        for name in RECORDED_METHODS:
+            monkeypatch.setattr(database, name, recorded(getattr(database, name)))
+        return queries
+
+    return record
@@ -0,0 +1,163 @@
+import asyncio
+
+import pytest
+
+import saffier
+from saffier.core.db.context_vars import get_dataloader
+from saffier.testclient import DatabaseTestClient as Database
+from tests.settings import DATABASE_URL
+
+database = Database(url=DATABASE_URL)
+models = saffier.Registry(database=database)
+
+pytestmark = pytest.mark.anyio
+
+
+class Organisation(saffier.Model):
+    id = saffier.IntegerField(primary_key=True)
+    name = saffier.CharField(max_length=100)
+
+    class Meta:
+        registry = models
+
+
+class Author(saffier.Model):
+    id = saffier.IntegerField(primary_key=True)
+    name = saffier.CharField(max_length=100)
+    organisation = saffier.ForeignKey(Organisation, null=True)
+
+    class Meta:
+        registry = models
+
+
+class Post(saffier.Model):
+    id = saffier.IntegerField(primary_key=True)
+    title = saffier.CharField(max_length=100)
+    author = saffier.ForeignKey(Author)
+
+    class Meta:
+        registry = models
+
+
+@pytest.fixture(autouse=True, scope="function")
+async def create_test_database():
+    await models.create_all()
+    yield
+    await models.drop_all()
+
+
+@pytest.fixture(autouse=True)
+async def rollback_connections():
+    with database.force_rollback():
+        async with database:
+            yield
+
+
+@pytest.fixture()
+def selects(record_queries):
+    return record_queries(database)
+
+
+@pytest.fixture()
+async def posts():
+    organisation = await Organisation.query.create(name="Saffier")
+    john = await Author.query.create(name="John", organisation=organisation)
+    jane = await Author.query.create(name="Jane", organisation=organisation)
+    lucy = await Author.query.create(name="Lucy")
+
+    await Post.query.create(title="First", author=john)
+    await Post.query.create(title="Second", author=jane)
+    await Post.query.create(title="Third", author=john)
+    await Post.query.create(title="Fourth", author=lucy)
+
+
+async def test_loads_in_the_same_tick_are_batched(posts, selects):
+    posts = await Post.query.order_by("id")
+    selects.clear()
+
+    async with saffier.DataLoader():
+        await asyncio.gather(*(post.author.load() for post in posts))
+
+    assert len(selects) == 1
+    assert " IN " in selects[0]
+    assert [post.author.name for post in posts] == ["John", "Jane", "John", "Lucy"]
+    assert posts[0].author.get_dirty_fields() == set()
+
+
+async def test_batches_per_table(posts, selects):
+    posts = await Post.query.order_by("id")
+    authors = await Author.query.order_by("id")
+    selects.clear()
+
+    async with saffier.DataLoader():
+        await asyncio.gather(
+            *(post.author.load() for post in posts),
+            *(author.organisation.load() for author in authors if author.organisation.pk),
+        )
+
+    assert len(selects) == 2
+    assert authors[0].organisation.name == "Saffier"
+
+
+async def test_results_are_memoized(posts, selects):
+    posts = await Post.query.order_by("id")
+    selects.clear()
+
+    async with saffier.DataLoader():
+        await posts[0].author.load()
+        await posts[2].author.load()
+
+        with saffier.strict_loading():
+            assert posts[2].author.name == "John"
+
+    assert len(selects) == 1
+
+
+async def test_field_access_uses_the_loaded_rows(posts, selects):
+    posts = await Post.query.order_by("id")
+    selects.clear()
+
+    async with saffier.DataLoader():
+        await asyncio.gather(*(post.author.load() for post in posts[:2]))
+        other = await Post.query.get(title="Third")
+        selects.clear()
+
+        assert other.author.name == "John"
+
+    assert selects == []
+
+
+async def test_updates_invalidate_the_loaded_rows(posts, selects):
+    posts = await Post.query.order_by("id")
+
+    async with saffier.DataLoader():
+        await posts[0].author.load()
+        await posts[0].author.update(name="Johnny")
+        await posts[2].author.load()
+        assert posts[2].author.name == "Johnny"
+
+        await Author.query.filter(name="Johnny").update(name="John")
+        await posts[2].author.load()
+        assert posts[2].author.name == "John"
+
+        await Author.query.upsert(["id"], id=posts[2].author.pk, name="Jon")
+        await posts[2].author.load()
+        assert posts[2].author.name == "Jon"
+
+        await Author.query.update_or_create(id=posts[2].author.pk, defaults={"name": "John"})
+        await posts[2].author.load()
+        assert posts[2].author.name == "John"
+
+
+async def test_scope(posts, selects):
+    post = await Post.query.get(title="First")
+
+    async with saffier.DataLoader() as loader:
+        assert get_dataloader() is loader
+
+    assert get_dataloader() is None
+
+    selects.clear()
+    await post.author.load()
+    assert post.author.name == "John"
+    assert " IN " not in selects[0]
@@ -0,0 +1,148 @@
+import pytest
+
+import saffier
+from saffier.exceptions import QuerySetError, RelationshipNotLoaded
+from saffier.testclient import DatabaseTestClient as Database
+from tests.settings import DATABASE_URL
+
+database = Database(url=DATABASE_URL)
+models = saffier.Registry(database=database)
+
+pytestmark = pytest.mark.anyio
+
+
+class Organisation(saffier.Model):
+    id = saffier.IntegerField(primary_key=True)
+    name = saffier.CharField(max_length=100)
+
+    class Meta:
+        registry = models
+
+
+class Author(saffier.Model):
+    id = saffier.IntegerField(primary_key=True)
+    name = saffier.CharField(max_length=100)
+    organisation = saffier.ForeignKey(Organisation, null=True)
+
+    class Meta:
+        registry = models
+
+
+class Post(saffier.Model):
+    id = saffier.IntegerField(primary_key=True)
+    title = saffier.CharField(max_length=100)
+    author = saffier.ForeignKey(Author, null=True)
+
+    class Meta:
+        registry = models
+
+
+@pytest.fixture(autouse=True, scope="function")
+async def create_test_database():
+    await models.create_all()
+    yield
+    await models.drop_all()
+
+
+@pytest.fixture(autouse=True)
+async def rollback_connections():
+    with database.force_rollback():
+        async with database:
+            yield
+
+
+@pytest.fixture()
+def selects(record_queries):
+    return record_queries(database)
+
+
+@pytest.fixture()
+async def posts():
+    saffier_org = await Organisation.query.create(name="Saffier")
+    other_org = await Organisation.query.create(name="Other")
+
+    john = await Author.query.create(name="John", organisation=saffier_org)
+    jane = await Author.query.create(name="Jane", organisation=other_org)
+    lucy = await Author.query.create(name="Lucy")
+
+    await Post.query.create(title="First", author=john)
+    await Post.query.create(title="Second", author=jane)
+    await Post.query.create(title="Third", author=john)
+    await Post.query.create(title="Fourth", author=lucy)
+    await Post.query.create(title="Fifth")
+
+
+async def test_load_related(posts, selects):
+    posts = await Post.query.order_by("id")
+    selects.clear()
+
+    await saffier.load_related(posts, "author")
+
+    assert len(selects) == 1
+    assert [post.author.name if post.author.pk else None for post in posts] == [
+        "John",
+        "Jane",
+        "John",
+        "Lucy",
+        None,
+    ]
+    assert posts[0].get_dirty_fields() == set()
+    assert posts[0].author.get_dirty_fields() == set()
+
+
+async def test_load_related_nested(posts, selects):
+    posts = await Post.query.order_by("id")
+    selects.clear()
+
+    await saffier.load_related(posts, "author", "author__organisation")
+
+    assert len(selects) == 2
+    with saffier.strict_loading():
+        assert [
+            post.author.organisation.name
+            for post in posts
+            if post.author.pk and post.author.organisation.pk
+        ] == ["Saffier", "Other", "Saffier"]
+
+
+async def test_load_related_skips_loaded_instances(posts, selects):
+    posts = await Post.query.select_related("author").order_by("id")
+    selects.clear()
+
+    await saffier.load_related(posts, "author")
+
+    assert selects == []
+    assert posts[0].author.name == "John"
+
+
+async def test_load_related_empty():
+    await saffier.load_related([], "author")
+
+
+async def test_load_related_not_a_foreign_key(posts):
+    posts = await Post.query.all()
+
+    with pytest.raises(QuerySetError):
+        await saffier.load_related(posts, "title")
+
+
+async def test_strict_loading_raises(posts):
+    post = await Post.query.get(title="First")
+
+    with saffier.strict_loading():
+        with pytest.raises(RelationshipNotLoaded):
+            post.author.name  # noqa
+
+        await saffier.load_related([post], "author")
+        assert post.author.name == "John"
+
+
+async def test_strict_loading_setting(posts, monkeypatch):
+    monkeypatch.setattr(saffier.settings, "strict_loading", True)
+    post = await Post.query.get(title="Second")
+
+    with pytest.raises(RelationshipNotLoaded):
+        post.author.name  # noqa
+
+    with saffier.strict_loading(False):
+        assert post.author.name == "Jane"
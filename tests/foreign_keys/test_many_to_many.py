@@ -316,3 +316,25 @@ async def test_related_name_query_returns_nothing():
     tracks_album = await track3.track_albumtracks_set.filter(album__name=album.name)
 
     assert len(tracks_album) == 0
+
+
+async def test_many_to_many_loads_the_related_records(record_queries):
+    album = await Album.query.create(name="Malibu")
+    track1 = await Track.query.create(title="The Bird", position=1)
+    track2 = await Track.query.create(title="The Waters", position=2)
+
+    await album.tracks.add(track1)
+    await album.tracks.add(track2)
+
+    executed = record_queries(database)
+
+    with saffier.strict_loading():
+        album_tracks = await album.tracks.all()
+        assert sorted((track.title, track.position) for track in album_tracks) == [
+            ("The Bird", 1),
+            ("The Waters", 2),
+        ]
+
+    assert len(executed) == 1
+    assert isinstance(album_tracks[0], Track)
+    assert "JOIN" in executed[0]
@@ -0,0 +1,198 @@
+import uuid
+
+import pytest
+
+import saffier
+from saffier.exceptions import RelationshipIncompatible
+from saffier.testclient import DatabaseTestClient as Database
+from tests.settings import DATABASE_URL
+
+pytestmark = pytest.mark.anyio
+
+database = Database(DATABASE_URL)
+models = saffier.Registry(database=database)
+
+
+class User(saffier.Model):
+    id = saffier.IntegerField(primary_key=True)
+    name = saffier.CharField(max_length=100)
+
+    class Meta:
+        registry = models
+
+
+class Track(saffier.Model):
+    id = saffier.IntegerField(primary_key=True)
+    title = saffier.CharField(max_length=100)
+
+    class Meta:
+        registry = models
+
+
+class Album(saffier.Model):
+    id = saffier.IntegerField(primary_key=True)
+    name = saffier.CharField(max_length=100)
+    tracks = saffier.ManyToManyField(Track)
+
+    class Meta:
+        registry = models
+
+
+class PlaylistTrack(saffier.Model):
+    id = saffier.IntegerField(primary_key=True)
+    playlist = saffier.IntegerField(null=True)
+    track = saffier.ForeignKey(Track, null=True)
+    code = saffier.UUIDField(default=uuid.uuid4, unique=True)
+    position = saffier.IntegerField(default=0)
+
+    class Meta:
+        registry = models
+
+
+class Playlist(saffier.Model):
+    id = saffier.IntegerField(primary_key=True)
+    name = saffier.CharField(max_length=100)
+    tracks = saffier.ManyToManyField(Track, through=PlaylistTrack)
+
+    class Meta:
+        registry = models
+
+
+@pytest.fixture(autouse=True, scope="function")
+async def create_test_database():
+    await models.create_all()
+    yield
+    await models.drop_all()
+
+
+@pytest.fixture(autouse=True)
+async def rollback_connections():
+    with database.force_rollback():
+        async with database:
+            yield
+
+
+@pytest.fixture()
+def statements(record_queries):
+    return record_queries(database)
+
+
+async def get_titles(album):
+    tracks = await album.tracks.all()
+    titles = []
+    for track in tracks:
+        await track.load()
+        titles.append(track.title)
+    return sorted(titles)
+
+
+@pytest.fixture()
+async def tracks():
+    return [await Track.query.create(title=f"Track {index}") for index in range(5)]
+
+
+async def test_add_many(tracks, statements):
+    album = await Album.query.create(name="Malibu")
+    statements.clear()
+
+    await album.tracks.add_many(tracks[:3])
+    await album.tracks.add_many([tracks[2], tracks[3], tracks[3]])
+
+    assert len(statements) == 2
+    assert await get_titles(album) == ["Track 0", "Track 1", "Track 2", "Track 3"]
+
+
+async def test_add_many_keeps_other_owners(tracks):
+    album = await Album.query.create(name="Malibu")
+    other = await Album.query.create(name="Venice")
+
+    await other.tracks.add(tracks[0])
+    await album.tracks.add_many(tracks[:2])
+
+    assert await get_titles(album) == ["Track 0", "Track 1"]
+    assert await get_titles(other) == ["Track 0"]
+
+
+async def test_add_many_chunks(tracks, monkeypatch):
+    monkeypatch.setitem(saffier.settings.max_bind_params, database.url.dialect, 4)
+    album = await Album.query.create(name="Malibu")
+
+    await album.tracks.add_many(tracks)
+
+    assert len(await get_titles(album)) == 5
+
+
+async def test_remove_many(tracks, statements):
+    album = await Album.query.create(name="Malibu")
+    await album.tracks.add_many(tracks)
+    statements.clear()
+
+    await album.tracks.remove_many([tracks[0], tracks[1], tracks[1]])
+
+    assert len(statements) == 1
+    assert await get_titles(album) == ["Track 2", "Track 3", "Track 4"]
+
+
+async def test_set(tracks):
+    album = await Album.query.create(name="Malibu")
+    other = await Album.query.create(name="Venice")
+    await album.tracks.add_many(tracks[:3])
+    await other.tracks.add_many(tracks[:3])
+
+    await album.tracks.set([tracks[1], tracks[3]])
+
+    assert await get_titles(album) == ["Track 1", "Track 3"]
+    assert await get_titles(other) == ["Track 0", "Track 1", "Track 2"]
+
+    await album.tracks.set([])
+    assert await get_titles(album) == []
+
+
+async def test_clear(tracks, statements):
+    album = await Album.query.create(name="Malibu")
+    other = await Album.query.create(name="Venice")
+    await album.tracks.add_many(tracks)
+    await other.tracks.add(tracks[0])
+    statements.clear()
+
+    await album.tracks.clear()
+
+    assert len(statements) == 1
+    assert await album.tracks.all() == []
+    assert await get_titles(other) == ["Track 0"]
+
+
+async def test_incompatible_child(tracks):
+    album = await Album.query.create(name="Malibu")
+    user = await User.query.create(name="Saffier")
+
+    with pytest.raises(RelationshipIncompatible):
+        await album.tracks.add_many([tracks[0], user])
+
+    with pytest.raises(RelationshipIncompatible):
+        await album.tracks.remove_many([user])
+
+
+async def test_add_many_with_callable_through_defaults(tracks):
+    playlist = await Playlist.query.create(name="Morning")
+
+    await playlist.tracks.add_many(tracks[:3])
+    await playlist.tracks.add_many(tracks[2:4])
+
+    rows = await database.fetch_all(PlaylistTrack.table.select())
+    assert sorted(row.track for row in rows) == [track.pk for track in tracks[:4]]
+    assert {row.playlist for row in rows} == {playlist.pk}
+    assert len({row.code for row in rows}) == 4
+    assert {row.position for row in rows} == {0}
+
+
+async def test_unsaved_child(tracks):
+    album = await Album.query.create(name="Malibu")
+
+    with pytest.raises(RelationshipIncompatible):
+        await album.tracks.add_many([tracks[0], Track(title="Unsaved")])
+
+    with pytest.raises(RelationshipIncompatible):
+        await album.tracks.set([Track(title="Unsaved")])
+
+    assert await album.tracks.all() == []
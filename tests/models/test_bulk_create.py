@@ -4,7 +4,9 @@ from enum import Enum
 import pytest
 
 import saffier
+from saffier.conf import settings
 from saffier.core.db import fields
+from saffier.exceptions import QuerySetError
 from saffier.testclient import DatabaseTestClient as Database
 from tests.settings import DATABASE_URL
 
@@ -44,6 +46,14 @@ class Product(saffier.Model):
         registry = models
 
 
+class Tag(saffier.Model):
+    id = fields.IntegerField(primary_key=True)
+    name = fields.CharField(max_length=100, unique=True)
+
+    class Meta:
+        registry = models
+
+
 @pytest.fixture(autouse=True, scope="module")
 async def create_test_database():
     await models.create_all()
@@ -73,3 +83,63 @@ async def test_bulk_create():
     assert products[1].data == {"foo": 456}
     assert products[1].value == 456.789
     assert products[1].status == StatusEnum.DRAFT
+
+
+async def test_bulk_create_returning():
+    products = await Product.query.bulk_create(
+        [{"value": 1.0}, {"value": 2.0, "status": StatusEnum.RELEASED}], returning=True
+    )
+
+    assert len(products) == 2
+    assert all(product.pk is not None for product in products)
+    assert products[0].value == 1.0
+    assert products[1].status == StatusEnum.RELEASED
+
+    product = await Product.query.get(pk=products[1].pk)
+    assert product.value == 2.0
+
+
+async def test_bulk_create_in_chunks(record_queries):
+    executed = record_queries(database)
+
+    await Product.query.bulk_create([{"value": float(index)} for index in range(10)], batch_size=3)
+
+    assert len(executed) == 4
+    assert await Product.query.count() == 10
+
+
+async def test_bulk_create_chunk_size_from_bind_params(monkeypatch):
+    monkeypatch.setitem(settings.max_bind_params, database.url.dialect, 30)
+
+    products = await Product.query.bulk_create(
+        [{"value": float(index)} for index in range(10)], returning=True
+    )
+
+    assert [product.value for product in products] == [float(index) for index in range(10)]
+    assert await Product.query.count() == 10
+
+
+async def test_bulk_create_executemany():
+    await Product.query.bulk_create(
+        [{"value": float(index)} for index in range(5)], use_executemany=True, batch_size=2
+    )
+
+    assert await Product.query.count() == 5
+
+
+async def test_bulk_create_is_atomic():
+    with pytest.raises(Exception):  # noqa
+        await Tag.query.bulk_create([{"name": "a"}, {"name": "b"}, {"name": "a"}], batch_size=2)
+
+    assert await Tag.query.count() == 0
+
+
+async def test_bulk_create_errors():
+    assert await Product.query.bulk_create([]) is None
+    assert await Product.query.bulk_create([], returning=True) == []
+
+    with pytest.raises(QuerySetError):
+        await Product.query.bulk_create([{"value": 1.0}], returning=True, use_executemany=True)
+
+    with pytest.raises(QuerySetError):
+        await Product.query.bulk_create([{"value": 1.0}], batch_size=0)
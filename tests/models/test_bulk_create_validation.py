@@ -0,0 +1,127 @@
+import pytest
+
+import saffier
+from saffier.conf import settings
+from saffier.core.db.fields.columns import get_column_check
+from saffier.exceptions import ValidationError
+from saffier.testclient import DatabaseTestClient as Database
+from tests.settings import DATABASE_URL
+
+pytestmark = pytest.mark.anyio
+
+database = Database(DATABASE_URL)
+models = saffier.Registry(database=database)
+
+
+class Product(saffier.Model):
+    id = saffier.IntegerField(primary_key=True)
+    name = saffier.CharField(max_length=20)
+    rating = saffier.IntegerField(minimum=0, maximum=5, null=True)
+    price = saffier.FloatField(null=True)
+    active = saffier.BooleanField(default=True)
+    description = saffier.TextField(null=True)
+
+    class Meta:
+        registry = models
+
+
+@pytest.fixture(autouse=True, scope="module")
+async def create_test_database():
+    await models.create_all()
+    yield
+    await models.drop_all()
+
+
+@pytest.fixture(autouse=True)
+async def rollback_transactions():
+    with database.force_rollback():
+        async with database:
+            yield
+
+
+@pytest.fixture(params=["python", "numpy"])
+def threshold(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+        monkeypatch.setattr(settings, "numpy_validation_threshold", 1)
+    else:
+        monkeypatch.setattr(settings, "numpy_validation_threshold", 10**9)
+
+
+async def test_same_values_as_the_record_validation(threshold):
+    rows = [
+        {"name": "Shoes", "rating": 1, "price": 1, "active": "true"},
+        {"name": "Sh\0irt", "rating": 2.0, "price": 2.5, "active": False},
+        {"name": "Hat", "rating": None, "description": "Red"},
+    ]
+    validator = Product.get_validator()
+
+    assert validator.check_many(rows) == [validator.check(row) for row in rows]
+
+
+async def test_errors_of_all_the_records(threshold):
+    rows = [
+        {"name": "Shoes", "price": 1.5},
+        {"name": 1, "price": "free"},
+        {"price": float("inf")},
+    ]
+    validator = Product.get_validator()
+
+    expected = []
+    for position, row in enumerate(rows[1:], start=1):
+        with pytest.raises(ValidationError) as error:
+            validator.check(row)
+        for message in error.value.messages():
+            message.index.insert(0, position)
+            expected.append(message)
+
+    with pytest.raises(ValidationError) as error:
+        validator.check_many(rows)
+
+    assert error.value.messages() == expected
+    assert [message.index for message in error.value.messages()] == [
+        [1, "name"],
+        [1, "price"],
+        [2, "name"],
+        [2, "price"],
+    ]
+
+
+async def test_bulk_create_raises_all_the_errors():
+    with pytest.raises(ValidationError) as error:
+        await Product.query.bulk_create([{"name": "Shoes"}, {"name": 1}, {"price": "free"}])
+
+    assert {message.index[0] for message in error.value.messages()} == {1, 2}
+    assert await Product.query.count() == 0
+
+
+async def test_bulk_create(threshold):
+    await Product.query.bulk_create(
+        [{"name": f"Product {index}", "rating": index % 6, "price": index} for index in range(50)]
+    )
+
+    products = await Product.query.order_by("id")
+    assert len(products) == 50
+    assert products[7].rating == 1
+    assert products[7].price == 7.0
+    assert products[7].active is True
+
+
+async def test_column_checks():
+    fields = Product.fields
+
+    assert get_column_check(fields["name"].validator)(["Shoes", "", "S\0", 1, "A" * 21]) == [
+        1,
+        2,
+        3,
+        4,
+    ]
+    assert get_column_check(fields["rating"].validator)([0, 5, 6, -1, 1.0, True, None]) == [
+        2,
+        3,
+        4,
+        5,
+        6,
+    ]
+    assert get_column_check(fields["price"].validator)([1.5, 1, float("nan")]) == [1, 2]
+    assert get_column_check(fields["active"].validator)([True, 1, "false"]) == [1, 2]
@@ -1,10 +1,12 @@
 import datetime
 from enum import Enum
+from types import SimpleNamespace
 
 import pytest
 
 import saffier
 from saffier.core.db import fields
+from saffier.core.db.querysets import base as queryset_base
 from saffier.testclient import DatabaseTestClient as Database
 from tests.settings import DATABASE_URL
 
@@ -130,3 +132,51 @@ async def test_bulk_update_with_relation():
     tracks = await Track.query.all()
     assert tracks[0].album.pk == album2.pk
     assert tracks[1].album.pk == album2.pk
+
+
+async def test_bulk_update_one_statement_per_chunk(record_queries):
+    await Product.query.bulk_create([{"value": float(index)} for index in range(10)])
+    products = await Product.query.order_by("id")
+    for index, product in enumerate(products):
+        product.value = index * 10
+        product.status = StatusEnum.RELEASED
+
+    executed = record_queries(database)
+
+    await Product.query.bulk_update(products, fields=["value", "status"], batch_size=4)
+    assert len(executed) == 3
+
+    products = await Product.query.order_by("id")
+    assert [product.value for product in products] == [index * 10 for index in range(10)]
+    assert all(product.status == StatusEnum.RELEASED for product in products)
+
+
+async def test_bulk_update_with_nulls():
+    await Product.query.bulk_create([{"value": 1.0}, {"value": 2.0}])
+    products = await Product.query.all()
+    for product in products:
+        product.value = None
+        product.price = None
+
+    await Product.query.bulk_update(products, fields=["value", "price"])
+
+    products = await Product.query.all()
+    assert [product.value for product in products] == [None, None]
+
+
+async def test_bulk_update_with_case(monkeypatch):
+    monkeypatch.setattr(
+        queryset_base, "get_dialect", lambda database: SimpleNamespace(name="sqlite")
+    )
+
+    await Product.query.bulk_create([{"value": 1.0}, {"value": 2.0}, {"value": 3.0}])
+    products = await Product.query.order_by("id")
+    products[0].value = 10
+    products[1].data = {"foo": "bar"}
+    products[1].value = None
+
+    await Product.query.bulk_update(products[:2], fields=["value", "data"])
+
+    products = await Product.query.order_by("id")
+    assert [product.value for product in products] == [10, None, 3.0]
+    assert products[1].data == {"foo": "bar"}
@@ -0,0 +1,131 @@
+import pytest
+
+import saffier
+from saffier.testclient import DatabaseTestClient as Database
+from tests.settings import DATABASE_URL
+
+database = Database(url=DATABASE_URL)
+models = saffier.Registry(database=database)
+
+pytestmark = pytest.mark.anyio
+
+
+class Organisation(saffier.Model):
+    id = saffier.IntegerField(primary_key=True)
+    name = saffier.CharField(max_length=100)
+
+    class Meta:
+        registry = models
+
+
+class Team(saffier.Model):
+    id = saffier.IntegerField(primary_key=True)
+    name = saffier.CharField(max_length=100)
+    organisation = saffier.ForeignKey(Organisation, null=True)
+
+    class Meta:
+        registry = models
+
+
+class Member(saffier.Model):
+    id = saffier.IntegerField(primary_key=True)
+    name = saffier.CharField(max_length=100)
+    password = saffier.CharField(max_length=100, secret=True, null=True)
+    team = saffier.ForeignKey(Team, null=True)
+
+    class Meta:
+        registry = models
+
+
+class Product(saffier.Model):
+    id = saffier.IntegerField(primary_key=True)
+    name = saffier.CharField(max_length=100)
+
+    class Meta:
+        registry = models
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.initialised = True
+
+
+@pytest.fixture(autouse=True, scope="function")
+async def create_test_database():
+    await models.create_all()
+    yield
+    await models.drop_all()
+
+
+@pytest.fixture(autouse=True)
+async def rollback_connections():
+    with database.force_rollback():
+        async with database:
+            yield
+
+
+async def test_hydrator_is_cached_per_shape():
+    team = await Team.query.create(name="Core")
+    await Member.query.create(name="Adam", team=team)
+    await Member.query.create(name="Eve")
+
+    models.hydrator_cache.clear()
+
+    members = await Member.query.all()
+    assert len(members) == 2
+
+    members = await Member.query.filter(name="Adam")
+    assert members[0].name == "Adam"
+
+    info = models.cache_info()["hydrators"]
+    assert info.misses == 1
+    assert info.hits == 2
+
+    await Member.query.select_related("team").all()
+    assert models.hydrator_cache.info().misses == 2
+
+
+async def test_foreign_key_is_lazy_loaded():
+    organisation = await Organisation.query.create(name="Saffier")
+    team = await Team.query.create(name="Core", organisation=organisation)
+    await Member.query.create(name="Adam", team=team)
+    await Member.query.create(name="Eve")
+
+    adam = await Member.query.get(name="Adam")
+
+    assert adam.team.pk == team.pk
+    assert adam.team.id == team.id
+    assert adam.team.__dict__ == {"id": team.id}
+    assert adam.team.name == "Core"
+
+    eve = await Member.query.get(name="Eve")
+
+    assert eve.team.pk is None
+
+
+async def test_nested_select_related():
+    organisation = await Organisation.query.create(name="Saffier")
+    team = await Team.query.create(name="Core", organisation=organisation)
+    await Member.query.create(name="Adam", team=team)
+
+    member = await Member.query.select_related(["team", "team__organisation"]).get()
+
+    assert member.team.__dict__["name"] == "Core"
+    assert member.team.organisation.__dict__["name"] == "Saffier"
+
+
+async def test_exclude_secrets():
+    await Member.query.create(name="Adam", password="secret")
+
+    member = await Member.query.exclude_secrets().get(name="Adam")
+
+    assert "password" not in member.__dict__
+    assert member.model_dump(exclude={"team"}) == {"id": member.pk, "name": "Adam"}
+
+
+async def test_custom_init_is_called():
+    await Product.query.create(name="Saffier")
+
+    product = await Product.query.get(name="Saffier")
+
+    assert product.initialised is True
+    assert product.name == "Saffier"
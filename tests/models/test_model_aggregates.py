@@ -0,0 +1,195 @@
+from decimal import Decimal
+
+import pytest
+
+import saffier
+from saffier.exceptions import QuerySetError
+from saffier.testclient import DatabaseTestClient as Database
+from tests.settings import DATABASE_URL
+
+database = Database(url=DATABASE_URL)
+models = saffier.Registry(database=database)
+
+pytestmark = pytest.mark.anyio
+
+
+class Author(saffier.Model):
+    id = saffier.IntegerField(primary_key=True)
+    name = saffier.CharField(max_length=100)
+    country = saffier.CharField(max_length=100)
+
+    class Meta:
+        registry = models
+
+
+class Book(saffier.Model):
+    id = saffier.IntegerField(primary_key=True)
+    title = saffier.CharField(max_length=100)
+    pages = saffier.IntegerField()
+    author = saffier.ForeignKey(Author, related_name="books")
+
+    class Meta:
+        registry = models
+
+
+@pytest.fixture(autouse=True, scope="function")
+async def create_test_database():
+    await models.create_all()
+    yield
+    await models.drop_all()
+
+
+@pytest.fixture(autouse=True)
+async def rollback_connections():
+    with database.force_rollback():
+        async with database:
+            yield
+
+
+@pytest.fixture()
+async def books():
+    tolkien = await Author.query.create(id=1, name="Tolkien", country="UK")
+    asimov = await Author.query.create(id=2, name="Asimov", country="US")
+    herbert = await Author.query.create(id=3, name="Herbert", country="US")
+
+    await Book.query.bulk_create(
+        [
+            {"id": 1, "title": "The Hobbit", "pages": 300, "author": tolkien},
+            {"id": 2, "title": "The Silmarillion", "pages": 400, "author": tolkien},
+            {"id": 3, "title": "Foundation", "pages": 250, "author": asimov},
+            {"id": 4, "title": "I, Robot", "pages": 200, "author": asimov},
+            {"id": 5, "title": "Dune", "pages": 600, "author": herbert},
+        ]
+    )
+
+
+async def test_aggregate(books):
+    result = await Book.query.aggregate(
+        total=saffier.Sum("pages"),
+        n=saffier.Count(),
+        smallest=saffier.Min("pages"),
+        biggest=saffier.Max("pages"),
+        average=saffier.Avg("pages"),
+    )
+
+    assert result["total"] == 1750
+    assert result["n"] == 5
+    assert result["smallest"] == 200
+    assert result["biggest"] == 600
+    assert Decimal(str(result["average"])) == Decimal(350)
+
+
+async def test_aggregate_with_filter_and_default_alias(books):
+    result = await Book.query.filter(author=1).order_by("-pages").aggregate(saffier.Sum("pages"))
+
+    assert result == {"pages__sum": 700}
+
+
+async def test_aggregate_related_field(books):
+    result = await Book.query.filter(pages__gte=250).aggregate(
+        countries=saffier.Count("author__country", distinct=True)
+    )
+
+    assert result == {"countries": 2}
+
+
+async def test_aggregate_empty():
+    result = await Book.query.aggregate(total=saffier.Sum("pages"), n=saffier.Count())
+
+    assert result == {"total": None, "n": 0}
+
+
+async def test_aggregate_errors(books):
+    with pytest.raises(QuerySetError):
+        await Book.query.aggregate()
+
+    with pytest.raises(QuerySetError):
+        await Book.query.limit(2).aggregate(n=saffier.Count())
+
+    with pytest.raises(QuerySetError):
+        await Book.query.group_by("author").aggregate(n=saffier.Count())
+
+    with pytest.raises(QuerySetError):
+        await Book.query.aggregate(total=saffier.Sum("*"))
+
+    with pytest.raises(QuerySetError):
+        await Book.query.aggregate(total="pages")
+
+
+async def test_annotate_models(books):
+    authors = await Author.query.annotate(
+        n=saffier.Count("books__id"), total=saffier.Sum("books__pages")
+    ).order_by("-total")
+
+    assert [(author.name, author.n, author.total) for author in authors] == [
+        ("Tolkien", 2, 700),
+        ("Herbert", 1, 600),
+        ("Asimov", 2, 450),
+    ]
+
+
+async def test_annotate_without_related_records(books):
+    await Author.query.create(id=4, name="Le Guin", country="US")
+
+    authors = await Author.query.annotate(n=saffier.Count("books__id")).order_by("id")
+
+    assert [(author.name, author.n) for author in authors] == [
+        ("Tolkien", 2),
+        ("Asimov", 2),
+        ("Herbert", 1),
+        ("Le Guin", 0),
+    ]
+
+    counts = await Author.query.annotate(n=saffier.Count("books__id")).values_list(["name", "n"])
+    assert ("Le Guin", 0) in counts
+
+
+async def test_annotate_get_and_filter(books):
+    author = await Author.query.annotate(n=saffier.Count("books__id")).filter(name="Asimov").get()
+
+    assert author.pk == 2
+    assert author.n == 2
+    assert author.model_dump() == {"id": 2, "name": "Asimov", "country": "US"}
+
+
+async def test_annotate_conflicts_with_field():
+    with pytest.raises(QuerySetError):
+        Book.query.annotate(pages=saffier.Sum("pages"))
+
+
+async def test_annotate_group_by_values(books):
+    results = await (
+        Book.query.group_by("author")
+        .annotate(n=saffier.Count(), total=saffier.Sum("pages"))
+        .order_by("author")
+        .values(["author", "n", "total"])
+    )
+
+    assert results == [
+        {"author": 1, "n": 2, "total": 700},
+        {"author": 2, "n": 2, "total": 450},
+        {"author": 3, "n": 1, "total": 600},
+    ]
+
+
+async def test_annotate_values_grouped_by_related_field(books):
+    results = await (
+        Book.query.annotate(total=saffier.Sum("pages"))
+        .order_by("-total")
+        .values_list(["author__country", "total"])
+    )
+
+    assert results == [("US", 1050), ("UK", 700)]
+
+
+async def test_annotate_group_by_related_field(books):
+    results = await (
+        Book.query.group_by("author__country")
+        .annotate(n=saffier.Count())
+        .values(["author__country", "n"])
+    )
+
+    assert sorted(results, key=lambda result: result["author__country"]) == [
+        {"author__country": "UK", "n": 2},
+        {"author__country": "US", "n": 3},
+    ]
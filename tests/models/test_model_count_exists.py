@@ -0,0 +1,119 @@
+import pytest
+
+import saffier
+from saffier.testclient import DatabaseTestClient as Database
+from tests.settings import DATABASE_URL
+
+database = Database(url=DATABASE_URL)
+models = saffier.Registry(database=database)
+
+pytestmark = pytest.mark.anyio
+
+
+class Team(saffier.Model):
+    id = saffier.IntegerField(primary_key=True)
+    name = saffier.CharField(max_length=100)
+
+    class Meta:
+        registry = models
+
+
+class Mentor(saffier.Model):
+    id = saffier.IntegerField(primary_key=True)
+    name = saffier.CharField(max_length=100)
+
+    class Meta:
+        registry = models
+
+
+class User(saffier.Model):
+    id = saffier.IntegerField(primary_key=True)
+    name = saffier.CharField(max_length=100)
+    team = saffier.ForeignKey(Team)
+    mentor = saffier.ForeignKey(Mentor, null=True)
+
+    class Meta:
+        registry = models
+
+
+@pytest.fixture(autouse=True, scope="function")
+async def create_test_database():
+    await models.create_all()
+    yield
+    await models.drop_all()
+
+
+@pytest.fixture(autouse=True)
+async def rollback_connections():
+    with database.force_rollback():
+        async with database:
+            yield
+
+
+@pytest.fixture()
+def statements(record_queries):
+    return record_queries(database)
+
+
+@pytest.fixture()
+async def users():
+    red = await Team.query.create(id=1, name="red")
+    blue = await Team.query.create(id=2, name="blue")
+    mentor = await Mentor.query.create(id=1, name="Dave")
+
+    await User.query.create(id=1, name="Alice", team=red)
+    await User.query.create(id=2, name="Bob", team=red, mentor=mentor)
+    await User.query.create(id=3, name="Charlie", team=blue)
+
+
+async def test_count_without_subquery(users, statements):
+    assert await User.query.filter(name__icontains="a").order_by("name").count() == 2
+
+    assert "subquery_for_count" not in statements[0]
+    assert "ORDER BY" not in statements[0]
+
+
+async def test_count_drops_joins_not_changing_rows(users, statements):
+    assert await User.query.select_related("team").count() == 3
+    assert "JOIN" not in statements[0]
+
+
+async def test_count_keeps_joins_of_filters(users, statements):
+    assert await User.query.filter(team__name="red").count() == 2
+    assert "JOIN" in statements[0]
+
+
+async def test_count_keeps_joins_of_nullable_foreign_keys(users):
+    assert await User.query.select_related("mentor").count() == 1
+
+
+async def test_count_with_limit_offset_and_distinct(users, statements):
+    assert await User.query.limit(2).count() == 2
+    assert await User.query.offset(2).count() == 1
+    assert await User.query.distinct("team").count() == 2
+
+    assert all("subquery_for_count" in statement for statement in statements)
+    assert all("ORDER BY" not in statement for statement in statements)
+
+
+async def test_count_estimate(users):
+    assert await User.query.filter(name="Alice").count(estimate=True) == 1
+
+    estimate = await User.query.count(estimate=True)
+    assert isinstance(estimate, int)
+    assert estimate >= 0
+
+
+async def test_exists(users, statements):
+    assert await User.query.filter(name="Alice").select_related("team").exists() is True
+    assert await User.query.filter(name="Nobody").exists() is False
+
+    assert statements[0].startswith("SELECT 1")
+    assert "LIMIT" in statements[0]
+    assert "JOIN" not in statements[0]
+
+
+async def test_exists_with_offset_and_distinct(users):
+    assert await User.query.offset(2).exists() is True
+    assert await User.query.offset(3).exists() is False
+    assert await User.query.distinct("team").filter(team=2).exists() is True
@@ -0,0 +1,177 @@
+import pytest
+
+import saffier
+from saffier.testclient import DatabaseTestClient as Database
+from tests.settings import DATABASE_URL
+
+database = Database(url=DATABASE_URL)
+models = saffier.Registry(database=database)
+
+pytestmark = pytest.mark.anyio
+
+
+class Team(saffier.Model):
+    id = saffier.IntegerField(primary_key=True)
+    name = saffier.CharField(max_length=100)
+
+    class Meta:
+        registry = models
+
+
+class User(saffier.Model):
+    id = saffier.IntegerField(primary_key=True)
+    name = saffier.CharField(max_length=100)
+    language = saffier.CharField(max_length=200, null=True)
+    data = saffier.JSONField(default={})
+    team = saffier.ForeignKey(Team, null=True)
+
+    class Meta:
+        registry = models
+
+
+@pytest.fixture(autouse=True, scope="function")
+async def create_test_database():
+    await models.create_all()
+    yield
+    await models.drop_all()
+
+
+@pytest.fixture(autouse=True)
+async def rollback_connections():
+    with database.force_rollback():
+        async with database:
+            yield
+
+
+@pytest.fixture()
+def updates(monkeypatch):
+    executed = []
+    execute = database.execute
+
+    async def counted_execute(expression, *args, **kwargs):
+        if expression.is_dml and expression.is_update:
+            executed.append(set(expression.compile().params) - {"id_1"})
+        return await execute(expression, *args, **kwargs)
+
+    monkeypatch.setattr(database, "execute", counted_execute)
+    return executed
+
+
+async def test_only_changed_fields_are_saved(updates):
+    await User.query.create(name="Adam", language="EN", data={"foo": "bar"})
+    user = await User.query.get(name="Adam")
+
+    assert user.get_dirty_fields() == set()
+
+    user.language = "PT"
+    assert user.get_dirty_fields() == {"language"}
+
+    await user.save()
+
+    assert updates == [{"language"}]
+    assert user.get_dirty_fields() == set()
+
+    user = await User.query.get(name="Adam")
+    assert user.language == "PT"
+    assert user.data == {"foo": "bar"}
+
+
+async def test_save_without_changes_is_skipped(updates):
+    await User.query.create(name="Adam", language="EN")
+    user = await User.query.get(name="Adam")
+
+    user.name = "Adam"
+    user.language = "PT"
+    user.language = "EN"
+    assert user.get_dirty_fields() == set()
+
+    await user.save()
+
+    assert updates == []
+
+
+async def test_update_fields(updates):
+    await User.query.create(name="Adam", language="EN")
+    user = await User.query.get(name="Adam")
+
+    user.name = "Eve"
+    user.language = "PT"
+    await user.save(update_fields=["language"])
+
+    assert updates == [{"language"}]
+
+    user = await User.query.get(pk=user.pk)
+    assert user.name == "Adam"
+    assert user.language == "PT"
+
+    with pytest.raises(ValueError):
+        await user.save(update_fields=["unknown"])
+
+
+async def test_changed_foreign_key(updates):
+    team = await Team.query.create(name="Core")
+    other = await Team.query.create(name="Docs")
+    await User.query.create(name="Adam", team=team)
+
+    user = await User.query.get(name="Adam")
+    user.team = team.pk
+    assert user.get_dirty_fields() == set()
+
+    user.team = other
+    await user.save()
+
+    assert updates == [{"team"}]
+    user = await User.query.get(name="Adam")
+    assert user.team.pk == other.pk
+
+
+async def test_new_instances_are_tracked_after_save(updates):
+    user = User(name="Adam")
+    assert user.get_dirty_fields() is None
+
+    await user.save()
+    assert user.get_dirty_fields() == set()
+
+    user.name = "Eve"
+    await user.save()
+
+    assert updates == [{"name"}]
+    assert (await User.query.get(pk=user.pk)).name == "Eve"
+
+
+async def test_model_update_is_not_dirty():
+    await User.query.create(name="Adam")
+    user = await User.query.get(name="Adam")
+
+    await user.update(language="PT")
+
+    assert user.language == "PT"
+    assert user.get_dirty_fields() == set()
+
+
+async def test_json_changed_in_place(updates):
+    await User.query.create(name="Adam", data={"x": 1, "tags": ["a"]})
+    user = await User.query.get(name="Adam")
+
+    user.data["x"] = 2
+    assert user.get_dirty_fields() == {"data"}
+
+    await user.save()
+
+    assert updates == [{"data"}]
+    assert user.get_dirty_fields() == set()
+    assert (await User.query.get(pk=user.pk)).data == {"x": 2, "tags": ["a"]}
+
+    user.data["tags"].append("b")
+    await user.save()
+
+    assert (await User.query.get(pk=user.pk)).data == {"x": 2, "tags": ["a", "b"]}
+
+
+async def test_json_changed_in_place_after_save():
+    user = await User.query.create(name="Adam", data={"x": 1})
+
+    user.data["x"] = 2
+    await user.save()
+
+    assert (await User.query.get(pk=user.pk)).data == {"x": 2}
@@ -0,0 +1,147 @@
+import pytest
+
+import saffier
+from saffier.core.db.querysets.expressions import Expression
+from saffier.exceptions import QuerySetError
+from saffier.testclient import DatabaseTestClient as Database
+from tests.settings import DATABASE_URL
+
+database = Database(url=DATABASE_URL)
+models = saffier.Registry(database=database)
+
+pytestmark = pytest.mark.anyio
+
+
+class Post(saffier.Model):
+    id = saffier.IntegerField(primary_key=True, autoincrement=True)
+    title = saffier.CharField(max_length=100)
+    views = saffier.IntegerField(default=0)
+    score = saffier.FloatField(default=0.0)
+
+    class Meta:
+        registry = models
+
+
+@pytest.fixture(autouse=True, scope="function")
+async def create_test_database():
+    await models.create_all()
+    yield
+    await models.drop_all()
+
+
+@pytest.fixture(autouse=True)
+async def rollback_connections():
+    with database.force_rollback():
+        async with database:
+            yield
+
+
+async def test_expression_repr():
+    expression = saffier.F("views") * 2 + 1
+
+    assert repr(expression) == "add(mul(F(views), 2), 1)"
+
+
+async def test_expression_must_implement_resolve():
+    class Views(Expression):
+        pass
+
+    with pytest.raises(TypeError):
+        Views()
+
+
+async def test_queryset_update_with_expression():
+    await Post.query.create(id=1, title="first", views=10)
+    await Post.query.create(id=2, title="second", views=20)
+
+    await Post.query.filter(id=1).update(views=saffier.F("views") + 1)
+
+    assert (await Post.query.get(id=1)).views == 11
+    assert (await Post.query.get(id=2)).views == 20
+
+
+async def test_queryset_update_with_expression_and_values():
+    await Post.query.create(id=1, title="first", views=10, score=1.5)
+
+    await Post.query.update(
+        views=2 * saffier.F("views") - 5, score=saffier.F("views"), title="new"
+    )
+
+    post = await Post.query.get(id=1)
+    assert post.views == 15
+    assert post.score == 10
+    assert post.title == "new"
+
+
+async def test_queryset_update_with_unknown_column():
+    await Post.query.create(id=1, title="first")
+
+    with pytest.raises(QuerySetError):
+        await Post.query.update(views=saffier.F("unknown") + 1)
+
+
+async def test_model_update_with_expression():
+    post = await Post.query.create(id=1, title="first", views=10)
+
+    await post.update(views=saffier.F("views") + 5)
+
+    assert post.views == 15
+    assert post.get_dirty_fields() == set()
+    assert (await Post.query.get(id=1)).views == 15
+
+
+async def test_save_with_expression():
+    post = await Post.query.create(id=1, title="first", views=10)
+
+    post.views = saffier.F("views") + 1
+    await post.save(update_fields=["views"])
+
+    assert post.views == 11
+    assert (await Post.query.get(id=1)).views == 11
+
+
+async def test_save_with_dirty_expression():
+    post = await Post.query.create(id=1, title="first", views=10)
+    await Post.query.filter(id=1).update(views=100)
+
+    post.views = saffier.F("views") + 1
+    await post.save()
+
+    assert post.views == 101
+
+
+async def test_create_with_expression():
+    post = Post(title="first", views=saffier.F("views") + 1)
+
+    with pytest.raises(QuerySetError):
+        await post.save()
+
+
+async def test_bulk_update_with_expressions():
+    await Post.query.bulk_create(
+        [{"id": 1, "title": "first", "views": 10}, {"id": 2, "title": "second", "views": 20}]
+    )
+    first, second = await Post.query.order_by("id")
+
+    first.views = saffier.F("views") + 1
+    first.title = "changed"
+    second.views = 3
+    second.title = "other"
+    await Post.query.bulk_update([first, second], fields=["views", "title"])
+
+    first, second = await Post.query.order_by("id")
+    assert (first.views, first.title) == (11, "changed")
+    assert (second.views, second.title) == (3, "other")
+
+
+async def test_bulk_update_with_expressions_uses_case(record_queries):
+    await Post.query.create(id=1, title="first", views=10)
+    post = await Post.query.get(id=1)
+
+    statements = record_queries(database)
+
+    post.views = saffier.F("views") * 3
+    await Post.query.bulk_update([post], fields=["views"])
+
+    assert "CASE" in statements[0]
+    assert (await Post.query.get(id=1)).views == 30
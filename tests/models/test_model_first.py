@@ -41,3 +41,33 @@ async def test_model_first():
     assert await User.query.first(name="Jane") == jane
     assert await User.query.filter(name="Jane").first() == jane
     assert await User.query.filter(name="Lucy").first() is None
+
+
+async def test_model_first_uses_the_ordering():
+    await User.query.create(name="Test")
+    await User.query.create(name="Jane")
+    await User.query.create(name="Lucy")
+
+    assert (await User.query.order_by("name").first()).name == "Jane"
+    assert (await User.query.order_by("-name").first()).name == "Test"
+    assert (
+        await User.query.filter(name__in=["Test", "Lucy"]).order_by("name").first()
+    ).name == "Lucy"
+
+
+async def test_model_first_with_multiple_matches():
+    await User.query.create(name="Test", language="EN")
+    await User.query.create(name="Jane", language="EN")
+
+    assert (await User.query.first(language="EN")).name == "Test"
+
+
+async def test_model_first_fetches_one_row(record_queries):
+    await User.query.create(name="First")
+    await User.query.create(name="Second")
+
+    queries = record_queries(database)
+
+    assert (await User.query.first()).name == "First"
+    assert "ORDER BY users.id" in queries[0]
+    assert "LIMIT" in queries[0]
@@ -0,0 +1,162 @@
+import pytest
+
+import saffier
+from saffier.core.db.context_vars import get_identity_map
+from saffier.testclient import DatabaseTestClient as Database
+from tests.settings import DATABASE_URL
+
+database = Database(url=DATABASE_URL)
+models = saffier.Registry(database=database)
+
+pytestmark = pytest.mark.anyio
+
+
+class Tenant(saffier.Model):
+    id = saffier.IntegerField(primary_key=True)
+    name = saffier.CharField(max_length=100)
+
+    class Meta:
+        registry = models
+
+
+class User(saffier.Model):
+    id = saffier.IntegerField(primary_key=True)
+    name = saffier.CharField(max_length=100)
+    tenant = saffier.ForeignKey(Tenant)
+
+    class Meta:
+        registry = models
+
+
+@pytest.fixture(autouse=True, scope="function")
+async def create_test_database():
+    await models.create_all()
+    yield
+    await models.drop_all()
+
+
+@pytest.fixture(autouse=True)
+async def rollback_connections():
+    with database.force_rollback():
+        async with database:
+            yield
+
+
+@pytest.fixture()
+def queries(record_queries):
+    return record_queries(database)
+
+
+@pytest.fixture()
+async def users():
+    tenant = await Tenant.query.create(id=1, name="Saffier")
+    await User.query.create(id=1, name="John", tenant=tenant)
+    await User.query.create(id=2, name="Jane", tenant=tenant)
+
+
+async def test_same_instance_per_record(users):
+    async with saffier.IdentityMap():
+        user = await User.query.get(name="John")
+        users = await User.query.order_by("id")
+
+        assert users[0] is user
+        assert await User.query.first() is user
+
+
+async def test_get_by_pk_skips_the_query(users, queries):
+    async with saffier.IdentityMap() as identity_map:
+        user = await User.query.get(pk=1)
+        queries.clear()
+
+        assert await User.query.get(pk=1) is user
+        assert await User.query.get(id=1) is user
+        assert queries == []
+
+        assert await User.query.filter(name="John").get(id=1) is not None
+        assert len(queries) == 1
+
+    info = identity_map.info()
+    assert info.queries_avoided == 2
+    assert info.hits >= 2
+
+
+async def test_load_uses_the_map(users, queries):
+    async with saffier.IdentityMap() as identity_map:
+        tenant = await Tenant.query.get(id=1)
+        user = await User.query.get(id=2)
+        queries.clear()
+
+        await user.tenant.load()
+        assert user.tenant.name == "Saffier"
+        assert user.tenant is not tenant
+
+        other = await User.query.get(id=1)
+        queries.clear()
+        assert other.tenant.name == "Saffier"
+        assert queries == []
+
+    assert identity_map.info().queries_avoided == 2
+
+
+async def test_load_adds_to_the_map(users, queries):
+    async with saffier.IdentityMap():
+        user = await User.query.get(id=1)
+        await user.tenant.load()
+        queries.clear()
+
+        assert await Tenant.query.get(pk=1) is user.tenant
+        assert queries == []
+
+
+async def test_select_related_is_merged_into_the_map(users, queries):
+    async with saffier.IdentityMap():
+        user = await User.query.get(pk=1)
+        users = await User.query.select_related("tenant").order_by("id")
+
+        assert users[0] is user
+        queries.clear()
+
+        with saffier.strict_loading():
+            assert user.tenant.name == "Saffier"
+            assert users[1].tenant.name == "Saffier"
+        assert queries == []
+
+        user.name = "Johnny"
+        await User.query.select_related("tenant").get(pk=1)
+        assert user.name == "Johnny"
+
+
+async def test_partial_results_are_not_added(users):
+    async with saffier.IdentityMap() as identity_map:
+        tenant = await Tenant.query.only("name").get(id=1)
+        assert len(identity_map) == 0
+
+        full = await Tenant.query.get(id=1)
+        assert full is not tenant
+        assert await Tenant.query.only("name").get(id=1) is full
+
+
+async def test_writes_invalidate(users, queries):
+    async with saffier.IdentityMap() as identity_map:
+        user = await User.query.get(id=1)
+        await user.update(name="Johnny")
+        assert len(identity_map) == 0
+
+        user = await User.query.get(id=1)
+        await User.query.filter(id=1).update(name="John")
+        assert len(identity_map) == 0
+
+        user = await User.query.get(pk=1)
+        assert user.name == "John"
+
+        await user.delete()
+        assert len(identity_map) == 0
+
+
+async def test_scope(users):
+    async with saffier.IdentityMap() as identity_map:
+        assert get_identity_map() is identity_map
+        user = await User.query.get(id=1)
+
+    assert get_identity_map() is None
+    assert await User.query.get(id=1) is not user
@@ -0,0 +1,95 @@
+import pytest
+
+import saffier
+from saffier.core.db.querysets import Prefetch
+from saffier.exceptions import QuerySetError
+from saffier.testclient import DatabaseTestClient as Database
+from tests.settings import DATABASE_URL
+
+database = Database(url=DATABASE_URL)
+models = saffier.Registry(database=database)
+
+pytestmark = pytest.mark.anyio
+
+
+class Team(saffier.Model):
+    id = saffier.IntegerField(primary_key=True)
+    name = saffier.CharField(max_length=100)
+
+    class Meta:
+        registry = models
+
+
+class User(saffier.Model):
+    id = saffier.IntegerField(primary_key=True)
+    name = saffier.CharField(max_length=100)
+    language = saffier.CharField(max_length=200, null=True)
+    team = saffier.ForeignKey(Team, null=True, related_name="users")
+
+    class Meta:
+        registry = models
+
+
+@pytest.fixture(autouse=True, scope="function")
+async def create_test_database():
+    await models.create_all()
+    yield
+    await models.drop_all()
+
+
+@pytest.fixture(autouse=True)
+async def rollback_connections():
+    with database.force_rollback():
+        async with database:
+            yield
+
+
+async def test_iterate():
+    for number in range(25):
+        await User.query.create(name=f"User {number}", language="EN")
+
+    users = [user async for user in User.query.order_by("id").iterate(chunk_size=10)]
+
+    assert len(users) == 25
+    assert all(isinstance(user, User) for user in users)
+    assert [user.name for user in users] == [f"User {number}" for number in range(25)]
+
+
+async def test_iterate_with_filters_and_select_related():
+    team = await Team.query.create(name="Saffier")
+    await User.query.create(name="Adam", language="EN", team=team)
+    await User.query.create(name="Eve", language="PT", team=team)
+
+    users = [
+        user async for user in User.query.select_related("team").filter(language="PT").iterate()
+    ]
+
+    assert len(users) == 1
+    assert users[0].name == "Eve"
+    assert users[0].team.name == "Saffier"
+
+
+async def test_iterate_as_dict_and_tuple():
+    user = await User.query.create(name="Adam", language="EN")
+
+    rows = [row async for row in User.query.iterate(as_dict=True)]
+    assert rows == [{"id": user.pk, "name": "Adam", "language": "EN", "team": None}]
+
+    rows = [row async for row in User.query.iterate(as_tuple=True)]
+    assert rows == [(user.pk, "Adam", "EN", None)]
+
+
+async def test_iterate_errors():
+    with pytest.raises(QuerySetError):
+        [row async for row in User.query.iterate(as_dict=True, as_tuple=True)]
+
+    with pytest.raises(QuerySetError):
+        [row async for row in User.query.iterate(chunk_size=0)]
+
+    with pytest.raises(QuerySetError):
+        [
+            row
+            async for row in Team.query.prefetch_related(
+                Prefetch(related_name="users", to_attr="to_users")
+            ).iterate()
+        ]
@@ -41,3 +41,33 @@ async def test_model_last():
     assert await User.query.last(name="Jane") == jane
     assert await User.query.filter(name="Test").last() == Test
     assert await User.query.filter(name="Lucy").last() is None
+
+
+async def test_model_last_reverses_the_ordering():
+    await User.query.create(name="Test")
+    await User.query.create(name="Jane")
+    await User.query.create(name="Lucy")
+
+    assert (await User.query.order_by("name").last()).name == "Test"
+    assert (await User.query.order_by("-name").last()).name == "Jane"
+    assert (
+        await User.query.filter(name__in=["Jane", "Lucy"]).order_by("-name").last()
+    ).name == "Jane"
+
+
+async def test_model_last_with_multiple_matches():
+    await User.query.create(name="Test", language="EN")
+    await User.query.create(name="Jane", language="EN")
+
+    assert (await User.query.last(language="EN")).name == "Jane"
+
+
+async def test_model_last_fetches_one_row(record_queries):
+    await User.query.create(name="First")
+    await User.query.create(name="Second")
+
+    queries = record_queries(database)
+
+    assert (await User.query.last()).name == "Second"
+    assert "ORDER BY users.id DESC" in queries[0]
+    assert "LIMIT" in queries[0]
@@ -0,0 +1,199 @@
+from enum import Enum
+
+import pytest
+
+import saffier
+from saffier.core.db.querysets.pagination import NEXT, decode_cursor, encode_cursor
+from saffier.exceptions import QuerySetError
+from saffier.testclient import DatabaseTestClient as Database
+from tests.settings import DATABASE_URL
+
+database = Database(url=DATABASE_URL)
+models = saffier.Registry(database=database)
+
+pytestmark = pytest.mark.anyio
+
+
+class User(saffier.Model):
+    id = saffier.IntegerField(primary_key=True)
+    name = saffier.CharField(max_length=100)
+
+    class Meta:
+        registry = models
+
+
+class Post(saffier.Model):
+    id = saffier.IntegerField(primary_key=True)
+    title = saffier.CharField(max_length=100)
+    rating = saffier.IntegerField()
+    user = saffier.ForeignKey(User, null=True)
+
+    class Meta:
+        registry = models
+
+
+class Status(Enum):
+    DRAFT = "Draft"
+    RELEASED = "Released"
+
+
+class Release(saffier.Model):
+    id = saffier.IntegerField(primary_key=True)
+    status = saffier.ChoiceField(Status, default=Status.DRAFT)
+
+    class Meta:
+        registry = models
+
+
+@pytest.fixture(autouse=True, scope="function")
+async def create_test_database():
+    await models.create_all()
+    yield
+    await models.drop_all()
+
+
+@pytest.fixture(autouse=True)
+async def rollback_connections():
+    with database.force_rollback():
+        async with database:
+            yield
+
+
+async def create_posts():
+    user = await User.query.create(name="Adam")
+    for index in range(7):
+        await Post.query.create(title=f"post-{index}", rating=index % 3, user=user)
+
+
+async def test_paginate_forward_and_backwards():
+    await create_posts()
+
+    page = await Post.query.paginate_after(page_size=3)
+
+    assert [post.title for post in page] == ["post-0", "post-1", "post-2"]
+    assert page.has_next
+    assert not page.has_previous
+
+    page = await Post.query.paginate_after(page.next_cursor, page_size=3)
+    assert [post.title for post in page] == ["post-3", "post-4", "post-5"]
+    assert page.has_previous
+
+    last_page = await Post.query.paginate_after(page.next_cursor, page_size=3)
+    assert [post.title for post in last_page] == ["post-6"]
+    assert not last_page.has_next
+
+    page = await Post.query.paginate_after(last_page.previous_cursor, page_size=3)
+    assert [post.title for post in page] == ["post-3", "post-4", "post-5"]
+    assert page.has_next
+
+    page = await Post.query.paginate_after(page.previous_cursor, page_size=3)
+    assert [post.title for post in page] == ["post-0", "post-1", "post-2"]
+    assert not page.has_previous
+    assert page.has_next
+
+
+async def test_paginate_with_ordering_and_filter():
+    await create_posts()
+
+    queryset = Post.query.filter(rating__gte=1)
+    page = await queryset.paginate_after(order_by=["-rating"], page_size=2)
+
+    assert [(post.rating, post.title) for post in page] == [(2, "post-5"), (2, "post-2")]
+
+    page = await queryset.paginate_after(page.next_cursor, order_by=["-rating"], page_size=2)
+    assert [(post.rating, post.title) for post in page] == [(1, "post-4"), (1, "post-1")]
+    assert not page.has_next
+
+
+async def test_paginate_with_mixed_ordering():
+    await create_posts()
+
+    titles = []
+    cursor = None
+    while True:
+        page = await Post.query.order_by("-rating", "title").paginate_after(cursor, page_size=2)
+        titles.extend(post.title for post in page)
+        if not page.has_next:
+            break
+        cursor = page.next_cursor
+
+    assert titles == ["post-2", "post-5", "post-1", "post-4", "post-0", "post-3", "post-6"]
+
+
+async def test_paginate_with_select_related():
+    await create_posts()
+
+    page = await Post.query.select_related("user").paginate_after(page_size=2)
+    assert page.results[0].user.__dict__["name"] == "Adam"
+
+    page = await Post.query.select_related("user").paginate_after(page.next_cursor, page_size=2)
+    assert [post.title for post in page] == ["post-2", "post-3"]
+    assert page.results[0].user.__dict__["name"] == "Adam"
+
+
+async def test_paginate_empty_page():
+    page = await Post.query.paginate_after()
+
+    assert len(page) == 0
+    assert not page.has_next
+    assert not page.has_previous
+
+
+async def test_invalid_cursor():
+    await create_posts()
+
+    with pytest.raises(QuerySetError):
+        await Post.query.paginate_after("not-a-cursor")
+
+    page = await Post.query.paginate_after(page_size=2)
+    with pytest.raises(QuerySetError):
+        await Post.query.paginate_after(page.next_cursor, order_by=["title"])
+
+    with pytest.raises(QuerySetError):
+        await Post.query.paginate_after(page_size=0)
+
+
+async def test_unsupported_ordering():
+    await create_posts()
+
+    with pytest.raises(QuerySetError):
+        await Post.query.paginate_after(order_by=["user__name"])
+
+    with pytest.raises(QuerySetError):
+        await Post.query.annotate(n=saffier.Count()).paginate_after(order_by=["n"])
+
+    with pytest.raises(QuerySetError):
+        await Post.query.paginate_after(order_by=["-user"])
+
+
+async def test_cursor_round_trip():
+    cursor = encode_cursor(["status", "data", "id"], [Status.RELEASED, b"\x00x", 1], NEXT)
+
+    values, direction = decode_cursor(cursor, ["status", "data", "id"])
+
+    assert values == ["Released", b"\x00x", 1]
+    assert direction == NEXT
+
+    with pytest.raises(QuerySetError):
+        encode_cursor(["data", "id"], [object(), 1], NEXT)
+
+
+async def test_paginate_by_enum():
+    for index, status in enumerate([Status.RELEASED, Status.DRAFT] * 3):
+        await Release.query.create(id=index + 1, status=status)
+
+    ids = []
+    cursor = None
+    while True:
+        page = await Release.query.paginate_after(cursor, order_by=["status"], page_size=2)
+        ids.extend(release.id for release in page)
+        if not page.has_next:
+            break
+        cursor = page.next_cursor
+
+    assert ids == [2, 4, 6, 1, 3, 5]
+
+    page = await Release.query.paginate_after(
+        page.previous_cursor, order_by=["status"], page_size=2
+    )
+    assert [release.status for release in page] == [Status.DRAFT, Status.RELEASED]
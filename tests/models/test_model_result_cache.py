@@ -0,0 +1,155 @@
+import pytest
+
+import saffier
+from saffier.core.db.caches import ResultCache
+from saffier.exceptions import QuerySetError
+from saffier.protocols.result_cache import ResultCacheProtocol
+from saffier.testclient import DatabaseTestClient as Database
+from tests.settings import DATABASE_URL
+
+database = Database(url=DATABASE_URL)
+models = saffier.Registry(database=database)
+
+pytestmark = pytest.mark.anyio
+
+
+class Team(saffier.Model):
+    id = saffier.IntegerField(primary_key=True)
+    name = saffier.CharField(max_length=100)
+
+    class Meta:
+        registry = models
+
+
+class User(saffier.Model):
+    id = saffier.IntegerField(primary_key=True)
+    name = saffier.CharField(max_length=100)
+    team = saffier.ForeignKey(Team, null=True)
+
+    class Meta:
+        registry = models
+
+
+@pytest.fixture(autouse=True, scope="function")
+async def create_test_database():
+    await models.create_all()
+    yield
+    await models.drop_all()
+    await models.result_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+async def rollback_connections():
+    with database.force_rollback():
+        async with database:
+            yield
+
+
+@pytest.fixture()
+def queries(record_queries):
+    return record_queries(database)
+
+
+@pytest.fixture()
+async def users():
+    red = await Team.query.create(id=1, name="red")
+    await User.query.create(id=1, name="Alice", team=red)
+    await User.query.create(id=2, name="Bob", team=red)
+
+
+async def test_cached_results(users, queries):
+    first = await User.query.cache(ttl=60).filter(name="Alice")
+    second = await User.query.filter(name="Alice").cache(ttl=60)
+
+    assert [user.name for user in first] == [user.name for user in second] == ["Alice"]
+    assert first[0] is not second[0]
+    assert len(queries) == 1
+
+    await User.query.cache().filter(name="Bob")
+    assert len(queries) == 2
+
+
+async def test_cached_reads(users, queries):
+    queryset = User.query.cache(60)
+
+    for _ in range(2):
+        assert await queryset.count() == 2
+        assert await queryset.exists() is True
+        assert await queryset.get(name="Bob") is not None
+        assert await queryset.values_list(["name"], flat=True) == ["Alice", "Bob"]
+        assert await queryset.aggregate(n=saffier.Count()) == {"n": 2}
+
+    assert len(queries) == 5
+
+
+async def test_not_cached_by_default(users, queries):
+    await User.query.all()
+    await User.query.all()
+
+    assert len(queries) == 2
+
+
+async def test_writes_invalidate(users, queries):
+    queryset = User.query.cache(60).order_by("id")
+
+    assert [user.name for user in await queryset] == ["Alice", "Bob"]
+    await User.query.filter(id=1).update(name="Alicia")
+    assert [user.name for user in await queryset] == ["Alicia", "Bob"]
+
+    user = await User.query.get(id=2)
+    await user.update(name="Robert")
+    assert [user.name for user in await queryset] == ["Alicia", "Robert"]
+
+    await User.query.create(id=3, name="Charlie")
+    assert await queryset.count() == 3
+
+    await User.query.bulk_create([{"id": 4, "name": "Dave"}])
+    assert await queryset.count() == 4
+
+    await User.query.filter(id=4).delete()
+    assert await queryset.count() == 3
+
+
+async def test_writes_invalidate_joined_tables(users):
+    queryset = User.query.cache(60).filter(team__name="red")
+    assert await queryset.count() == 2
+
+    team = await Team.query.get(id=1)
+    await team.update(name="blue")
+    assert await queryset.count() == 0
+
+
+async def test_writes_keep_other_tables(users, queries):
+    queryset = Team.query.cache(60)
+    await queryset.count()
+
+    await User.query.filter(id=1).update(name="Alicia")
+    queries.clear()
+
+    await queryset.count()
+    assert queries == []
+
+
+async def test_cache_errors():
+    with pytest.raises(QuerySetError):
+        User.query.cache(ttl=0)
+
+
+async def test_result_cache_backend():
+    backend = ResultCache(maxsize=2)
+    assert isinstance(backend, ResultCacheProtocol)
+
+    await backend.set("a", 1, 60, {("users", None)})
+    await backend.set("b", 2, 60, {("teams", None)})
+    await backend.set("c", 3, 60, {("users", None), ("teams", None)})
+
+    assert await backend.get("a") == (False, None)
+    assert await backend.get("b") == (True, 2)
+
+    await backend.invalidate({("users", None)})
+    assert await backend.get("c") == (False, None)
+    assert await backend.get("b") == (True, 2)
+
+    await backend.set("d", None, -1, set())
+    assert await backend.get("d") == (False, None)
+    assert backend.info().hits == 2
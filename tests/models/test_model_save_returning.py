@@ -0,0 +1,90 @@
+import pytest
+import sqlalchemy
+
+import saffier
+from saffier.testclient import DatabaseTestClient as Database
+from tests.settings import DATABASE_URL
+
+database = Database(url=DATABASE_URL)
+models = saffier.Registry(database=database)
+
+pytestmark = pytest.mark.anyio
+
+
+class Product(saffier.Model):
+    id = saffier.IntegerField(primary_key=True)
+    name = saffier.CharField(max_length=100)
+    code = saffier.CharField(max_length=100, server_default=sqlalchemy.text("'SAF'"), null=True)
+    rating = saffier.IntegerField(server_default=sqlalchemy.text("5"), null=True)
+
+    class Meta:
+        registry = models
+
+
+@pytest.fixture(autouse=True, scope="function")
+async def create_test_database():
+    await models.create_all()
+    yield
+    await models.drop_all()
+
+
+@pytest.fixture(autouse=True)
+async def rollback_connections():
+    with database.force_rollback():
+        async with database:
+            yield
+
+
+@pytest.fixture()
+def queries(record_queries):
+    return record_queries(database)
+
+
+async def test_save_returns_server_defaults_in_one_query(queries):
+    product = Product(name="Saffier")
+    await product.save()
+
+    assert len(queries) == 1
+    assert queries[0].startswith("INSERT")
+    assert "RETURNING" in queries[0]
+    assert product.pk is not None
+    assert product.code == "SAF"
+    assert product.rating == 5
+
+
+async def test_create_returns_server_defaults(queries):
+    product = await Product.query.create(name="Saffier", rating=3)
+
+    assert len(queries) == 1
+    assert queries[0].startswith("INSERT")
+    assert "RETURNING" in queries[0]
+    assert product.pk is not None
+    assert product.rating == 3
+
+    product = await Product.query.get(pk=product.pk)
+    assert product.rating == 3
+
+
+async def test_insert_statement_is_cached():
+    models.statement_cache.clear()
+
+    await Product.query.create(name="Saffier")
+    await Product.query.create(name="Esmerald")
+
+    info = models.cache_info()["statements"]
+    assert info.misses == 1
+    assert info.hits == 1
+
+
+async def test_update_returns_missing_server_defaults(queries):
+    product = Product(name="Saffier")
+    await product.save()
+    product = await Product.query.only("name").get(pk=product.pk)
+    del queries[:]
+
+    await product.update(name="Esmerald")
+
+    assert len(queries) == 1
+    assert queries[0].startswith("UPDATE")
+    assert "RETURNING" in queries[0]
+    assert product.__dict__["code"] == "SAF"
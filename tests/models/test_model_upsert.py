@@ -0,0 +1,228 @@
+import datetime
+
+import pytest
+
+import saffier
+from saffier.exceptions import QuerySetError
+from saffier.testclient import DatabaseTestClient as Database
+from tests.settings import DATABASE_URL
+
+database = Database(url=DATABASE_URL)
+models = saffier.Registry(database=database)
+
+pytestmark = pytest.mark.anyio
+
+
+class User(saffier.Model):
+    id = saffier.IntegerField(primary_key=True)
+    email = saffier.CharField(max_length=100, unique=True)
+    name = saffier.CharField(max_length=100)
+    language = saffier.CharField(max_length=200, null=True)
+    updated_at = saffier.DateTimeField(auto_now=True)
+
+    class Meta:
+        registry = models
+
+
+class Membership(saffier.Model):
+    id = saffier.IntegerField(primary_key=True)
+    user = saffier.ForeignKey(User)
+    group = saffier.CharField(max_length=100)
+    role = saffier.CharField(max_length=100)
+
+    class Meta:
+        registry = models
+        unique_together = [("user", "group")]
+
+
+@pytest.fixture(autouse=True, scope="function")
+async def create_test_database():
+    await models.create_all()
+    yield
+    await models.drop_all()
+
+
+@pytest.fixture(autouse=True)
+async def rollback_connections():
+    with database.force_rollback():
+        async with database:
+            yield
+
+
+async def test_bulk_upsert():
+    await User.query.create(email="adam@saffier.com", name="Adam", language="EN")
+
+    await User.query.bulk_upsert(
+        [
+            {"email": "adam@saffier.com", "name": "Adam Smith"},
+            {"email": "eve@saffier.com", "name": "Eve"},
+        ],
+        conflict_fields=["email"],
+    )
+
+    users = await User.query.order_by("id")
+    assert [(user.email, user.name) for user in users] == [
+        ("adam@saffier.com", "Adam Smith"),
+        ("eve@saffier.com", "Eve"),
+    ]
+    assert users[0].language == "EN"
+
+
+async def test_bulk_upsert_update_fields_and_returning():
+    await User.query.create(email="adam@saffier.com", name="Adam", language="EN")
+
+    users = await User.query.bulk_upsert(
+        [
+            {"email": "adam@saffier.com", "name": "Adam Smith", "language": "PT"},
+            {"email": "eve@saffier.com", "name": "Eve", "language": "PT"},
+        ],
+        conflict_fields=["email"],
+        update_fields=["language"],
+        returning=True,
+    )
+
+    assert {(user.email, user.name, user.language) for user in users} == {
+        ("adam@saffier.com", "Adam", "PT"),
+        ("eve@saffier.com", "Eve", "PT"),
+    }
+    assert all(user.pk is not None for user in users)
+
+
+async def test_bulk_upsert_ignore_conflicts():
+    await User.query.create(email="adam@saffier.com", name="Adam")
+
+    await User.query.bulk_upsert(
+        [
+            {"email": "adam@saffier.com", "name": "Other"},
+            {"email": "eve@saffier.com", "name": "Eve"},
+        ],
+        conflict_fields=["email"],
+        update_fields=[],
+        batch_size=1,
+    )
+
+    users = await User.query.order_by("id")
+    assert [user.name for user in users] == ["Adam", "Eve"]
+
+
+async def test_bulk_upsert_errors():
+    with pytest.raises(QuerySetError):
+        await User.query.bulk_upsert([{"email": "a", "name": "a"}], conflict_fields=[])
+
+    with pytest.raises(QuerySetError):
+        await User.query.bulk_upsert(
+            [{"email": "a", "name": "a"}], conflict_fields=["email"], update_fields=["unknown"]
+        )
+
+
+async def test_upsert():
+    user = await User.query.upsert(["email"], email="adam@saffier.com", name="Adam")
+    assert user.pk is not None
+    assert user.name == "Adam"
+
+    updated = await User.query.upsert(["email"], email="adam@saffier.com", name="Adam Smith")
+    assert updated.pk == user.pk
+    assert updated.name == "Adam Smith"
+    assert updated.updated_at >= user.updated_at
+
+    assert await User.query.count() == 1
+
+
+async def test_model_upsert():
+    user = await User.query.create(email="adam@saffier.com", name="Adam")
+
+    user.name = "Adam Smith"
+    await user.upsert()
+    assert (await User.query.get(pk=user.pk)).name == "Adam Smith"
+
+    other = User(email="adam@saffier.com", name="Smith")
+    await other.upsert(conflict_fields=["email"], update_fields=["name"])
+
+    assert other.pk == user.pk
+    assert (await User.query.get(pk=user.pk)).name == "Smith"
+
+
+async def test_get_or_create_unique_lookup():
+    user, created = await User.query.get_or_create(
+        email="adam@saffier.com", defaults={"name": "Adam"}
+    )
+    assert created is True
+    assert user.name == "Adam"
+    assert isinstance(user.updated_at, datetime.datetime)
+
+    user, created = await User.query.get_or_create(
+        email="adam@saffier.com", defaults={"name": "Other"}
+    )
+    assert created is False
+    assert user.name == "Adam"
+    assert await User.query.count() == 1
+
+
+async def test_update_or_create_unique_lookup():
+    user, created = await User.query.update_or_create(
+        email="adam@saffier.com", defaults={"name": "Adam"}
+    )
+    assert created is True
+    assert user.name == "Adam"
+
+    user, created = await User.query.update_or_create(
+        email="adam@saffier.com", defaults={"name": "Adam Smith"}
+    )
+    assert created is False
+    assert user.name == "Adam Smith"
+    assert await User.query.count() == 1
+
+
+async def test_update_or_create_unique_together():
+    user = await User.query.create(email="adam@saffier.com", name="Adam")
+
+    membership, created = await Membership.query.update_or_create(
+        user=user, group="admins", defaults={"role": "owner"}
+    )
+    assert created is True
+
+    membership, created = await Membership.query.update_or_create(
+        user=user, group="admins", defaults={"role": "member"}
+    )
+    assert created is False
+    assert membership.role == "member"
+    assert membership.user.pk == user.pk
+
+
+async def test_get_or_create_existing_without_the_required_fields():
+    user = await User.query.create(email="adam@saffier.com", name="Adam")
+
+    found, created = await User.query.get_or_create(email="adam@saffier.com", defaults={})
+    assert created is False
+    assert found.pk == user.pk
+
+    found, created = await User.query.get_or_create(id=user.pk, defaults={})
+    assert created is False
+    assert found.name == "Adam"
+
+    found, created = await User.query.update_or_create(id=user.pk, defaults={})
+    assert created is False
+    assert found.email == "adam@saffier.com"
+
+
+async def test_get_or_create_sends_the_save_signals():
+    saved = []
+
+    async def on_save(sender, instance, **kwargs):
+        saved.append(instance.email)
+
+    User.signals.post_save.connect(on_save)
+    try:
+        user, created = await User.query.get_or_create(
+            email="adam@saffier.com", defaults={"name": "Adam"}
+        )
+        assert created is True
+
+        user, created = await User.query.update_or_create(
+            email="eve@saffier.com", defaults={"name": "Eve"}
+        )
+        assert created is True
+    finally:
+        User.signals.post_save.disconnect(on_save)
+
+    assert saved == ["adam@saffier.com", "eve@saffier.com"]
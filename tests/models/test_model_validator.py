@@ -0,0 +1,117 @@
+import datetime
+
+import pytest
+
+import saffier
+from saffier.core.utils.schemas import Schema
+from saffier.exceptions import ValidationError
+from saffier.testclient import DatabaseTestClient as Database
+from tests.settings import DATABASE_URL
+
+database = Database(url=DATABASE_URL)
+models = saffier.Registry(database=database)
+
+pytestmark = pytest.mark.anyio
+
+
+class Team(saffier.Model):
+    id = saffier.IntegerField(primary_key=True)
+    name = saffier.CharField(max_length=100)
+
+    class Meta:
+        registry = models
+
+
+class User(saffier.Model):
+    id = saffier.IntegerField(primary_key=True)
+    name = saffier.CharField(max_length=100)
+    code = saffier.CharField(max_length=10, default="AA")
+    team = saffier.ForeignKey(Team, null=True)
+    created = saffier.DateTimeField(auto_now_add=True)
+    updated = saffier.DateTimeField(auto_now=True)
+
+    class Meta:
+        registry = models
+
+
+@pytest.fixture(autouse=True, scope="function")
+async def create_test_database():
+    await models.create_all()
+    yield
+    await models.drop_all()
+
+
+@pytest.fixture(autouse=True)
+async def rollback_connections():
+    with database.force_rollback():
+        async with database:
+            yield
+
+
+async def test_validator_is_cached_per_fields():
+    models.validator_cache.clear()
+
+    await User.query.create(id=1, name="Alice")
+    await User.query.create(id=2, name="Bob")
+    await User.query.filter(id=1).update(name="Alicia")
+    await User.query.filter(id=2).update(name="Robert")
+
+    info = models.cache_info()["validators"]
+    assert info.misses == 2
+    assert info.hits == 2
+
+    assert User.get_validator(["name", "code"]) is User.get_validator(["code", "name"])
+    assert User.get_validator(["name"]) is not User.get_validator(["name"], auto_now=True)
+
+
+async def test_defaults_and_auto_now():
+    values = User.get_validator().check({"id": 1, "name": "Alice"})
+
+    assert values["code"] == "AA"
+    assert isinstance(values["created"], datetime.datetime)
+    assert "updated" not in User.get_validator(["name"]).check({"name": "Alice"})
+    assert "updated" in User.get_validator(["name"], auto_now=True).check({"name": "Alice"})
+
+
+async def test_same_errors_as_the_schema():
+    values = {"name": 1, "code": 2}
+    schema = Schema(fields={key: field.validator for key, field in User.fields.items()})
+
+    with pytest.raises(ValidationError) as schema_error:
+        schema.check(values)
+
+    with pytest.raises(ValidationError) as error:
+        User.get_validator().check(values)
+
+    assert error.value.messages() == schema_error.value.messages()
+    assert {message.index[0] for message in error.value.messages()} == {"name", "code"}
+
+
+async def test_bulk_create_without_validation(monkeypatch):
+    team = await Team.query.create(id=1, name="Saffier")
+    validator = User.fields["name"].validator
+    checked = []
+    check = validator.check
+
+    def recorded_check(value):
+        checked.append(value)
+        return check(value)
+
+    monkeypatch.setattr(validator, "check", recorded_check)
+
+    await User.query.bulk_create(
+        [{"id": 1, "name": "Alice", "team": team}, {"id": 2, "name": "Bob", "code": "BB"}],
+        validate=False,
+    )
+    assert checked == []
+
+    await User.query.bulk_create([{"id": 3, "name": "Char\0lie"}])
+    assert checked == ["Char\0lie"]
+
+    users = await User.query.order_by("id")
+    assert [(user.name, user.code, user.team.pk) for user in users] == [
+        ("Alice", "AA", 1),
+        ("Bob", "BB", None),
+        ("Charlie", "AA", None),
+    ]
+    assert users[0].created is not None
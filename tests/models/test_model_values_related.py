@@ -0,0 +1,137 @@
+import pytest
+
+import saffier
+from saffier.exceptions import QuerySetError
+from saffier.testclient import DatabaseTestClient as Database
+from tests.settings import DATABASE_URL
+
+database = Database(url=DATABASE_URL)
+models = saffier.Registry(database=database)
+
+pytestmark = pytest.mark.anyio
+
+
+class Author(saffier.Model):
+    id = saffier.IntegerField(primary_key=True)
+    name = saffier.CharField(max_length=100)
+
+    class Meta:
+        registry = models
+
+
+class Collection(saffier.Model):
+    id = saffier.IntegerField(primary_key=True)
+    name = saffier.CharField(max_length=100)
+
+    class Meta:
+        registry = models
+
+
+class Book(saffier.Model):
+    id = saffier.IntegerField(primary_key=True)
+    title = saffier.CharField(max_length=100)
+    author = saffier.ForeignKey(Author, related_name="books")
+    collection = saffier.ForeignKey(Collection, null=True)
+
+    class Meta:
+        registry = models
+
+
+@pytest.fixture(autouse=True, scope="function")
+async def create_test_database():
+    await models.create_all()
+    yield
+    await models.drop_all()
+
+
+@pytest.fixture(autouse=True)
+async def rollback_connections():
+    with database.force_rollback():
+        async with database:
+            yield
+
+
+@pytest.fixture
+def no_models(monkeypatch):
+    def from_query_result(*args, **kwargs):
+        raise AssertionError("No model should be generated.")
+
+    monkeypatch.setattr(Book, "from_query_result", from_query_result)
+
+
+async def create_books():
+    saffier_author = await Author.query.create(name="Saffier")
+    esmerald = await Author.query.create(name="Esmerald")
+    await Book.query.create(title="ORM", author=saffier_author)
+    await Book.query.create(title="Framework", author=esmerald)
+    return saffier_author, esmerald
+
+
+async def test_values_foreign_key_is_the_primary_key(no_models):
+    saffier_author, esmerald = await create_books()
+
+    books = await Book.query.order_by("id").values()
+
+    assert books == [
+        {"id": 1, "title": "ORM", "author": saffier_author.pk, "collection": None},
+        {"id": 2, "title": "Framework", "author": esmerald.pk, "collection": None},
+    ]
+
+
+async def test_values_of_related_fields(no_models):
+    await create_books()
+
+    books = await Book.query.order_by("id").values(["title", "author__name"])
+
+    assert books == [
+        {"title": "ORM", "author__name": "Saffier"},
+        {"title": "Framework", "author__name": "Esmerald"},
+    ]
+
+    books = await Book.query.filter(author__name="Esmerald").values_list(["author__name", "title"])
+
+    assert books == [("Esmerald", "Framework")]
+
+
+async def test_values_of_nullable_related_fields(no_models):
+    await create_books()
+    classics = await Collection.query.create(name="Classics")
+    await Book.query.filter(title="ORM").update(collection=classics)
+
+    books = await Book.query.order_by("id").values(["title", "collection__name"])
+
+    assert books == [
+        {"title": "ORM", "collection__name": "Classics"},
+        {"title": "Framework", "collection__name": None},
+    ]
+
+    books = await Book.query.order_by("id").values_list(["collection__name"], flat=True)
+
+    assert books == ["Classics", None]
+
+
+async def test_values_list_flat(no_models):
+    await create_books()
+
+    ids = await Book.query.order_by("-id").values_list("id", flat=True)
+
+    assert ids == [2, 1]
+
+
+async def test_values_reverse_related_fields():
+    await create_books()
+
+    authors = await Author.query.order_by("id").values(["name", "books__title"])
+
+    assert authors == [
+        {"name": "Saffier", "books__title": "ORM"},
+        {"name": "Esmerald", "books__title": "Framework"},
+    ]
+
+
+async def test_values_unknown_field():
+    with pytest.raises(QuerySetError):
+        await Book.query.values(["author__age"])
+
+    with pytest.raises(QuerySetError):
+        await Book.query.values(["publisher__name"])
@@ -0,0 +1,91 @@
+import pytest
+
+import saffier
+from saffier.testclient import DatabaseTestClient as Database
+from tests.settings import DATABASE_URL
+
+database = Database(url=DATABASE_URL)
+models = saffier.Registry(database=database)
+
+pytestmark = pytest.mark.anyio
+
+
+class Organisation(saffier.Model):
+    id = saffier.IntegerField(primary_key=True)
+    name = saffier.CharField(max_length=100)
+
+    class Meta:
+        registry = models
+
+
+class User(saffier.Model):
+    id = saffier.IntegerField(primary_key=True)
+    name = saffier.CharField(max_length=100)
+    organisation = saffier.ForeignKey(Organisation, null=True)
+
+    class Meta:
+        registry = models
+
+
+@pytest.fixture(autouse=True, scope="function")
+async def create_test_database():
+    await models.create_all()
+    yield
+    await models.drop_all()
+
+
+@pytest.fixture(autouse=True)
+async def rollback_connections():
+    with database.force_rollback():
+        async with database:
+            yield
+
+
+async def test_same_shape_reuses_select():
+    organisation = await Organisation.query.create(name="Saffier")
+    await User.query.create(name="Adam", organisation=organisation)
+    await User.query.create(name="Eve", organisation=organisation)
+
+    models.select_cache.clear()
+
+    users = await User.query.select_related("organisation").filter(name="Adam").order_by("name")
+    assert len(users) == 1
+    assert users[0].name == "Adam"
+    assert users[0].organisation.name == "Saffier"
+
+    users = await User.query.select_related("organisation").filter(name="Eve").order_by("name")
+    assert len(users) == 1
+    assert users[0].name == "Eve"
+
+    info = models.cache_info()["selects"]
+    assert info.misses == 1
+    assert info.hits == 1
+
+
+async def test_limit_and_offset_are_not_part_of_the_shape():
+    for name in ("Adam", "Eve", "John"):
+        await User.query.create(name=name)
+
+    models.select_cache.clear()
+
+    first = await User.query.order_by("name").limit(1)
+    second = await User.query.order_by("name").limit(1).offset(1)
+
+    assert first[0].name == "Adam"
+    assert second[0].name == "Eve"
+    assert models.select_cache.info().misses == 1
+
+
+async def test_different_shapes():
+    await User.query.create(name="Adam")
+
+    models.select_cache.clear()
+
+    await User.query.order_by("name")
+    await User.query.order_by("-name")
+    await User.query.exclude_secrets()
+    await User.query.defer("name")
+
+    info = models.select_cache.info()
+    assert info.misses == 4
+    assert info.hits == 0
@@ -0,0 +1,121 @@
+import pytest
+
+import saffier
+from saffier.conf import settings
+from saffier.core.db.querysets import Prefetch
+from saffier.testclient import DatabaseTestClient as Database
+from tests.settings import DATABASE_URL
+
+pytestmark = pytest.mark.anyio
+
+database = Database(DATABASE_URL)
+models = saffier.Registry(database=database)
+
+
+class User(saffier.Model):
+    name = saffier.CharField(max_length=100)
+
+    class Meta:
+        registry = models
+
+
+class Post(saffier.Model):
+    user = saffier.ForeignKey(User, related_name="posts")
+    comment = saffier.CharField(max_length=255)
+
+    class Meta:
+        registry = models
+
+
+@pytest.fixture(autouse=True, scope="function")
+async def create_test_database():
+    await models.create_all()
+    yield
+    await models.drop_all()
+
+
+@pytest.fixture(autouse=True)
+async def rollback_connections():
+    with database.force_rollback():
+        async with database:
+            yield
+
+
+@pytest.fixture
+def count_queries(record_queries):
+    return record_queries(database)
+
+
+async def create_users(total: int):
+    for number in range(total):
+        user = await User.query.create(name=f"User {number}")
+        for comment in range(number):
+            await Post.query.create(user=user, comment=f"Comment {comment}")
+
+
+async def test_one_query_per_prefetch(count_queries):
+    await create_users(5)
+    count_queries.clear()
+
+    users = await User.query.prefetch_related(
+        Prefetch(related_name="posts", to_attr="to_posts"),
+    ).order_by("id")
+
+    assert len(count_queries) == 2
+    assert [len(user.to_posts) for user in users] == [0, 1, 2, 3, 4]
+    assert all(post.user.pk == user.pk for user in users for post in user.to_posts)
+
+
+async def test_prefetch_in_chunks(count_queries, monkeypatch):
+    monkeypatch.setitem(settings.max_bind_params, database.url.dialect, 2)
+    await create_users(5)
+    count_queries.clear()
+
+    users = await User.query.prefetch_related(
+        Prefetch(related_name="posts", to_attr="to_posts"),
+    ).order_by("id")
+
+    assert len(count_queries) == 4
+    assert [len(user.to_posts) for user in users] == [0, 1, 2, 3, 4]
+
+
+async def test_prefetch_with_queryset(count_queries):
+    await create_users(3)
+    count_queries.clear()
+
+    users = await User.query.prefetch_related(
+        Prefetch(
+            related_name="posts",
+            to_attr="to_posts",
+            queryset=Post.query.filter(comment="Comment 0"),
+        ),
+    ).order_by("id")
+
+    assert len(count_queries) == 2
+    assert [len(user.to_posts) for user in users] == [0, 1, 1]
+
+
+async def test_prefetch_no_results(count_queries):
+    users = await User.query.prefetch_related(
+        Prefetch(related_name="posts", to_attr="to_posts"),
+    )
+
+    assert users == []
+    assert len(count_queries) == 1
+
+
+async def test_prefetch_with_limit_per_model(count_queries):
+    await create_users(4)
+    count_queries.clear()
+
+    users = await User.query.prefetch_related(
+        Prefetch(
+            related_name="posts",
+            to_attr="to_posts",
+            queryset=Post.query.order_by("id").limit(2),
+        ),
+    ).order_by("id")
+
+    assert len(count_queries) == 5
+    assert [len(user.to_posts) for user in users] == [0, 1, 2, 2]
+    assert [post.comment for post in users[3].to_posts] == ["Comment 0", "Comment 1"]
@@ -0,0 +1,88 @@
+import pytest
+
+import saffier
+from saffier.core.db.caches import TableCache
+from saffier.testclient import DatabaseTestClient as Database
+from tests.settings import DATABASE_URL
+
+database = Database(url=DATABASE_URL)
+models = saffier.Registry(database=database)
+
+pytestmark = pytest.mark.anyio
+
+
+class User(saffier.Model):
+    id = saffier.IntegerField(primary_key=True)
+    name = saffier.CharField(max_length=100)
+
+    class Meta:
+        registry = models
+
+
+@pytest.fixture(autouse=True)
+def clear_table_cache():
+    models.table_cache.clear()
+    yield
+
+
+def test_chaining_queryset_reuses_table():
+    User.query.filter(name="Saffier").order_by("name").limit(1).offset(1)
+    info = models.table_cache.info()
+
+    assert info.misses == 1
+    assert info.hits > 1
+    assert info.currsize == 1
+
+    User.query.filter(name="Saffier").order_by("name").limit(1)
+
+    assert models.table_cache.info().misses == 1
+
+
+def test_table_per_schema():
+    table = User.table_schema("saffier")
+    other_table = User.table_schema("another")
+
+    assert table is not other_table
+    assert table.schema == "saffier"
+    assert other_table.schema == "another"
+    assert User.table_schema("saffier") is table
+
+    info = models.table_cache.info()
+    assert info.misses == 2
+    assert info.hits == 1
+
+
+def test_invalidates_on_model_definition_change():
+    table = User.table_schema(None)
+    assert User.table_schema(None) is table
+
+    User.meta.tablename = "other_users"
+    try:
+        other = User.table_schema(None)
+        assert other.name == "other_users"
+    finally:
+        User.meta.tablename = "users"
+
+    assert User.table_schema(None).name == "users"
+    assert models.table_cache.info().misses == 3
+
+
+def test_invalidate_model():
+    User.table_schema(None)
+    User.table_schema("saffier")
+    assert len(models.table_cache) == 2
+
+    models.table_cache.invalidate(User)
+
+    assert len(models.table_cache) == 0
+
+
+def test_cache_is_bounded():
+    cache = TableCache(maxsize=1)
+
+    cache.get_table(User, "saffier")
+    cache.get_table(User, "another")
+
+    assert len(cache) == 1
+    assert (User, "another") in cache
+    assert (User, "saffier") not in cache
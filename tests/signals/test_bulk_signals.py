@@ -0,0 +1,120 @@
+import pytest
+
+import saffier
+from saffier.core.signals import Signal, post_bulk_create, post_bulk_update, pre_bulk_create
+from saffier.core.signals import signal as signal_module
+from saffier.testclient import DatabaseTestClient as Database
+from tests.settings import DATABASE_URL
+
+database = Database(url=DATABASE_URL)
+models = saffier.Registry(database=database)
+
+pytestmark = pytest.mark.anyio
+
+
+class User(saffier.Model):
+    id = saffier.IntegerField(primary_key=True)
+    name = saffier.CharField(max_length=100)
+
+    class Meta:
+        registry = models
+
+
+@pytest.fixture(autouse=True, scope="function")
+async def create_test_database():
+    await models.create_all()
+    yield
+    await models.drop_all()
+
+
+@pytest.fixture(autouse=True)
+async def rollback_connections():
+    with database.force_rollback():
+        async with database:
+            yield
+
+
+@pytest.fixture()
+def gathered(monkeypatch):
+    calls = []
+    gather = signal_module.asyncio.gather
+
+    async def recorded_gather(*aws, **kwargs):
+        calls.append(len(aws))
+        return await gather(*aws, **kwargs)
+
+    monkeypatch.setattr(signal_module.asyncio, "gather", recorded_gather)
+    return calls
+
+
+async def test_bulk_create_signals():
+    received = []
+
+    @pre_bulk_create(User)
+    async def before(sender, values, **kwargs):
+        received.append(("pre", sender, [value["name"] for value in values]))
+
+    @post_bulk_create(User)
+    async def after(sender, values, instances, **kwargs):
+        received.append(("post", sender, len(values), [user.name for user in instances]))
+
+    try:
+        await User.query.bulk_create(
+            [{"id": 1, "name": "Alice"}, {"id": 2, "name": "Bob"}], batch_size=1, returning=True
+        )
+    finally:
+        User.signals.pre_bulk_create.disconnect(before)
+        User.signals.post_bulk_create.disconnect(after)
+
+    assert received == [("pre", User, ["Alice", "Bob"]), ("post", User, 2, ["Alice", "Bob"])]
+
+
+async def test_bulk_update_signal():
+    await User.query.bulk_create([{"id": 1, "name": "Alice"}, {"id": 2, "name": "Bob"}])
+    users = await User.query.order_by("id")
+    received = []
+
+    @post_bulk_update(User)
+    async def after(sender, instances, fields, **kwargs):
+        received.append((sender, [user.pk for user in instances], fields))
+
+    for user in users:
+        user.name = user.name.upper()
+
+    try:
+        await User.query.bulk_update(users, fields=["name"])
+    finally:
+        User.signals.post_bulk_update.disconnect(after)
+
+    assert received == [(User, [1, 2], ["name"])]
+
+
+async def test_no_receivers_are_skipped(gathered):
+    user = await User.query.create(id=1, name="Alice")
+    await user.update(name="Alicia")
+    await User.query.filter(id=1).update(name="Alice")
+    await User.query.bulk_create([{"id": 2, "name": "Bob"}])
+    await user.delete()
+
+    assert gathered == []
+
+
+async def test_send():
+    received = []
+
+    async def first(sender, **kwargs):
+        received.append("first")
+
+    async def second(sender, **kwargs):
+        received.append("second")
+
+    signal = Signal()
+    await signal.send(sender=User)
+
+    signal.connect(first)
+    await signal.send(sender=User)
+    assert received == ["first"]
+
+    signal.connect(second)
+    await signal.send(sender=User)
+    assert sorted(received) == ["first", "first", "second"]
@@ -0,0 +1,71 @@
+import pytest
+
+from saffier import fields
+from saffier.contrib.multi_tenancy import TenantModel, TenantRegistry
+from saffier.contrib.multi_tenancy.models import TenantMixin
+from saffier.testclient import DatabaseTestClient as Database
+from tests.settings import DATABASE_URL
+
+database = Database(url=DATABASE_URL)
+models = TenantRegistry(database=database)
+
+
+pytestmark = pytest.mark.anyio
+
+
+class Tenant(TenantMixin):
+    class Meta:
+        registry = models
+
+
+class User(TenantModel):
+    name = fields.CharField(max_length=255)
+
+    class Meta:
+        registry = models
+        is_tenant = True
+
+
+class Product(TenantModel):
+    name = fields.CharField(max_length=255)
+    user = fields.ForeignKey(User, null=True, related_name="products")
+
+    class Meta:
+        registry = models
+        is_tenant = True
+
+
+@pytest.fixture(autouse=True, scope="function")
+async def create_test_database():
+    await models.create_all()
+    yield
+    await models.drop_all()
+
+
+@pytest.fixture(autouse=True)
+async def rollback_connections():
+    with database.force_rollback():
+        async with database:
+            yield
+
+
+async def test_paginate_using_schema():
+    tenant = await Tenant.query.create(schema_name="saffier", tenant_name="saffier")
+
+    user = await User.query.using(tenant.schema_name).create(name="user")
+    for index in range(5):
+        await Product.query.using(tenant.schema_name).create(name=f"product-{index}", user=user)
+
+    queryset = Product.query.using(tenant.schema_name).select_related("user")
+    page = await queryset.paginate_after(page_size=3)
+
+    assert [product.name for product in page] == ["product-0", "product-1", "product-2"]
+    assert page.results[0].table.schema == tenant.schema_name
+    assert page.results[0].user.name == "user"
+
+    page = await queryset.paginate_after(page.next_cursor, page_size=3)
+    assert [product.name for product in page] == ["product-3", "product-4"]
+    assert not page.has_next
+
+    products = await Product.query.paginate_after()
+    assert len(products) == 0